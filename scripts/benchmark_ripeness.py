@@ -0,0 +1,108 @@
+"""
+Olgunluk sınıflandırma microbenchmark'ı: kutu başına `classify_ripeness` ile
+toplam-alan tablolu (integral image) `classify_ripeness_batch` karşılaştırması.
+
+Her kutu sayısı için aynı rastgele frame ve kutular iki yöntemle de
+sınıflandırılır; sonuçların birebir aynı olduğu doğrulanır ve frame başına
+süre (medyan) ile hızlanma oranı raporlanır. LUT tabanlı hue/doygunluk
+histogram sınıflandırıcısının (`HistogramClassifier`) frame başına süresi de
+aynı kutularla ölçülür.
+
+Usage:
+    python scripts/benchmark_ripeness.py
+    python scripts/benchmark_ripeness.py --boxes 10 100 1000 --width 1920 --height 1080 --repeat 20
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from strawberry_vision.domain.batch import RIPENESS_CODES  # noqa: E402
+from strawberry_vision.infrastructure.color_classifier import HistogramClassifier  # noqa: E402
+from strawberry_vision.infrastructure.detectors import classify_ripeness, classify_ripeness_batch  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def random_boxes(rng: np.random.Generator, count: int, width: int, height: int) -> np.ndarray:
+    """Frame içinde (ve kenarlardan taşan) 16-160 piksellik xywh kutular."""
+    sizes = rng.integers(16, 160, (count, 2))
+    origins = rng.integers(-20, [width, height], (count, 2))
+    return np.concatenate([origins, sizes], axis=1)
+
+
+def per_box(frame: np.ndarray, bboxes: np.ndarray) -> np.ndarray:
+    return np.array([RIPENESS_CODES[classify_ripeness(frame, bbox)] for bbox in bboxes.tolist()], dtype=np.int8)
+
+
+def median_ms(fn: Callable[[], object], repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return statistics.median(times) * 1000.0
+
+
+def run(counts: List[int], width: int, height: int, repeat: int, seed: int) -> List[Dict[str, float]]:
+    rng = np.random.default_rng(seed)
+    frame = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+    histogram = HistogramClassifier()
+    rows = []
+    for count in counts:
+        bboxes = random_boxes(rng, count, width, height)
+        if not np.array_equal(per_box(frame, bboxes), classify_ripeness_batch(frame, bboxes)):
+            raise AssertionError(f"Batched classifier differs from classify_ripeness ({count} boxes)")
+        loop_ms = median_ms(lambda: per_box(frame, bboxes), repeat)
+        batch_ms = median_ms(lambda: classify_ripeness_batch(frame, bboxes), repeat)
+        histogram_ms = median_ms(lambda: histogram.classify_batch(frame, bboxes), repeat)
+        rows.append({
+            'boxes': count,
+            'per_box_ms': round(loop_ms, 3),
+            'batched_ms': round(batch_ms, 3),
+            'speedup': round(loop_ms / batch_ms, 2) if batch_ms > 0 else 0.0,
+            'histogram_ms': round(histogram_ms, 3),
+        })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Olgunluk sınıflandırma microbenchmark'ı")
+    parser.add_argument("--boxes", type=int, nargs="+", default=[10, 30, 100, 300, 1000], help="Frame başına kutu sayıları")
+    parser.add_argument("--width", type=int, default=1280, help="Frame genişliği")
+    parser.add_argument("--height", type=int, default=720, help="Frame yüksekliği")
+    parser.add_argument("--repeat", type=int, default=10, help="Her ölçümün tekrar sayısı")
+    parser.add_argument("--seed", type=int, default=0, help="Rastgele frame/kutu seed'i")
+    parser.add_argument("--report", type=str, default=None, help="Raporu JSON olarak kaydet")
+    args = parser.parse_args()
+
+    rows = run(args.boxes, args.width, args.height, args.repeat, args.seed)
+
+    logger.info("\n" + "=" * 60)
+    logger.info(f"Olgunluk sınıflandırma ({args.width}x{args.height}, medyan, {args.repeat} tekrar)")
+    logger.info("=" * 60)
+    logger.info(f"{'Kutu':>6}{'Kutu başına (ms)':>20}{'Batch (ms)':>14}{'Hızlanma':>12}{'Histogram (ms)':>18}")
+    for row in rows:
+        logger.info(
+            f"{row['boxes']:>6}{row['per_box_ms']:>20}{row['batched_ms']:>14}{row['speedup']:>11}x{row['histogram_ms']:>18}"
+        )
+    logger.info("=" * 60 + "\n")
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(rows, indent=2), encoding='utf-8')
+        logger.info(f"Rapor kaydedildi: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,134 @@
+"""
+Başlangıç süresi benchmark'ı: import süresi, `--help` süresi ve ilk tespite kadar geçen süre.
+
+Her ölçüm soğuk başlangıcı yansıtması için ayrı bir Python process'inde yapılır
+ve `--repeat` tekrarın medyanı raporlanır. Import sonrası yüklenmiş ağır modüller
+(cv2, ultralytics, yaml, onnxruntime, torch) de listelenir; bunların import sırasında
+yüklenmesi lazy import'larda bir gerileme demektir.
+
+Usage:
+    python scripts/benchmark_startup.py
+    python scripts/benchmark_startup.py --model runs/train/yolo26/weights/best.pt --image sample.jpg --repeat 5
+    python scripts/benchmark_startup.py --model best.onnx --backend onnx --report startup.json
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List
+
+ROOT = Path(__file__).resolve().parents[1]
+HEAVY_MODULES = ('cv2', 'ultralytics', 'yaml', 'onnxruntime', 'torch')
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+IMPORT_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import strawberry_vision.application.pipeline
+elapsed = time.perf_counter() - t0
+print(json.dumps({"import_s": elapsed, "heavy": [m for m in %r if m in sys.modules]}))
+""" % (HEAVY_MODULES,)
+
+FIRST_DETECTION_PROBE = """
+import json, sys, time
+t0 = time.perf_counter()
+import numpy as np
+from strawberry_vision.infrastructure.detectors import YOLODetector
+t_import = time.perf_counter()
+detector = YOLODetector(model_path=sys.argv[1] or None, backend=sys.argv[2])
+t_construct = time.perf_counter()
+frame = None
+if sys.argv[3]:
+    import cv2
+    frame = cv2.imread(sys.argv[3])
+if frame is None:
+    frame = np.random.default_rng(0).integers(0, 255, (720, 1280, 3), dtype=np.uint8)
+t_frame = time.perf_counter()
+detector.detect(frame)
+t_first = time.perf_counter()
+detector.detect(frame)
+t_second = time.perf_counter()
+print(json.dumps({
+    "import_s": t_import - t0,
+    "construct_s": t_construct - t_import,
+    "first_detect_s": t_first - t_frame,
+    "second_detect_s": t_second - t_first,
+    "time_to_first_detection_s": (t_import - t0) + (t_construct - t_import) + (t_first - t_frame),
+}))
+"""
+
+
+def run_probe(code: str, *args: str) -> Dict[str, float]:
+    """Kodu yeni bir interpreter'da çalıştırır ve son satırdaki JSON'u döndürür."""
+    out = subprocess.run(
+        [sys.executable, '-c', code, *args],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def time_help() -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-m', 'strawberry_vision.main', '--help'], cwd=ROOT, capture_output=True, check=True)
+    return time.perf_counter() - start
+
+
+def median_ms(rows: List[Dict[str, float]], key: str) -> float:
+    return round(statistics.median(row[key] for row in rows) * 1000.0, 1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import ve ilk tespit süresi benchmark'ı")
+    parser.add_argument("--model", type=str, default="", help="Model dosyası (verilmezse dummy detector)")
+    parser.add_argument("--backend", type=str, default="ultralytics", help="Inference backend'i")
+    parser.add_argument("--image", type=str, default="", help="İlk tespit için görüntü (verilmezse rastgele 1280x720)")
+    parser.add_argument("--repeat", type=int, default=3, help="Her ölçümün tekrar sayısı")
+    parser.add_argument("--report", type=str, default=None, help="Raporu JSON olarak kaydet")
+    args = parser.parse_args()
+
+    try:
+        imports = [run_probe(IMPORT_PROBE) for _ in range(args.repeat)]
+        helps = [{'help_s': time_help()} for _ in range(args.repeat)]
+        firsts = [run_probe(FIRST_DETECTION_PROBE, args.model, args.backend, args.image) for _ in range(args.repeat)]
+    except subprocess.CalledProcessError as e:
+        logger.error(f"Ölçüm process'i başarısız oldu:\n{e.stderr}")
+        return 1
+
+    report = {
+        'import_pipeline_ms': median_ms(imports, 'import_s'),
+        'heavy_modules_after_import': imports[-1]['heavy'],
+        'cli_help_ms': median_ms(helps, 'help_s'),
+        'detector_import_ms': median_ms(firsts, 'import_s'),
+        'detector_construct_ms': median_ms(firsts, 'construct_s'),
+        'first_detect_ms': median_ms(firsts, 'first_detect_s'),
+        'second_detect_ms': median_ms(firsts, 'second_detect_s'),
+        'time_to_first_detection_ms': median_ms(firsts, 'time_to_first_detection_s'),
+    }
+
+    logger.info("\n" + "=" * 60)
+    logger.info(f"Başlangıç süreleri (medyan, {args.repeat} tekrar)")
+    logger.info("=" * 60)
+    for key, value in report.items():
+        logger.info(f"{key:<30}{value}")
+    if report['heavy_modules_after_import']:
+        logger.warning(f"Import sırasında ağır modüller yüklendi: {report['heavy_modules_after_import']}")
+    logger.info("=" * 60 + "\n")
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        logger.info(f"Rapor kaydedildi: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,175 @@
+"""
+Karolu (tiled) ve tüm-frame inference'ı doğruluk ve gecikme açısından karşılaştıran script.
+
+Her görüntü hem tüm frame olarak hem de karolara bölünerek işlenir. Tahminler
+YOLO formatındaki etiketlerle (images/ → labels/, .txt) IoU eşiğinde sınıf bazlı
+eşleştirilir; precision / recall / F1 ve gecikme (p50 / p95 / ortalama) raporlanır.
+
+Usage:
+    python scripts/benchmark_tiling.py --model runs/train/yolo26/weights/best.pt --data configs/silkworm_data.yaml
+    python scripts/benchmark_tiling.py --model best.onnx --backend onnx --images trays_4k/ --tile-size 640 --overlap 0.25
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from scripts.quantize_model import resolve_split_dir, sample_images  # noqa: E402
+from strawberry_vision.infrastructure.box_ops import box_iou  # noqa: E402
+from strawberry_vision.infrastructure.detectors import BACKENDS, YOLODetector  # noqa: E402
+from strawberry_vision.infrastructure.tiling import TiledDetector  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def label_path_for(image_path: Path) -> Path:
+    """images/.../x.jpg → labels/.../x.txt (YOLO dataset düzeni)."""
+    parts = list(image_path.parts)
+    for i in range(len(parts) - 1, -1, -1):
+        if parts[i] == 'images':
+            parts[i] = 'labels'
+            break
+    return Path(*parts).with_suffix('.txt')
+
+
+def read_ground_truth(image_path: Path, frame_hw: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """YOLO etiketlerini frame koordinatlarında (xyxy, sınıf id) olarak okur."""
+    path = label_path_for(image_path)
+    if not path.exists():
+        return np.empty((0, 4), dtype=np.float32), np.empty(0, dtype=np.int64)
+    rows = np.loadtxt(path, ndmin=2, dtype=np.float32)
+    if rows.size == 0:
+        return np.empty((0, 4), dtype=np.float32), np.empty(0, dtype=np.int64)
+    h, w = frame_hw
+    cx, cy, bw, bh = rows[:, 1] * w, rows[:, 2] * h, rows[:, 3] * w, rows[:, 4] * h
+    boxes = np.stack([cx - bw / 2, cy - bh / 2, cx + bw / 2, cy + bh / 2], axis=1)
+    return boxes, rows[:, 0].astype(np.int64)
+
+
+def match(pred: Tuple[np.ndarray, np.ndarray, np.ndarray], gt: Tuple[np.ndarray, np.ndarray], iou_threshold: float) -> Tuple[int, int, int]:
+    """Skor sırasıyla greedy, sınıf bazlı eşleştirme; (TP, FP, FN) döndürür."""
+    boxes, scores, class_ids = pred
+    gt_boxes, gt_ids = gt
+    if len(boxes) == 0 or len(gt_boxes) == 0:
+        return 0, len(boxes), len(gt_boxes)
+    ious = box_iou(boxes, gt_boxes)
+    ious[class_ids[:, None] != gt_ids[None, :]] = 0.0
+    matched = np.zeros(len(gt_boxes), dtype=bool)
+    tp = 0
+    for i in np.argsort(-scores, kind='stable'):
+        candidates = np.where(matched, 0.0, ious[i])
+        j = int(candidates.argmax())
+        if candidates[j] >= iou_threshold:
+            matched[j] = True
+            tp += 1
+    return tp, len(boxes) - tp, len(gt_boxes) - tp
+
+
+def summarize(timings: List[float], tp: int, fp: int, fn: int) -> Dict[str, float]:
+    timings = sorted(timings)
+    precision = tp / (tp + fp) if tp + fp else 0.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return {
+        'p50_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(timings[min(len(timings) - 1, int(0.95 * len(timings)))], 2),
+        'mean_ms': round(statistics.fmean(timings), 2),
+        'precision': round(precision, 4),
+        'recall': round(recall, 4),
+        'f1': round(f1, 4),
+        'detections': tp + fp,
+    }
+
+
+def run(detectors: Dict[str, object], images: List[Path], iou_threshold: float, warmup: int = 2) -> Dict[str, Dict[str, float]]:
+    import cv2
+
+    frames = [(p, f) for p, f in ((p, cv2.imread(str(p))) for p in images) if f is not None]
+    if not frames:
+        return {}
+    report: Dict[str, Dict[str, float]] = {}
+    for name, detector in detectors.items():
+        for _, frame in frames[:warmup]:
+            detector.detect_arrays(frame)
+        timings: List[float] = []
+        tp = fp = fn = 0
+        for path, frame in frames:
+            start = time.perf_counter()
+            pred = detector.detect_arrays(frame)
+            timings.append((time.perf_counter() - start) * 1000.0)
+            t, f, n = match(pred, read_ground_truth(path, frame.shape[:2]), iou_threshold)
+            tp, fp, fn = tp + t, fp + f, fn + n
+        report[name] = summarize(timings, tp, fp, fn)
+    return report
+
+
+def print_report(report: Dict[str, Dict[str, float]]) -> None:
+    keys = list(next(iter(report.values())).keys())
+    logger.info("\n" + "=" * 60)
+    logger.info("Tüm frame vs karolu inference")
+    logger.info("=" * 60)
+    logger.info(f"{'metrik':<12}" + "".join(f"{name:>14}" for name in report))
+    for key in keys:
+        logger.info(f"{key:<12}" + "".join(f"{str(row.get(key, 'N/A')):>14}" for row in report.values()))
+    full, tiled = report.get('full', {}), report.get('tiled', {})
+    if full.get('p50_ms') and tiled.get('p50_ms'):
+        logger.info(f"Gecikme oranı (p50, tiled/full): {tiled['p50_ms'] / full['p50_ms']:.2f}x")
+    if 'recall' in full and 'recall' in tiled:
+        logger.info(f"Recall farkı: {tiled['recall'] - full['recall']:+.4f}")
+    logger.info("=" * 60 + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Karolu ve tüm-frame inference karşılaştırması")
+    parser.add_argument("--model", type=str, required=True, help="Model dosyası (.pt veya .onnx)")
+    parser.add_argument("--backend", type=str, default="ultralytics", choices=BACKENDS, help="Inference backend'i")
+    parser.add_argument("--images", type=str, default=None, help="Görüntü klasörü (verilmezse --data/--split kullanılır)")
+    parser.add_argument("--data", type=str, default="configs/silkworm_data.yaml", help="Dataset YAML dosyası")
+    parser.add_argument("--split", type=str, default="val", help="Kullanılacak split")
+    parser.add_argument("--limit", type=int, default=50, help="Kullanılacak görüntü sayısı")
+    parser.add_argument("--tile-size", type=int, default=640, help="Karo kenar uzunluğu")
+    parser.add_argument("--overlap", type=float, default=0.2, help="Karolar arası örtüşme oranı")
+    parser.add_argument("--tile-batch", type=int, default=8, help="Tek predict çağrısındaki karo sayısı")
+    parser.add_argument("--iou", type=float, default=0.5, help="Doğru tespit için IoU eşiği")
+    parser.add_argument("--report", type=str, default=None, help="Raporu JSON olarak kaydet")
+    parser.add_argument("--seed", type=int, default=0, help="Örnekleme seed'i")
+    args = parser.parse_args()
+
+    folder = Path(args.images) if args.images else resolve_split_dir(args.data, args.split)
+    if folder is None or not folder.is_dir():
+        logger.error("Görüntü klasörü bulunamadı; --images veya --data ile belirtin")
+        return 1
+    images = sample_images(folder, args.limit, seed=args.seed)
+    if not images:
+        logger.error(f"Klasörde görüntü yok: {folder}")
+        return 1
+
+    detector = YOLODetector(model_path=args.model, backend=args.backend)
+    if detector.model is None:
+        logger.error(f"Model yüklenemedi: {args.model}")
+        return 1
+    tiled = TiledDetector(detector, tile_size=args.tile_size, overlap=args.overlap, batch_size=args.tile_batch)
+
+    report = run({'full': detector, 'tiled': tiled}, images, args.iou)
+    if not report:
+        logger.error("Görüntüler okunamadı")
+        return 1
+    print_report(report)
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        logger.info(f"Rapor kaydedildi: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
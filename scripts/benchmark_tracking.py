@@ -0,0 +1,136 @@
+"""
+IoU tracker benchmark'ı: frame başına yüzlerce nesnede `TrackingService.update` süresi.
+
+Sentetik sahnede nesneler tepsi ızgarasına dağılır ve her frame'de rastgele
+kayar; tespitlerin bir kısmı kaçırılır (dropout), sıraları karıştırılır.
+Frame başına güncelleme süresi (p50 / p95 / max) ve kimlik tutarlılığı
+(bir önceki frame'de görülen nesnenin aynı ID'yi koruma oranı) raporlanır.
+`--motion kalman --detect-every N` ile tespit yalnızca her N frame'de bir
+yapılır, aradaki frame'lerde `predict()` süresi ölçülür.
+p95 süre `--budget-ms` bütçesini aşarsa çıkış kodu 1'dir.
+
+Usage:
+    python scripts/benchmark_tracking.py
+    python scripts/benchmark_tracking.py --objects 500 --frames 300 --matcher hungarian --budget-ms 10
+    python scripts/benchmark_tracking.py --motion kalman --detect-every 3
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from strawberry_vision.domain.services import MOTION_MODELS, TrackingService  # noqa: E402
+from strawberry_vision.domain.tracking import MATCHERS  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def run(
+    objects: int,
+    frames: int,
+    matcher: str,
+    dropout: float,
+    box_size: int,
+    seed: int,
+    motion: str = "none",
+    detect_every: int = 1,
+) -> Dict[str, float]:
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil(np.sqrt(objects)))
+    spacing = box_size * 2
+    positions = (np.stack(np.meshgrid(np.arange(side), np.arange(side)), axis=-1).reshape(-1, 2)[:objects] * spacing).astype(np.float64)
+    sizes = np.full((objects, 2), box_size)
+    velocity = rng.normal(0.0, box_size * 0.05, positions.shape)
+    tracker = TrackingService(matcher=matcher, motion=motion)
+
+    times, predict_times = [], []
+    kept = compared = 0
+    last_ids = np.full(objects, -1, dtype=np.int64)
+    for frame in range(frames):
+        positions += velocity + rng.normal(0.0, box_size * 0.02, positions.shape)
+        if frame % detect_every:
+            start = time.perf_counter()
+            tracker.predict()
+            predict_times.append(time.perf_counter() - start)
+            continue
+        visible = np.flatnonzero(rng.random(objects) >= dropout)
+        order = rng.permutation(visible)
+        bboxes = np.concatenate([positions[order].astype(np.int64), sizes[order]], axis=1)
+
+        start = time.perf_counter()
+        ids = tracker.update(bboxes)
+        times.append(time.perf_counter() - start)
+
+        previous = last_ids[order]
+        seen = previous >= 0
+        kept += int((ids[seen] == previous[seen]).sum())
+        compared += int(seen.sum())
+        last_ids[order] = ids
+
+    ms = np.array(times) * 1000.0
+    return {
+        'objects': objects,
+        'frames': frames,
+        'matcher': matcher,
+        'motion': motion,
+        'detect_every': detect_every,
+        'p50_ms': round(float(np.percentile(ms, 50)), 3),
+        'p95_ms': round(float(np.percentile(ms, 95)), 3),
+        'max_ms': round(float(ms.max()), 3),
+        'id_consistency': round(kept / compared, 4) if compared else 1.0,
+        'total_tracked': tracker.total_tracked,
+        'predict_p95_ms': round(float(np.percentile(predict_times, 95)) * 1000.0, 3) if predict_times else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="IoU tracker benchmark'ı")
+    parser.add_argument("--objects", type=int, default=500, help="Frame başına nesne sayısı")
+    parser.add_argument("--frames", type=int, default=300, help="Frame sayısı")
+    parser.add_argument("--matcher", type=str, default="greedy", choices=MATCHERS, help="Eşleştirme yöntemi")
+    parser.add_argument("--motion", type=str, default="none", choices=MOTION_MODELS, help="Track hareket modeli")
+    parser.add_argument("--detect-every", type=int, default=1, help="Tespit her N frame'de bir (aradakiler tahmin)")
+    parser.add_argument("--dropout", type=float, default=0.05, help="Frame başına kaçırılan tespit oranı")
+    parser.add_argument("--box-size", type=int, default=40, help="Kutu kenar uzunluğu (piksel)")
+    parser.add_argument("--budget-ms", type=float, default=10.0, help="Frame başına p95 süre bütçesi")
+    parser.add_argument("--seed", type=int, default=0, help="Sahne seed'i")
+    parser.add_argument("--report", type=str, default=None, help="Raporu JSON olarak kaydet")
+    args = parser.parse_args()
+
+    report = run(
+        args.objects,
+        args.frames,
+        args.matcher,
+        args.dropout,
+        args.box_size,
+        args.seed,
+        motion=args.motion,
+        detect_every=max(1, args.detect_every),
+    )
+
+    logger.info("\n" + "=" * 60)
+    logger.info(f"IoU tracker ({args.objects} nesne, {args.frames} frame, {args.matcher}, {args.motion})")
+    logger.info("=" * 60)
+    for key, value in report.items():
+        logger.info(f"{key:<20}{value}")
+    ok = report['p95_ms'] <= args.budget_ms
+    logger.info(f"{'budget_ms':<20}{args.budget_ms} ({'OK' if ok else 'AŞILDI'})")
+    logger.info("=" * 60 + "\n")
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        logger.info(f"Rapor kaydedildi: {args.report}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,259 @@
+"""
+Eğitilmiş YOLO modelini statik INT8 ONNX modeline çeviren ve FP32 ile karşılaştıran script.
+
+Adımlar:
+    1) best.pt → FP32 ONNX export (ultralytics)
+    2) Dataset'ten örneklenen görüntülerle kalibrasyon (detector ile aynı letterbox ön işleme)
+    3) onnxruntime ile statik INT8 (QDQ) quantization → best.int8.onnx
+    4) FP32 ve INT8 için gecikme (CPU) ve mAP değerlerinin yan yana raporu
+
+Çıkan model detector'de `backend="onnx-int8"` ile kullanılır:
+    python -m strawberry_vision.main --video tray.mp4 --model runs/train/yolo26/weights/best.pt --backend onnx-int8
+
+Usage:
+    python scripts/quantize_model.py --model runs/train/yolo26/weights/best.pt --data configs/silkworm_data.yaml
+    python scripts/quantize_model.py --model best.pt --calib-size 300 --skip-map
+"""
+
+import argparse
+import json
+import logging
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from strawberry_vision.infrastructure.detectors import YOLODetector, int8_model_path  # noqa: E402
+from strawberry_vision.infrastructure.sources import IMAGE_EXTENSIONS  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def resolve_split_dir(data_yaml: str, split: str) -> Optional[Path]:
+    """data.yaml içindeki split (train/val/test) görüntü klasörünü bulur."""
+    try:
+        with open(data_yaml, 'r', encoding='utf-8') as f:
+            cfg = yaml.safe_load(f) or {}
+    except Exception as e:
+        logger.error(f"data.yaml okunamadı: {e}")
+        return None
+
+    rel = cfg.get(split)
+    if not rel:
+        return None
+    root = Path(cfg.get('path') or '.')
+    candidates = [Path(rel), root / rel, Path(data_yaml).parent / rel, Path(data_yaml).parent / root.name / rel]
+    for candidate in candidates:
+        if candidate.is_dir():
+            return candidate
+    logger.warning(f"{split} klasörü bulunamadı: {rel}")
+    return None
+
+
+def sample_images(folder: Path, count: int, seed: int = 0) -> List[Path]:
+    """Klasörden tekrarsız rastgele görüntü örnekler."""
+    paths = sorted(p for p in folder.rglob('*') if p.suffix.lower() in IMAGE_EXTENSIONS)
+    random.Random(seed).shuffle(paths)
+    return paths[:count]
+
+
+def export_fp32(model_path: str, imgsz: int) -> Optional[str]:
+    """best.pt → FP32 ONNX."""
+    if model_path.endswith('.onnx'):
+        return model_path
+    try:
+        from ultralytics import YOLO
+    except ImportError:
+        logger.error("Ultralytics yüklü değil. 'pip install ultralytics' ile yükleyin.")
+        return None
+    try:
+        logger.info(f"ONNX export: {model_path} (imgsz={imgsz})")
+        return str(YOLO(model_path).export(format='onnx', imgsz=imgsz, simplify=True))
+    except Exception as e:
+        logger.error(f"Export hatası: {e}")
+        return None
+
+
+def quantize_int8(fp32_path: str, int8_path: str, calib_images: List[Path], per_channel: bool = True) -> bool:
+    """Statik INT8 (QDQ) quantization uygular.
+
+    Kalibrasyon girdileri OnnxBackend.letterbox ile hazırlanır; böylece
+    kalibrasyon ve inference aynı ön işlemeyi görür.
+    """
+    try:
+        import cv2
+        from onnxruntime.quantization import (
+            CalibrationDataReader,
+            CalibrationMethod,
+            QuantFormat,
+            QuantType,
+            quantize_static,
+        )
+        from strawberry_vision.infrastructure.onnx_backend import OnnxBackend
+    except ImportError as e:
+        logger.error(f"Gerekli paket yüklü değil ({e}). 'pip install onnxruntime opencv-python' ile yükleyin.")
+        return False
+
+    backend = OnnxBackend(fp32_path)
+
+    class _Reader(CalibrationDataReader):
+        def __init__(self) -> None:
+            self._paths = iter(calib_images)
+
+        def get_next(self) -> Optional[Dict[str, Any]]:
+            for path in self._paths:
+                frame = cv2.imread(str(path))
+                if frame is None:
+                    continue
+                backend.letterbox(frame)
+                return {backend.input_name: backend._input.copy()}
+            return None
+
+    # Shape inference + graph sadeleştirme, quantize edilebilecek düğüm sayısını artırır
+    source_path = fp32_path
+    try:
+        from onnxruntime.quantization.shape_inference import quant_pre_process
+
+        prep_path = str(Path(int8_path).with_name(Path(int8_path).name.replace('.int8.onnx', '.prep.onnx')))
+        quant_pre_process(fp32_path, prep_path)
+        source_path = prep_path
+    except Exception as e:
+        logger.warning(f"Ön işleme atlandı: {e}")
+
+    try:
+        logger.info(f"INT8 quantization başlıyor ({len(calib_images)} kalibrasyon görüntüsü)")
+        quantize_static(
+            source_path,
+            int8_path,
+            _Reader(),
+            quant_format=QuantFormat.QDQ,
+            activation_type=QuantType.QUInt8,
+            weight_type=QuantType.QInt8,
+            per_channel=per_channel,
+            calibrate_method=CalibrationMethod.MinMax,
+        )
+        logger.info(f"INT8 model kaydedildi: {int8_path}")
+        return True
+    except Exception as e:
+        logger.error(f"Quantization hatası: {e}")
+        return False
+
+
+def measure_latency(model_path: str, images: List[Path], warmup: int = 3) -> Dict[str, float]:
+    """Detector'ün (onnx backend) CPU gecikmesini ölçer (ms)."""
+    import cv2
+
+    detector = YOLODetector(model_path=model_path, backend='onnx')
+    frames = [f for f in (cv2.imread(str(p)) for p in images) if f is not None]
+    if not frames or detector.model is None:
+        return {}
+    for frame in frames[:warmup]:
+        detector.detect(frame)
+    timings = []
+    for frame in frames:
+        start = time.perf_counter()
+        detector.detect(frame)
+        timings.append((time.perf_counter() - start) * 1000.0)
+    timings.sort()
+    return {
+        'p50_ms': round(statistics.median(timings), 2),
+        'p95_ms': round(timings[min(len(timings) - 1, int(0.95 * len(timings)))], 2),
+        'mean_ms': round(statistics.fmean(timings), 2),
+    }
+
+
+def measure_map(model_path: str, data_yaml: str, imgsz: int, split: str) -> Dict[str, float]:
+    """ultralytics val ile mAP ölçer (ONNX modeller CPU'da değerlendirilir)."""
+    try:
+        from ultralytics import YOLO
+    except ImportError:
+        logger.warning("Ultralytics yok; mAP ölçülemedi")
+        return {}
+    try:
+        results = YOLO(model_path, task='detect').val(data=data_yaml, imgsz=imgsz, batch=1, split=split, device='cpu', verbose=False)
+        return {
+            'mAP50': round(float(results.box.map50), 4),
+            'mAP50-95': round(float(results.box.map), 4),
+        }
+    except Exception as e:
+        logger.warning(f"mAP ölçüm hatası ({model_path}): {e}")
+        return {}
+
+
+def print_report(report: Dict[str, Dict[str, float]]) -> None:
+    keys = sorted({k for row in report.values() for k in row})
+    logger.info("\n" + "=" * 60)
+    logger.info("FP32 vs INT8")
+    logger.info("=" * 60)
+    logger.info(f"{'metrik':<12}" + "".join(f"{name:>14}" for name in report))
+    for key in keys:
+        logger.info(f"{key:<12}" + "".join(f"{str(row.get(key, 'N/A')):>14}" for row in report.values()))
+    fp32, int8 = report.get('fp32', {}), report.get('int8', {})
+    if fp32.get('p50_ms') and int8.get('p50_ms'):
+        logger.info(f"Hızlanma (p50): {fp32['p50_ms'] / int8['p50_ms']:.2f}x")
+    if 'mAP50-95' in fp32 and 'mAP50-95' in int8:
+        logger.info(f"mAP50-95 kaybı: {fp32['mAP50-95'] - int8['mAP50-95']:+.4f}")
+    logger.info("=" * 60 + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="YOLO modeli için statik INT8 quantization")
+    parser.add_argument("--model", type=str, required=True, help="Eğitilmiş model (.pt) veya FP32 .onnx")
+    parser.add_argument("--data", type=str, default="configs/silkworm_data.yaml", help="Dataset YAML dosyası")
+    parser.add_argument("--imgsz", type=int, default=640, help="Export görüntü boyutu")
+    parser.add_argument("--calib-size", type=int, default=200, help="Kalibrasyon görüntü sayısı")
+    parser.add_argument("--calib-split", type=str, default="train", help="Kalibrasyon için split")
+    parser.add_argument("--eval-split", type=str, default="val", choices=['val', 'test'], help="Değerlendirme split'i")
+    parser.add_argument("--bench-size", type=int, default=50, help="Gecikme ölçümü için görüntü sayısı")
+    parser.add_argument("--no-per-channel", action="store_true", help="Ağırlıkları kanal bazında değil tensör bazında quantize et")
+    parser.add_argument("--skip-map", action="store_true", help="mAP ölçümünü atla (yalnızca gecikme)")
+    parser.add_argument("--report", type=str, default=None, help="Raporu JSON olarak kaydet")
+    parser.add_argument("--seed", type=int, default=0, help="Örnekleme seed'i")
+    args = parser.parse_args()
+
+    if not Path(args.model).exists():
+        logger.error(f"Model bulunamadı: {args.model}")
+        return 1
+
+    calib_dir = resolve_split_dir(args.data, args.calib_split)
+    if calib_dir is None:
+        logger.error("Kalibrasyon görüntüleri bulunamadı; --data ile dataset YAML'ını kontrol edin")
+        return 1
+    calib_images = sample_images(calib_dir, args.calib_size, seed=args.seed)
+    if not calib_images:
+        logger.error(f"Kalibrasyon klasöründe görüntü yok: {calib_dir}")
+        return 1
+
+    fp32_path = export_fp32(args.model, args.imgsz)
+    if fp32_path is None:
+        return 1
+    int8_path = int8_model_path(args.model)
+    if not quantize_int8(fp32_path, int8_path, calib_images, per_channel=not args.no_per_channel):
+        return 1
+
+    eval_dir = resolve_split_dir(args.data, args.eval_split) or calib_dir
+    bench_images = sample_images(eval_dir, args.bench_size, seed=args.seed + 1)
+
+    report: Dict[str, Dict[str, float]] = {}
+    for name, path in (('fp32', fp32_path), ('int8', int8_path)):
+        row = measure_latency(path, bench_images)
+        if not args.skip_map:
+            row.update(measure_map(path, args.data, args.imgsz, args.eval_split))
+        report[name] = row
+
+    print_report(report)
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        logger.info(f"Rapor kaydedildi: {args.report}")
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,147 @@
+"""
+Tracker soak testi: 7/24 akışı taklit eden uzun sentetik sahnede bellek kullanımı.
+
+Sahnede aynı anda `--objects` nesne bulunur; her nesne rastgele bir süre
+yaşar, sonra yerine yeni bir nesne (yeni kimlik) gelir. Böylece milyonlarca
+frame boyunca sürekli track doğar ve biter. `--sample-every` frame'de bir
+sürecin yerleşik belleği (RSS) ve `TrackingService.memory_bytes` örneklenir.
+Tracker belleği değişirse veya ısınmadan sonraki ilk örneğe göre RSS artışı
+`--max-growth-kb` sınırını aşarsa çıkış kodu 1'dir. `--archive` verilirse
+biten track'ler diske (`TrackArchive`) aktarılır.
+
+Usage:
+    python scripts/soak_tracking.py
+    python scripts/soak_tracking.py --frames 1000000 --objects 40 --capacity 256 --archive runs/tracks.bin
+"""
+
+import argparse
+import json
+import logging
+import resource
+import sys
+import time
+from pathlib import Path
+from typing import Dict
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from strawberry_vision.domain.services import MOTION_MODELS, TrackingService  # noqa: E402
+from strawberry_vision.infrastructure.track_archive import TrackArchive  # noqa: E402
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+
+def rss_bytes() -> int:
+    """Sürecin yerleşik belleği (Linux'ta /proc, diğerlerinde tepe değer)."""
+    statm = Path("/proc/self/statm")
+    if statm.exists():
+        return int(statm.read_text().split()[1]) * resource.getpagesize()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def run(
+    frames: int,
+    objects: int,
+    capacity: int,
+    motion: str,
+    sample_every: int,
+    warmup: int,
+    seed: int,
+    archive: TrackArchive | None = None,
+) -> Dict[str, float]:
+    rng = np.random.default_rng(seed)
+    box_size = 30
+    world = 1280
+
+    def spawn(count: int):
+        return rng.uniform(0, world - box_size, (count, 2)), rng.integers(20, 400, count)
+
+    positions, lifetimes = spawn(objects)
+    sizes = np.full((objects, 2), box_size)
+    tracker = TrackingService(motion=motion, capacity=capacity, spill=archive)
+
+    samples = []
+    start = time.perf_counter()
+    for frame in range(1, frames + 1):
+        lifetimes -= 1
+        dead = np.flatnonzero(lifetimes <= 0)
+        if len(dead):
+            positions[dead], lifetimes[dead] = spawn(len(dead))
+        positions += rng.normal(0.0, 1.0, positions.shape)
+        np.clip(positions, 0, world - box_size, out=positions)
+        bboxes = np.concatenate([positions.astype(np.int64), sizes], axis=1)
+        tracker.update(bboxes)
+        if frame % sample_every == 0:
+            samples.append((frame, rss_bytes(), tracker.memory_bytes, tracker.active_tracks))
+    elapsed = time.perf_counter() - start
+
+    steady = [s for s in samples if s[0] > warmup] or samples
+    rss = np.array([s[1] for s in steady])
+    return {
+        'frames': frames,
+        'objects': objects,
+        'capacity': capacity,
+        'motion': motion,
+        'us_per_frame': round(elapsed / frames * 1e6, 1),
+        'total_tracked': tracker.total_tracked,
+        'finished_tracks': tracker.finished_tracks,
+        'dropped_tracks': tracker.dropped_tracks,
+        'max_active_tracks': max(s[3] for s in samples),
+        'tracker_memory_bytes': tracker.memory_bytes,
+        'tracker_memory_constant': len({s[2] for s in samples}) == 1,
+        'rss_start_kb': round(rss[0] / 1024, 1),
+        'rss_peak_kb': round(rss.max() / 1024, 1),
+        'rss_growth_kb': round((rss.max() - rss[0]) / 1024, 1),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tracker bellek soak testi")
+    parser.add_argument("--frames", type=int, default=1_000_000, help="Frame sayısı")
+    parser.add_argument("--objects", type=int, default=40, help="Sahnede aynı anda bulunan nesne sayısı")
+    parser.add_argument("--capacity", type=int, default=256, help="Track deposu kapasitesi")
+    parser.add_argument("--motion", type=str, default="none", choices=MOTION_MODELS, help="Track hareket modeli")
+    parser.add_argument("--sample-every", type=int, default=10_000, help="Bellek örnekleme aralığı (frame)")
+    parser.add_argument("--warmup", type=int, default=10_000, help="Artış hesabına katılmayan ilk frame sayısı")
+    parser.add_argument("--max-growth-kb", type=float, default=1024.0, help="Isınmadan sonra izin verilen RSS artışı")
+    parser.add_argument("--archive", type=str, default=None, help="Biten track'leri bu dosyaya yaz")
+    parser.add_argument("--seed", type=int, default=0, help="Sahne seed'i")
+    parser.add_argument("--report", type=str, default=None, help="Raporu JSON olarak kaydet")
+    args = parser.parse_args()
+
+    archive = TrackArchive(args.archive) if args.archive else None
+    report = run(
+        args.frames,
+        args.objects,
+        args.capacity,
+        args.motion,
+        max(1, args.sample_every),
+        args.warmup,
+        args.seed,
+        archive=archive,
+    )
+    if archive is not None:
+        archive.close()
+        report['archived_records'] = archive.written
+
+    logger.info("\n" + "=" * 60)
+    logger.info(f"Tracker soak ({args.frames} frame, {args.objects} nesne, kapasite {args.capacity})")
+    logger.info("=" * 60)
+    for key, value in report.items():
+        logger.info(f"{key:<26}{value}")
+    ok = report['tracker_memory_constant'] and report['rss_growth_kb'] <= args.max_growth_kb
+    logger.info(f"{'max_growth_kb':<26}{args.max_growth_kb} ({'OK' if ok else 'AŞILDI'})")
+    logger.info("=" * 60 + "\n")
+
+    if args.report:
+        Path(args.report).write_text(json.dumps(report, indent=2), encoding='utf-8')
+        logger.info(f"Rapor kaydedildi: {args.report}")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    exit(main())
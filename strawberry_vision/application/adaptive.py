@@ -0,0 +1,158 @@
+from collections import deque
+from typing import Any, Deque, Dict, List, Sequence
+import logging
+
+import numpy as np
+
+from strawberry_vision.application.pipeline import InferencePipeline, PipelineResult
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveController:
+    """Gecikme hedefini (SLO) tutmak için görüntü boyutunu ve frame adımını ayarlayan kontrolcü.
+
+    Pipeline'ın her sonucundaki detect süresi kayan bir pencerede izlenir.
+    Frame başına düşen gecikme (pencere yüzdeliği / frame adımı) hedefi
+    `tolerance` oranında aşarsa önce görüntü boyutu, en küçük boyuta inildiyse
+    frame adımı (stride) bir kademe artırılır. Gecikme hedefin altına düşer ve
+    bir üst kademenin tahmini gecikmesi de hedefin altında kalırsa önce stride,
+    sonra görüntü boyutu geri yükseltilir. Her değişiklikten sonra pencere
+    boşaltılır; karar yeni ayarla ölçülen gecikmeyle verilir. Tüm değişiklikler
+    `pipeline.record_adjustment` ile metriklere yazılır.
+
+    Detector `set_imgsz` sunmuyorsa veya boyut uygulanamıyorsa (sabit girişli
+    ONNX) yalnızca stride ayarlanır.
+
+    Args:
+        pipeline: Kontrol edilecek pipeline
+        target_latency: Frame başına hedef detect gecikmesi (saniye)
+        imgsz_levels: Denenecek görüntü boyutları (küçükten büyüğe)
+        stride_levels: Denenecek frame adımları (küçükten büyüğe)
+        window: Karar için gereken ölçüm sayısı
+        percentile: Penceredeki gecikmenin hangi yüzdeliğinin kullanılacağı
+        tolerance: Hedef etrafındaki ölü bant oranı
+    """
+
+    def __init__(
+        self,
+        pipeline: InferencePipeline,
+        target_latency: float = 0.1,
+        imgsz_levels: Sequence[int] = (320, 416, 512, 640),
+        stride_levels: Sequence[int] = (1, 2, 3, 4),
+        window: int = 20,
+        percentile: float = 90.0,
+        tolerance: float = 0.15,
+    ) -> None:
+        if target_latency <= 0:
+            raise ValueError(f"target_latency must be positive, got {target_latency}")
+        self.pipeline = pipeline
+        self.target_latency = target_latency
+        self.imgsz_levels = sorted(imgsz_levels)
+        self.stride_levels = sorted(stride_levels)
+        self.window = max(1, window)
+        self.percentile = percentile
+        self.tolerance = tolerance
+        self._samples: Deque[float] = deque(maxlen=self.window)
+
+        self._set_imgsz = getattr(pipeline.detector, "set_imgsz", None)
+        if self._set_imgsz is None:
+            logger.warning(f"{type(pipeline.detector).__name__} has no set_imgsz; adjusting detect stride only")
+        current = getattr(pipeline.detector, "imgsz", None) or self.imgsz_levels[-1]
+        self._imgsz_index = int(np.argmin([abs(level - current) for level in self.imgsz_levels]))
+        self._stride_index = int(np.argmin([abs(level - pipeline.detect_stride) for level in self.stride_levels]))
+        pipeline.detect_stride = self.stride_levels[self._stride_index]
+
+    @property
+    def imgsz(self) -> int:
+        return self.imgsz_levels[self._imgsz_index]
+
+    @property
+    def stride(self) -> int:
+        return self.stride_levels[self._stride_index]
+
+    def run(self, frame: np.ndarray) -> PipelineResult:
+        """Frame'i pipeline'dan geçirir ve gecikmeyi gözlemler."""
+        result = self.pipeline.run(frame)
+        self.observe(result)
+        return result
+
+    def run_batch(self, frames: Sequence[np.ndarray]) -> List[PipelineResult]:
+        results = self.pipeline.run_batch(frames)
+        for result in results:
+            self.observe(result)
+        return results
+
+    def observe(self, result: PipelineResult) -> None:
+        """Detector'ün çalıştığı frame'lerin detect süresini pencereye ekler."""
+        if result.skipped or "detect" not in result.stage_times:
+            return
+        self._samples.append(result.stage_times["detect"])
+        if len(self._samples) >= self.window:
+            self._adjust()
+
+    def rolling_latency(self) -> float:
+        """Penceredeki detect gecikmesinin yüzdeliği (saniye)."""
+        if not self._samples:
+            return 0.0
+        return float(np.percentile(np.fromiter(self._samples, dtype=np.float64), self.percentile))
+
+    def _adjust(self) -> None:
+        latency = self.rolling_latency()
+        per_frame = latency / self.stride
+        high = self.target_latency * (1.0 + self.tolerance)
+        low = self.target_latency * (1.0 - self.tolerance)
+
+        if per_frame > high:
+            if self._imgsz_index > 0 and self._apply_imgsz(self._imgsz_index - 1, latency):
+                return
+            if self._stride_index < len(self.stride_levels) - 1:
+                self._apply_stride(self._stride_index + 1, latency)
+        elif per_frame < low:
+            # Önce tazelik (stride), sonra çözünürlük geri kazanılır; tahmini gecikme hedefi aşmamalı
+            if self._stride_index > 0:
+                if latency / self.stride_levels[self._stride_index - 1] < low:
+                    self._apply_stride(self._stride_index - 1, latency)
+                return
+            if self._imgsz_index < len(self.imgsz_levels) - 1:
+                scale = (self.imgsz_levels[self._imgsz_index + 1] / self.imgsz) ** 2
+                if latency * scale / self.stride < low:
+                    self._apply_imgsz(self._imgsz_index + 1, latency)
+
+    def _apply_imgsz(self, index: int, latency: float) -> bool:
+        if self._set_imgsz is None:
+            return False
+        old, new = self.imgsz, self.imgsz_levels[index]
+        if not self._set_imgsz(new):
+            # Boyut değiştirilemiyor (ör. sabit girişli ONNX); yalnızca stride kullanılır
+            logger.warning(f"Detector rejected imgsz {new}; adjusting detect stride only")
+            self._set_imgsz = None
+            return False
+        self._imgsz_index = index
+        self._record("imgsz", old, new, latency)
+        return True
+
+    def _apply_stride(self, index: int, latency: float) -> None:
+        old, new = self.stride, self.stride_levels[index]
+        self._stride_index = index
+        self.pipeline.detect_stride = new
+        self._record("stride", old, new, latency)
+
+    def _record(self, knob: str, old: int, new: int, latency: float) -> None:
+        self._samples.clear()
+        self.pipeline.record_adjustment(
+            knob,
+            old,
+            new,
+            latency=round(latency, 6),
+            target=self.target_latency,
+        )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pipeline metriklerine kontrolcü durumunu ekler."""
+        metrics = self.pipeline.get_metrics()
+        metrics["imgsz"] = self.imgsz
+        metrics["detect_stride"] = self.stride
+        metrics["target_latency"] = self.target_latency
+        metrics["rolling_detect_latency"] = round(self.rolling_latency(), 6)
+        return metrics
@@ -0,0 +1,195 @@
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, Callable, Dict, List, Sequence
+import logging
+import os
+
+from strawberry_vision.application.pipeline import InferencePipeline
+from strawberry_vision.infrastructure.model_registry import get_registry
+from strawberry_vision.infrastructure.sources import open_source
+
+logger = logging.getLogger(__name__)
+
+# Worker process başına bir kez yüklenen detector
+_worker_detector = None
+
+
+def _default_detector_factory(model_path: str | None, backend: str = "ultralytics"):
+    return get_registry().acquire(model_path, backend=backend)
+
+
+def _init_worker(detector_factory: Callable[[str | None], Any], model_path: str | None) -> None:
+    global _worker_detector
+    _worker_detector = detector_factory(model_path)
+    # Model yükleme ve ısıtma worker başlangıcında yapılır, ilk kaynağın süresine eklenmez
+    warmup = getattr(_worker_detector, "warmup", None)
+    if warmup is not None:
+        warmup()
+
+
+def _process_source(source_path: str, max_frames: int | None) -> Dict[str, Any]:
+    """Tek bir kaynağı worker process içinde işler."""
+    pipeline = InferencePipeline(detector=_worker_detector, enable_logging=False)
+    counts: Counter = Counter()
+    total = 0
+    frame_errors = 0
+    first_error = None
+    for frame in open_source(source_path, max_frames=max_frames):
+        result = pipeline.run(frame)
+        if result.error is not None:
+            frame_errors += 1
+            first_error = first_error or f"frame {result.frame_processed}: {result.error}"
+            continue
+        counts.update(result.counts)
+        total += result.total
+    metrics = pipeline.get_metrics()
+    if metrics["total_frames"] == 0:
+        raise ValueError(f"No frames read from source: {source_path}")
+    return {
+        "counts": dict(counts),
+        "total": total,
+        "metrics": metrics,
+        "frame_errors": frame_errors,
+        "first_error": first_error,
+    }
+
+
+@dataclass
+class SourceReport:
+    """Tek kaynak için batch sonucu.
+
+    Attributes:
+        source: Kaynak yolu
+        counts: Tüm frame'ler boyunca olgunluk sayımları
+        total: Toplam tespit sayısı
+        metrics: Kaynağın pipeline metrikleri (get_metrics)
+        attempts: Deneme sayısı
+        frame_errors: Son denemede işlenemeyen frame sayısı
+        error: Son hata mesajı (başarılı ise None)
+    """
+    source: str
+    counts: Dict[str, int] = field(default_factory=dict)
+    total: int = 0
+    metrics: Dict[str, Any] = field(default_factory=dict)
+    attempts: int = 0
+    frame_errors: int = 0
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class BatchReport:
+    """Tüm kaynakların birleştirilmiş raporu."""
+    sources: List[SourceReport] = field(default_factory=list)
+
+    @property
+    def succeeded(self) -> List[SourceReport]:
+        return [s for s in self.sources if s.ok]
+
+    @property
+    def failed(self) -> List[SourceReport]:
+        return [s for s in self.sources if not s.ok]
+
+    def summary(self) -> Dict[str, Any]:
+        """Birleştirilmiş sayım ve metrikleri döndürür."""
+        counts: Counter = Counter()
+        total = frames = frame_errors = 0
+        total_time = 0.0
+        for s in self.succeeded:
+            counts.update(s.counts)
+            total += s.total
+            frames += s.metrics.get("total_frames", 0)
+            total_time += s.metrics.get("total_time", 0.0)
+            frame_errors += s.frame_errors
+        return {
+            "sources": len(self.sources),
+            "succeeded": len(self.succeeded),
+            "failed": [s.source for s in self.failed],
+            "counts": dict(counts),
+            "total": total,
+            "total_frames": frames,
+            "frame_errors": frame_errors,
+            "total_time": round(total_time, 3),
+            "fps": round(frames / total_time, 2) if total_time > 0 else 0.0,
+        }
+
+
+class BatchRunner:
+    """Çok sayıda video/görüntü klasörünü ProcessPoolExecutor ile paralel işler.
+
+    Her worker process detector'ü bir kez yükler ve kendisine düşen kaynakları
+    ayrı pipeline'larla (ayrı tracking durumu) işler. Hata veren kaynaklar
+    yeni bir pool ile tekrar denenir; denemeler bitince atlanır ve raporda
+    hatalı olarak işaretlenir. İşlenemeyen frame'ler sayılır; oranları
+    `max_error_ratio`'yu aşan kaynak (ör. bozuk video) eksik sayımla başarılı
+    raporlanmaz, hatalı sayılıp yeniden denenir.
+    """
+
+    def __init__(
+        self,
+        model_path: str | None = None,
+        workers: int | None = None,
+        retries: int = 1,
+        max_frames: int | None = None,
+        detector_factory: Callable[[str | None], Any] | None = None,
+        backend: str = "ultralytics",
+        max_error_ratio: float = 0.0,
+    ) -> None:
+        self.model_path = model_path
+        self.workers = workers or os.cpu_count() or 1
+        self.retries = max(0, retries)
+        self.max_frames = max_frames
+        # Kaynağın başarılı sayılması için izin verilen en yüksek hatalı frame oranı
+        self.max_error_ratio = max(0.0, max_error_ratio)
+        # Fabrika fonksiyonu worker'lara pickle ile gönderilir; modül seviyesinde tanımlı olmalıdır
+        self.detector_factory = detector_factory or partial(_default_detector_factory, backend=backend)
+
+    def run(self, sources: Sequence[str]) -> BatchReport:
+        """Kaynakları işler ve birleştirilmiş raporu döndürür."""
+        reports = {src: SourceReport(source=src) for src in sources}
+        pending = list(reports)
+
+        for attempt in range(1, self.retries + 2):
+            if not pending:
+                break
+            failed: List[str] = []
+            # Her tur yeni bir pool ile başlar; çöken worker önceki turun pool'unu bozsa da devam edilir
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(pending)),
+                initializer=_init_worker,
+                initargs=(self.detector_factory, self.model_path),
+            ) as pool:
+                futures = {pool.submit(_process_source, src, self.max_frames): src for src in pending}
+                for future in as_completed(futures):
+                    src = futures[future]
+                    report = reports[src]
+                    report.attempts = attempt
+                    try:
+                        data = future.result()
+                    except Exception as e:
+                        report.error = str(e) or type(e).__name__
+                        logger.warning(f"Source failed (attempt {attempt}): {src}: {report.error}")
+                        failed.append(src)
+                        continue
+                    report.counts = data["counts"]
+                    report.total = data["total"]
+                    report.metrics = data["metrics"]
+                    report.frame_errors = data["frame_errors"]
+                    frames = report.metrics["total_frames"]
+                    if report.frame_errors > self.max_error_ratio * frames:
+                        report.error = f"{report.frame_errors}/{frames} frames failed (first: {data['first_error']})"
+                        logger.warning(f"Source failed (attempt {attempt}): {src}: {report.error}")
+                        failed.append(src)
+                        continue
+                    report.error = None
+                    logger.info(f"Source done: {src} ({report.metrics['total_frames']} frames)")
+            pending = failed
+
+        for src in pending:
+            logger.error(f"Skipping source after {reports[src].attempts} attempts: {src}")
+        return BatchReport(sources=list(reports.values()))
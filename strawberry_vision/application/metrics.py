@@ -0,0 +1,105 @@
+from typing import Dict, Iterable, List, Tuple
+import math
+
+
+class LatencyHistogram:
+    """Sabit bellekli akan (streaming) gecikme histogramı.
+
+    Değerler log-ölçekli bucket'lara yazılır (`buckets_per_decade` ile çözünürlük
+    belirlenir; 20 bucket/dekad ≈ %12 göreli hata). Bellek kullanımı kaydedilen
+    örnek sayısından bağımsızdır; yüzdelikler bucket üst sınırından okunur.
+    """
+
+    def __init__(self, min_value: float = 1e-6, max_value: float = 100.0, buckets_per_decade: int = 20) -> None:
+        if not (0 < min_value < max_value):
+            raise ValueError(f"Invalid histogram range: {min_value}..{max_value}")
+        self.min_value = min_value
+        self.max_value = max_value
+        self.buckets_per_decade = buckets_per_decade
+        decades = math.log10(max_value / min_value)
+        n = int(math.ceil(decades * buckets_per_decade))
+        # bounds[i]: i. bucket'ın üst sınırı; son bucket taşan değerleri toplar
+        self.bounds: List[float] = [min_value * 10 ** ((i + 1) / buckets_per_decade) for i in range(n)]
+        self._counts: List[int] = [0] * (n + 1)
+        self._log_min = math.log10(min_value)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def record(self, value: float) -> None:
+        """Bir gecikme değeri (saniye) ekler."""
+        if value <= self.min_value:
+            index = 0
+        else:
+            index = min(
+                int((math.log10(value) - self._log_min) * self.buckets_per_decade),
+                len(self._counts) - 1,
+            )
+        self._counts[index] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, q: float) -> float:
+        """q (0-100) yüzdeliğini döndürür; örnek yoksa 0.0."""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(math.ceil(q / 100.0 * self.count)))
+        seen = 0
+        for i, c in enumerate(self._counts):
+            seen += c
+            if seen >= rank:
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                return min(upper, self.max)
+        return self.max
+
+    def buckets(self) -> List[Tuple[float, int]]:
+        """(üst sınır, kümülatif sayı) listesi; son eleman +Inf bucket'ıdır."""
+        snapshot = list(self._counts)
+        out = []
+        cumulative = 0
+        for bound, c in zip(self.bounds + [math.inf], snapshot):
+            cumulative += c
+            out.append((bound, cumulative))
+        return out
+
+    def summary(self) -> Dict[str, float]:
+        """p50, p95, p99, max ve ortalama değerleri (saniye)."""
+        return {
+            "count": self.count,
+            "p50": round(self.percentile(50), 6),
+            "p95": round(self.percentile(95), 6),
+            "p99": round(self.percentile(99), 6),
+            "max": round(self.max, 6),
+            "mean": round(self.sum / self.count, 6) if self.count else 0.0,
+        }
+
+    def reset(self) -> None:
+        self._counts = [0] * len(self._counts)
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+
+class StageLatencies:
+    """Pipeline aşamaları için gecikme histogramları."""
+
+    STAGES = ("detect", "classify", "track", "count", "visualize")
+
+    def __init__(self, stages: Iterable[str] = STAGES) -> None:
+        self.histograms: Dict[str, LatencyHistogram] = {stage: LatencyHistogram() for stage in stages}
+
+    def record(self, stage_times: Dict[str, float]) -> None:
+        """Bir frame'in aşama sürelerini ekler."""
+        for stage, elapsed in stage_times.items():
+            histogram = self.histograms.get(stage)
+            if histogram is not None:
+                histogram.record(elapsed)
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        return {stage: h.summary() for stage, h in self.histograms.items()}
+
+    def reset(self) -> None:
+        for h in self.histograms.values():
+            h.reset()
@@ -0,0 +1,205 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List
+import asyncio
+import functools
+import logging
+import threading
+
+import numpy as np
+
+from strawberry_vision.application.pipeline import InferencePipeline, PipelineResult, detect_columnar
+from strawberry_vision.domain.batch import DetectionBatch
+from strawberry_vision.domain.entities import Detection
+from strawberry_vision.domain.services import TrackingService, CountingService
+from strawberry_vision.domain.unique_counting import UniqueCountingService
+from strawberry_vision.infrastructure.model_registry import SharedDetector
+from strawberry_vision.infrastructure.roi import RoiDetector, rois_for
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+# Inference yapan veya model durumunu değiştiren metotlar; kilit altında çağrılır
+_LOCKED_METHODS = frozenset({
+    "detect",
+    "detect_batch",
+    "detect_arrays",
+    "detect_arrays_batch",
+    "detect_columnar",
+    "detect_columnar_batch",
+    "set_imgsz",
+    "warmup",
+})
+
+
+class _SharedDetector:
+    """Birden fazla pipeline'ın aynı detector'ü thread-safe kullanmasını sağlar."""
+
+    def __init__(self, detector) -> None:
+        self._detector = detector
+        self._lock = threading.Lock()
+
+    def detect(self, frame: np.ndarray) -> List[Detection]:
+        with self._lock:
+            return self._detector.detect(frame)
+
+    def detect_columnar(self, frame: np.ndarray) -> DetectionBatch:
+        with self._lock:
+            return detect_columnar(self._detector, frame)
+
+    def _locked(self, method: Callable) -> Callable:
+        @functools.wraps(method)
+        def call(*args, **kwargs):
+            with self._lock:
+                return method(*args, **kwargs)
+
+        return call
+
+    def __getattr__(self, name: str):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        # Detector'de olmayan metot AttributeError verir; pipeline getattr ile geri dönüş yolunu seçer
+        attr = getattr(self._detector, name)
+        if name in _LOCKED_METHODS:
+            return self._locked(attr)
+        # class_names, to_batch, model gibi kilit gerektirmeyen alanlar
+        return attr
+
+
+@dataclass
+class _StreamState:
+    name: str
+    pipeline: InferencePipeline
+    frames_read: int = 0
+    last_result: PipelineResult | None = None
+
+
+class MultiStreamOrchestrator:
+    """Çok sayıda kamera/video akışını tek process'te asyncio ile yönetir.
+
+    Her akış bloklayan kaynağını ayrı bir executor thread'inde okur. Okunan frame,
+    akışa ait tek elemanlı bir slota yazılır; model yavaşsa slottaki eski frame
+    atılır (latest-frame-wins), böylece gecikme birikmez. Inference paylaşılan
+    tek detector üzerinden yapılır; tracking ve counting her akış için ayrıdır.
+    `rois` verilirse her akış yalnızca kendi ROI poligonlarını işler
+    (bkz. `load_roi_config`); tanımı olmayan akış `default` girdisini veya tüm frame'i kullanır.
+    `tracker_factory` / `counter_factory` verilirse her akışın tracker'ı ve
+    benzersiz sayım servisi akış adıyla bu fonksiyonlardan alınır (ör. kapasite,
+    arşiv veya akışa özel sayım çizgileri için). `results_sink` verilirse tüm
+    akışların frame sonuçları akış adıyla bu paylaşılan sink'e bırakılır.
+    """
+
+    def __init__(
+        self,
+        sources: Dict[str, Iterable[np.ndarray]],
+        detector,
+        inference_workers: int = 1,
+        on_result: Callable[[str, PipelineResult], None] | None = None,
+        enable_logging: bool = False,
+        rois: Dict[str, List[np.ndarray]] | None = None,
+        classifier=None,
+        tracker_factory: Callable[[str], TrackingService] | None = None,
+        counter_factory: Callable[[str], UniqueCountingService | None] | None = None,
+        results_sink=None,
+    ) -> None:
+        if not sources:
+            raise ValueError("At least one source is required")
+        self.sources = dict(sources)
+        # Registry tutamaçları zaten thread-safe'dir; diğer detector'ler kilitle sarılır
+        self.detector = detector if isinstance(detector, SharedDetector) else _SharedDetector(detector)
+        self.inference_workers = max(1, inference_workers)
+        self.on_result = on_result
+        self._streams: Dict[str, _StreamState] = {
+            name: _StreamState(
+                name=name,
+                pipeline=InferencePipeline(
+                    detector=self._stream_detector(name, rois),
+                    tracker=tracker_factory(name) if tracker_factory else TrackingService(),
+                    counter=CountingService(),
+                    enable_logging=enable_logging,
+                    classifier=classifier,
+                    unique_counter=counter_factory(name) if counter_factory else None,
+                    results_sink=results_sink,
+                    source=name,
+                ),
+            )
+            for name in self.sources
+        }
+
+    def _stream_detector(self, name: str, rois: Dict[str, List[np.ndarray]] | None):
+        polygons = rois_for(rois, name) if rois else None
+        return RoiDetector(self.detector, polygons) if polygons else self.detector
+
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """Tüm akışlar bitene kadar çalışır (senkron giriş noktası)."""
+        return asyncio.run(self.run_async())
+
+    async def run_async(self) -> Dict[str, Dict[str, Any]]:
+        """Tüm akışlar bitene kadar çalışır ve akış bazlı metrikleri döndürür."""
+        readers = ThreadPoolExecutor(max_workers=len(self.sources), thread_name_prefix="sv-reader")
+        inference = ThreadPoolExecutor(max_workers=self.inference_workers, thread_name_prefix="sv-infer")
+        try:
+            tasks = []
+            for name, source in self.sources.items():
+                slot: asyncio.Queue = asyncio.Queue(maxsize=1)
+                state = self._streams[name]
+                tasks.append(self._read_stream(state, iter(source), slot, readers))
+                tasks.append(self._infer_stream(state, slot, inference))
+            await asyncio.gather(*tasks)
+        finally:
+            readers.shutdown(wait=False, cancel_futures=True)
+            inference.shutdown(wait=True)
+        return self.get_metrics()
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Akış bazlı pipeline metrikleri ve okunan/atılan frame sayıları."""
+        metrics = {}
+        for name, state in self._streams.items():
+            stream_metrics = state.pipeline.get_metrics()
+            stream_metrics["frames_read"] = state.frames_read
+            stream_metrics["frames_dropped"] = stream_metrics["dropped_frames"]
+            metrics[name] = stream_metrics
+        return metrics
+
+    def pipeline(self, name: str) -> InferencePipeline:
+        """Akışa ait pipeline'ı döndürür."""
+        return self._streams[name].pipeline
+
+    @property
+    def pipelines(self) -> Dict[str, InferencePipeline]:
+        """Akış adı → pipeline eşlemesi."""
+        return {name: state.pipeline for name, state in self._streams.items()}
+
+    async def _read_stream(self, state: _StreamState, it, slot: asyncio.Queue, executor) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            while True:
+                frame = await loop.run_in_executor(executor, next, it, _END)
+                if frame is _END:
+                    break
+                state.frames_read += 1
+                self._offer(state, slot, frame)
+        except Exception as e:
+            logger.error(f"Stream {state.name} read error: {e}")
+        self._offer(state, slot, _END)
+
+    def _offer(self, state: _StreamState, slot: asyncio.Queue, item: object) -> None:
+        if slot.full():
+            stale = slot.get_nowait()
+            if stale is not _END:
+                state.pipeline.record_dropped()
+        slot.put_nowait(item)
+
+    async def _infer_stream(self, state: _StreamState, slot: asyncio.Queue, executor) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            frame = await slot.get()
+            if frame is _END:
+                break
+            result = await loop.run_in_executor(executor, state.pipeline.run, frame)
+            state.last_result = result
+            if self.on_result is not None:
+                self.on_result(state.name, result)
+        logger.info(f"Stream {state.name} finished: {state.pipeline.get_metrics()['total_frames']} frames")
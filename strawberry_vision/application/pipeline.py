@@ -1,17 +1,42 @@
+from collections import Counter, deque
 from dataclasses import dataclass, field
-from typing import Dict, List
+from typing import Deque, Dict, List, Sequence, Tuple, Union
 import logging
 import time
 
 import numpy as np
 
-from strawberry_vision.domain.entities import Strawberry
+from strawberry_vision.application.metrics import StageLatencies
+from strawberry_vision.domain.batch import DetectionBatch
+from strawberry_vision.domain.entities import Detection
 from strawberry_vision.domain.services import TrackingService, CountingService
-from strawberry_vision.infrastructure.detectors import YOLODetector, classify_ripeness
+from strawberry_vision.domain.unique_counting import UniqueCountingService
+from strawberry_vision.infrastructure.color_classifier import RedMeanClassifier
+from strawberry_vision.infrastructure.detectors import YOLODetector
+from strawberry_vision.infrastructure.model_registry import get_registry
+from strawberry_vision.infrastructure.motion import MotionGate
 from strawberry_vision.presentation.visualizer import Visualizer
 
 logger = logging.getLogger(__name__)
 
+# get_metrics içinde tutulan son ayar değişikliği sayısı
+ADJUSTMENT_LOG_SIZE = 100
+
+# Detector çıktısı: sütun düzeninde batch veya Detection listesi
+Detections = Union[DetectionBatch, List[Detection]]
+
+
+def detect_columnar(detector, frame: np.ndarray) -> DetectionBatch:
+    """Detector'ü çalıştırıp sonucu DetectionBatch olarak döndürür.
+
+    `detect_columnar` sunan detector'lerde Detection nesnesi hiç oluşturulmaz;
+    yalnızca `detect` sunanların listesi batch'e çevrilir.
+    """
+    columnar = getattr(detector, "detect_columnar", None)
+    if columnar is not None:
+        return columnar(frame)
+    return DetectionBatch.from_detections(detector.detect(frame))
+
 
 @dataclass
 class PipelineResult:
@@ -23,21 +48,39 @@ class PipelineResult:
         statistics: Detaylı istatistikler
         processing_time: İşlem süresi (saniye)
         frame_processed: İşlenen frame sayısı
+        skipped: Detector atlandı mı (motion gate veya detect_stride)
+        predicted: Kutular tracker'ın hareket tahmininden mi geldi (atlanan frame'de)
+        unique_counts: Video boyunca benzersiz birey sayımı (bölge → etiket → sayı);
+            yalnızca `unique_counter` verildiyse dolar
+        stage_times: Aşama bazlı süreler (saniye): detect, classify, track, count, visualize
+        error: Frame işlenemediyse hata mesajı (başarılı ise None)
     """
     counts: Dict[str, int]
     total: int = 0
     statistics: Dict[str, any] = field(default_factory=dict)
     processing_time: float = 0.0
     frame_processed: int = 0
+    skipped: bool = False
+    predicted: bool = False
+    unique_counts: Dict[str, Dict[str, int]] = field(default_factory=dict)
+    stage_times: Dict[str, float] = field(default_factory=dict)
+    error: str | None = None
 
     def summary(self) -> Dict[str, any]:
         """Özet bilgileri döndürür."""
-        return {
+        summary = {
             "counts": self.counts,
             "total": self.total,
             "processing_time": round(self.processing_time, 3),
             "frames": self.frame_processed,
+            "skipped": self.skipped,
+            "predicted": self.predicted,
         }
+        if self.unique_counts:
+            summary["unique_counts"] = self.unique_counts
+        if self.error is not None:
+            summary["error"] = self.error
+        return summary
 
 
 class InferencePipeline:
@@ -53,14 +96,42 @@ class InferencePipeline:
         counter: CountingService | None = None,
         visualizer: Visualizer | None = None,
         enable_logging: bool = True,
+        motion_gate: MotionGate | None = None,
+        classifier=None,
+        unique_counter: UniqueCountingService | None = None,
+        results_sink=None,
+        source: str = "default",
     ) -> None:
-        self.detector = detector or YOLODetector()
+        # Detector verilmezse process genelindeki registry'den paylaşılan örnek alınır
+        self._owned_detector = None
+        if detector is None:
+            detector = self._owned_detector = get_registry().acquire()
+        self.detector = detector
         self.tracker = tracker or TrackingService()
         self.counter = counter or CountingService()
         self.visualizer = visualizer or Visualizer()
+        # Renk aşaması: classify_batch(frame, bboxes) -> olgunluk kodları
+        self.classifier = classifier or RedMeanClassifier()
+        # Track'leri video boyunca bir kez sayan (çizgi/bölge) isteğe bağlı sayım
+        self.unique_counter = unique_counter
+        # Frame sonuçlarını kalıcı depoya bırakan isteğe bağlı sink: submit(source, result, batch), bloklamaz
+        self.results_sink = results_sink
+        self.source = source
         self.enable_logging = enable_logging
+        self.motion_gate = motion_gate
         self._frame_count = 0
         self._total_processing_time = 0.0
+        self._skipped_frames = 0
+        self._predicted_frames = 0
+        self._last_detections: DetectionBatch | None = None
+        self.latency = StageLatencies()
+        self._class_counts: Counter = Counter()
+        self._dropped_frames = 0
+        # Her kaç frame'de bir detector çalışacağı (aradaki frame'ler önceki tespitleri kullanır)
+        self.detect_stride = 1
+        self._frames_since_detect = 0
+        self._adjustments: Deque[Dict[str, any]] = deque(maxlen=ADJUSTMENT_LOG_SIZE)
+        self._adjustment_count = 0
         
         if self.enable_logging:
             logger.info("InferencePipeline initialized")
@@ -74,68 +145,287 @@ class InferencePipeline:
         Returns:
             Pipeline sonuç nesnesi
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         self._frame_count += 1
         
         try:
-            # Detection
-            detections = self.detector.detect(frame)
-            if self.enable_logging:
-                logger.debug(f"Detected {len(detections)} objects")
-            
-            # Classification
-            strawberries: List[Strawberry] = []
-            for det in detections:
-                ripeness = classify_ripeness(frame, det.bbox)
-                strawberries.append(Strawberry(id=None, detection=det, ripeness=ripeness))
-            
-            # Tracking
-            strawberries = self.tracker.assign_ids(strawberries)
-            
-            # Counting
-            counts = self.counter.count_by_ripeness(strawberries)
-            statistics = self.counter.get_statistics(strawberries)
-            
-            # Visualization
-            _ = self.visualizer.draw(frame, strawberries)
-            
-            processing_time = time.time() - start_time
-            self._total_processing_time += processing_time
-            
-            if self.enable_logging:
-                logger.info(f"Frame {self._frame_count}: {len(strawberries)} strawberries, {processing_time:.3f}s")
+            # Detection (değişmeyen frame'de önceki tespitler kullanılır)
+            detections, skipped, detect_time = self._detect(frame)
+            return self._process(frame, detections, start_time, skipped, detect_time)
+        except Exception as e:
+            return self._error_result(e, time.perf_counter() - start_time)
+
+    def run_batch(self, frames: Sequence[np.ndarray]) -> List[PipelineResult]:
+        """Birden fazla frame'i tek bir detection çağrısıyla işler.
+        
+        Detection tüm frame'ler için bir kez çalışır; classification, tracking
+        ve counting ardından her frame için sırayla uygulanır.
+        
+        Args:
+            frames: İşlenecek frame listesi
             
-            return PipelineResult(
-                counts=counts,
-                total=len(strawberries),
-                statistics=statistics,
-                processing_time=processing_time,
-                frame_processed=self._frame_count,
-            )
+        Returns:
+            Frame sırasıyla pipeline sonuç listesi
+        """
+        frames = list(frames)
+        if not frames:
+            return []
+        
+        start_time = time.perf_counter()
+        try:
+            # Gate sırayla, batch içinde tespit edilecek son frame'e göre değerlendirilir
+            skip_flags = []
+            has_detections = self._last_detections is not None
+            for f in frames:
+                skip_flags.append(self._can_skip(f, has_detections))
+                has_detections = True
+            to_detect = [f for f, skip in zip(frames, skip_flags) if not skip]
+            detected = self._detect_many(to_detect) if to_detect else []
         except Exception as e:
-            logger.error(f"Pipeline error on frame {self._frame_count}: {e}")
-            return PipelineResult(
-                counts={},
-                total=0,
-                processing_time=time.time() - start_time,
-                frame_processed=self._frame_count,
-            )
+            # Batch detection hatası tüm frame'leri etkiler
+            detect_share = (time.perf_counter() - start_time) / len(frames)
+            results = []
+            for _ in frames:
+                self._frame_count += 1
+                results.append(self._error_result(e, detect_share))
+            return results
+        
+        # Batch detection süresi frame'lere eşit paylaştırılır
+        detect_share = (time.perf_counter() - start_time) / len(frames)
+        results = []
+        detected_iter = iter(detected)
+        for frame, skipped in zip(frames, skip_flags):
+            self._frame_count += 1
+            frame_start = time.perf_counter() - detect_share
+            if skipped:
+                self._skipped_frames += 1
+                detections = self._last_detections
+            else:
+                detections = next(detected_iter)
+                self._last_detections = detections
+            try:
+                results.append(self._process(frame, detections, frame_start, skipped, detect_share))
+            except Exception as e:
+                results.append(self._error_result(e, time.perf_counter() - frame_start))
+        return results
+
+    def _detect_many(self, frames: List[np.ndarray]) -> List[DetectionBatch]:
+        """Frame listesi için detector'ü tek seferde çalıştırır (destekliyorsa)."""
+        columnar_batch = getattr(self.detector, "detect_columnar_batch", None)
+        if columnar_batch is not None:
+            return columnar_batch(frames)
+        detect_batch = getattr(self.detector, "detect_batch", None)
+        if detect_batch is not None:
+            return [DetectionBatch.from_detections(d) for d in detect_batch(frames)]
+        return [detect_columnar(self.detector, f) for f in frames]
+
+    def _detect(self, frame: np.ndarray) -> Tuple[DetectionBatch, bool, float]:
+        """Detection adımı; motion gate izin verirse önceki tespitleri döndürür.
+        
+        Returns:
+            (tespitler, detector atlandı mı, detection süresi)
+        """
+        start = time.perf_counter()
+        if self._can_skip(frame):
+            self._skipped_frames += 1
+            return self._last_detections, True, time.perf_counter() - start
+        detections = detect_columnar(self.detector, frame)
+        self._last_detections = detections
+        return detections, False, time.perf_counter() - start
+
+    def _can_skip(self, frame: np.ndarray, has_detections: bool | None = None) -> bool:
+        """Frame'de detector atlanabilir mi (stride dolmadı veya gate değişim görmedi).
+
+        Stride önce kontrol edilir: gate yalnızca detector'ün gerçekten
+        çalışabileceği frame'lerde çağrılır. Gate `True` döndürdüğünde frame'i
+        referans yaptığından referans her zaman son tespit edilen frame kalır;
+        stride yüzünden atlanan bir frame'deki değişim böylece kaybolmaz.
+        """
+        if has_detections is None:
+            has_detections = self._last_detections is not None
+        if not has_detections:
+            skip = False
+            if self.motion_gate is not None:
+                # İlk tespit edilen frame gate'in referansı olur
+                self.motion_gate.reset()
+                self.motion_gate.should_process(frame)
+        elif self._frames_since_detect + 1 < self.detect_stride:
+            skip = True
+        else:
+            skip = self.motion_gate is not None and not self.motion_gate.should_process(frame)
+        self._frames_since_detect = self._frames_since_detect + 1 if skip else 0
+        return skip
+
+    def _process(
+        self,
+        frame: np.ndarray,
+        detections: Detections,
+        start_time: float,
+        skipped: bool = False,
+        detect_time: float = 0.0,
+    ) -> PipelineResult:
+        """Tespitler üzerinden classification → tracking → counting → visualization uygular."""
+        strawberries, result = self._postprocess(frame, detections, skipped, detect_time)
+        self._render(frame, strawberries, result)
+        return self._finalize(result, start_time, strawberries)
+
+    def _postprocess(
+        self,
+        frame: np.ndarray,
+        detections: Detections,
+        skipped: bool = False,
+        detect_time: float = 0.0,
+    ) -> Tuple[DetectionBatch, PipelineResult]:
+        """Classification, tracking ve counting adımlarını uygular (çizim hariç).
+
+        Detector atlanan frame'de tracker hareket tahmini yapıyorsa (Kalman)
+        önceki tespitler yerine track'lerin tahmini kutuları kullanılır.
+        """
+        predicted = skipped and getattr(self.tracker, "predicts", False)
+        if predicted:
+            self._predicted_frames += 1
+            batch = self.tracker.predict(getattr(detections, "class_names", ()), frame.shape[:2])
+        elif isinstance(detections, DetectionBatch):
+            # Önceki frame'in tespitleri yeniden kullanılabilir; olgunluk ve ID'ler kopyaya yazılır
+            batch = detections.copy()
+        else:
+            batch = DetectionBatch.from_detections(detections)
+        if self.enable_logging:
+            logger.debug(f"Detected {len(batch)} objects")
+        
+        # Classification
+        t0 = time.perf_counter()
+        batch.ripeness[:] = self.classifier.classify_batch(frame, batch.bboxes)
+        
+        # Tracking (tahmini kutular zaten track ID'lerini taşır)
+        t1 = time.perf_counter()
+        if not predicted:
+            batch = self.tracker.assign_ids(batch)
+        
+        # Counting
+        t2 = time.perf_counter()
+        # Olgunluk, güven ve takip sayımları tek geçişte; kayan pencereler de güncellenir
+        statistics = self.counter.observe(batch)
+        counts = statistics["by_ripeness"]
+        unique_counts = {}
+        if self.unique_counter is not None:
+            # Atlanan frame'lerde tekrar kullanılan etiketler çoğunluk oyuna katılmaz
+            self.unique_counter.update(batch, vote=not skipped)
+            unique_counts = self.unique_counter.counts()
+        t3 = time.perf_counter()
+        self._class_counts.update(batch.label_counts())
+        
+        result = PipelineResult(
+            counts=counts,
+            total=len(batch),
+            statistics=statistics,
+            frame_processed=self._frame_count,
+            skipped=skipped,
+            predicted=predicted,
+            unique_counts=unique_counts,
+            stage_times={"detect": detect_time, "classify": t1 - t0, "track": t2 - t1, "count": t3 - t2},
+        )
+        return batch, result
+
+    def _render(
+        self, frame: np.ndarray, strawberries: DetectionBatch, result: PipelineResult | None = None
+    ) -> np.ndarray:
+        """Visualization adımı."""
+        t0 = time.perf_counter()
+        drawn = self.visualizer.draw(frame, strawberries)
+        if result is not None:
+            result.stage_times["visualize"] = time.perf_counter() - t0
+        return drawn
+
+    def _finalize(
+        self, result: PipelineResult, start_time: float, strawberries: DetectionBatch | None = None
+    ) -> PipelineResult:
+        """İşlem süresini sonuca yazar, metrikleri günceller ve sonucu sink'e bırakır."""
+        result.processing_time = time.perf_counter() - start_time
+        self._total_processing_time += result.processing_time
+        self.latency.record(result.stage_times)
+        if self.results_sink is not None and strawberries is not None:
+            self.results_sink.submit(self.source, result, strawberries)
+        
+        if self.enable_logging:
+            logger.info(f"Frame {result.frame_processed}: {result.total} strawberries, {result.processing_time:.3f}s")
+        
+        return result
+
+    def _error_result(self, error: Exception, processing_time: float) -> PipelineResult:
+        logger.error(f"Pipeline error on frame {self._frame_count}: {error}")
+        return PipelineResult(
+            counts={},
+            total=0,
+            processing_time=processing_time,
+            frame_processed=self._frame_count,
+            error=str(error) or type(error).__name__,
+        )
     
     def get_metrics(self) -> Dict[str, any]:
         """Pipeline metriklerini döndürür."""
         avg_time = self._total_processing_time / self._frame_count if self._frame_count > 0 else 0.0
         return {
             "total_frames": self._frame_count,
-            "total_time": round(self._total_processing_time, 3),
-            "avg_time_per_frame": round(avg_time, 3),
+            "total_time": round(self._total_processing_time, 6),
+            "avg_time_per_frame": round(avg_time, 6),
             "fps": round(1.0 / avg_time, 2) if avg_time > 0 else 0.0,
             "total_tracked": self.tracker.total_tracked,
+            "active_tracks": getattr(self.tracker, "active_tracks", 0),
+            "finished_tracks": getattr(self.tracker, "finished_tracks", 0),
+            "dropped_tracks": getattr(self.tracker, "dropped_tracks", 0),
+            "tracker_memory_bytes": getattr(self.tracker, "memory_bytes", 0),
+            "skipped_frames": self._skipped_frames,
+            "skip_ratio": round(self._skipped_frames / self._frame_count, 3) if self._frame_count > 0 else 0.0,
+            "predicted_frames": self._predicted_frames,
+            "stages": self.latency.summary(),
+            "detections_by_class": dict(self._class_counts),
+            "dropped_frames": self._dropped_frames,
+            "imgsz": getattr(self.detector, "imgsz", None),
+            "detect_stride": self.detect_stride,
+            "adjustment_count": self._adjustment_count,
+            "adjustments": list(self._adjustments),
+            "unique_counts": self.unique_counter.counts() if self.unique_counter is not None else {},
+            "windows": self.counter.get_window_statistics(),
+            "results_dropped": getattr(self.results_sink, "dropped", 0),
         }
+
+    def record_dropped(self, count: int = 1) -> None:
+        """Pipeline'a ulaşmadan atılan frame'leri kaydeder (ör. latest-frame-wins)."""
+        self._dropped_frames += count
     
+    def record_adjustment(self, knob: str, old, new, **details) -> None:
+        """Çalışma sırasında yapılan ayar değişikliğini (ör. imgsz, stride) metriklere kaydeder."""
+        entry = {"frame": self._frame_count, "time": time.time(), "knob": knob, "from": old, "to": new, **details}
+        self._adjustments.append(entry)
+        self._adjustment_count += 1
+        if self.enable_logging:
+            logger.info(f"Adjusted {knob}: {old} -> {new} {details}")
+
+    def close(self) -> None:
+        """Registry'den alınan detector referansını bırakır."""
+        if self._owned_detector is not None:
+            self._owned_detector.release()
+            self._owned_detector = None
+
     def reset(self) -> None:
         """Pipeline durumunu sıfırlar."""
         self._frame_count = 0
         self._total_processing_time = 0.0
+        self._skipped_frames = 0
+        self._predicted_frames = 0
+        self._last_detections = None
+        self.latency.reset()
+        self._class_counts.clear()
+        self._dropped_frames = 0
+        self._frames_since_detect = 0
+        self._adjustments.clear()
+        self._adjustment_count = 0
+        if self.motion_gate is not None:
+            self.motion_gate.reset()
         self.tracker.reset()
+        self.counter.reset()
+        if self.unique_counter is not None:
+            self.unique_counter.reset()
         if self.enable_logging:
             logger.info("Pipeline reset")
@@ -0,0 +1,182 @@
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, Iterator
+import logging
+import queue
+import threading
+import time
+
+import numpy as np
+
+from strawberry_vision.application.adaptive import AdaptiveController
+from strawberry_vision.application.pipeline import InferencePipeline, PipelineResult
+from strawberry_vision.domain.batch import DetectionBatch
+
+logger = logging.getLogger(__name__)
+
+_END = object()
+
+
+@dataclass
+class _FrameTask:
+    """Aşamalar arasında taşınan frame durumu."""
+    frame: np.ndarray
+    start_time: float = 0.0
+    detections: DetectionBatch | None = None
+    strawberries: DetectionBatch | None = None
+    result: PipelineResult | None = None
+    error: Exception | None = None
+    skipped: bool = False
+    detect_time: float = 0.0
+
+
+class StreamingPipeline:
+    """Aşamalı (staged) producer/consumer pipeline.
+
+    decode → detect → postprocess → draw aşamalarının her biri kendi thread'inde
+    çalışır ve aşamalar sınırlı (bounded) kuyruklarla bağlanır. Kuyruk dolduğunda
+    üreten aşama bekler (backpressure). Her aşamada tek worker olduğu için frame
+    sırası korunur. cv2 decode, model inference ve cv2 çizimi GIL'i bıraktığından
+    çok çekirdekli CPU'da I/O ile hesaplama örtüşür.
+
+    `controller` verilirse her sonuç kaynak sırasıyla ona gözlemletilir;
+    görüntü boyutu ve stride değişiklikleri detect aşamasının sonraki
+    frame'lerinde geçerli olur.
+    """
+
+    STAGES = ("decode", "detect", "postprocess", "draw")
+
+    def __init__(
+        self,
+        pipeline: InferencePipeline,
+        queue_size: int = 4,
+        poll_interval: float = 0.1,
+        controller: AdaptiveController | None = None,
+    ) -> None:
+        if queue_size < 1:
+            raise ValueError(f"queue_size must be >= 1, got {queue_size}")
+        if controller is not None and controller.pipeline is not pipeline:
+            raise ValueError("controller must control the streamed pipeline")
+        self.pipeline = pipeline
+        self.controller = controller
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+        self._queues: Dict[str, queue.Queue] = {}
+        self._max_depths: Dict[str, int] = dict.fromkeys(self.STAGES, 0)
+        self._stop = threading.Event()
+
+    def run(self, source: Iterable[np.ndarray]) -> Iterator[PipelineResult]:
+        """Kaynaktaki frame'leri aşamalı olarak işler.
+
+        Args:
+            source: Frame üreten kaynak (ImageSource, VideoSource, CameraSource, liste...)
+
+        Yields:
+            Kaynak sırasıyla pipeline sonuçları
+        """
+        self._stop.clear()
+        self._queues = {stage: queue.Queue(maxsize=self.queue_size) for stage in self.STAGES}
+        self._max_depths = dict.fromkeys(self.STAGES, 0)
+
+        threads = [
+            threading.Thread(target=self._decode_worker, args=(source,), name="sv-decode", daemon=True),
+            threading.Thread(target=self._stage_worker, args=("decode", "detect", self._detect), name="sv-detect", daemon=True),
+            threading.Thread(target=self._stage_worker, args=("detect", "postprocess", self._postprocess), name="sv-postprocess", daemon=True),
+            threading.Thread(target=self._stage_worker, args=("postprocess", "draw", self._draw), name="sv-draw", daemon=True),
+        ]
+        for t in threads:
+            t.start()
+
+        try:
+            while True:
+                task = self._get("draw")
+                if task is _END:
+                    break
+                if self.controller is not None:
+                    self.controller.observe(task.result)
+                yield task.result
+        finally:
+            # Tüketici erken bırakırsa da worker'lar durdurulur
+            self._stop.set()
+            for t in threads:
+                t.join(timeout=max(1.0, self.poll_interval * 10))
+
+    def queue_depths(self) -> Dict[str, int]:
+        """Her aşamanın çıkış kuyruğundaki bekleyen frame sayısını döndürür."""
+        return {stage: q.qsize() for stage, q in self._queues.items()}
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Pipeline metriklerine kuyruk derinliklerini ekler."""
+        metrics = self.pipeline.get_metrics()
+        metrics["queue_depths"] = self.queue_depths()
+        metrics["max_queue_depths"] = dict(self._max_depths)
+        return metrics
+
+    def _decode_worker(self, source: Iterable[np.ndarray]) -> None:
+        try:
+            for frame in source:
+                if not self._put("decode", _FrameTask(frame=frame)):
+                    return
+        except Exception as e:
+            logger.error(f"Source error in streaming pipeline: {e}")
+        self._put("decode", _END)
+
+    def _stage_worker(self, in_stage: str, out_stage: str, handler) -> None:
+        while True:
+            task = self._get(in_stage)
+            if task is _END:
+                self._put(out_stage, _END)
+                return
+            handler(task)
+            if not self._put(out_stage, task):
+                return
+
+    def _detect(self, task: _FrameTask) -> None:
+        task.start_time = time.perf_counter()
+        try:
+            task.detections, task.skipped, task.detect_time = self.pipeline._detect(task.frame)
+        except Exception as e:
+            task.error = e
+
+    def _postprocess(self, task: _FrameTask) -> None:
+        self.pipeline._frame_count += 1
+        if task.error is None:
+            try:
+                task.strawberries, task.result = self.pipeline._postprocess(
+                    task.frame, task.detections, task.skipped, task.detect_time
+                )
+                return
+            except Exception as e:
+                task.error = e
+        task.result = self.pipeline._error_result(task.error, time.perf_counter() - task.start_time)
+
+    def _draw(self, task: _FrameTask) -> None:
+        if task.error is not None:
+            return
+        try:
+            self.pipeline._render(task.frame, task.strawberries, task.result)
+            self.pipeline._finalize(task.result, task.start_time, task.strawberries)
+        except Exception as e:
+            task.error = e
+            task.result = self.pipeline._error_result(e, time.perf_counter() - task.start_time)
+
+    def _put(self, stage: str, item: object) -> bool:
+        q = self._queues[stage]
+        while not self._stop.is_set():
+            try:
+                q.put(item, timeout=self.poll_interval)
+            except queue.Full:
+                continue
+            depth = q.qsize()
+            if depth > self._max_depths[stage]:
+                self._max_depths[stage] = depth
+            return True
+        return False
+
+    def _get(self, stage: str) -> object:
+        q = self._queues[stage]
+        while not self._stop.is_set():
+            try:
+                return q.get(timeout=self.poll_interval)
+            except queue.Empty:
+                continue
+        return _END
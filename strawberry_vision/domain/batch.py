@@ -0,0 +1,196 @@
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from .entities import Detection, Ripeness, Strawberry
+
+# Olgunluk kodu → Ripeness (DetectionBatch.ripeness bu sırayı kullanır)
+RIPENESS_LEVELS: Tuple[Ripeness, ...] = (Ripeness.RIPE, Ripeness.SEMI_RIPE, Ripeness.UNRIPE)
+RIPENESS_CODES = {level: code for code, level in enumerate(RIPENESS_LEVELS)}
+UNTRACKED = -1
+
+
+def _view(cls, **fields):
+    """Doğrulamayı atlayarak dataclass örneği oluşturur (batch zaten doğrulanmıştır)."""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(fields)
+    return obj
+
+
+@dataclass(eq=False)
+class DetectionBatch:
+    """Bir frame'in tespitlerini sütun (struct-of-arrays) düzeninde tutar.
+
+    Sıcak yolda kutu başına `Detection`/`Strawberry` nesnesi oluşturmak yerine
+    tüm alanlar NumPy dizilerinde tutulur ve doğrulama tek seferde yapılır.
+    `Detection` ve `Strawberry` nesneleri yalnızca istenirken satırlardan üretilir.
+
+    Attributes:
+        bboxes: (N, 4) int64 bounding box'lar (x, y, width, height)
+        scores: (N,) float64 güven skorları (0.0-1.0)
+        class_ids: (N,) int64 sınıf indeksleri (`class_names` içinde)
+        class_names: Sınıf indeksi → etiket tablosu
+        ripeness: (N,) int8 olgunluk kodları (`RIPENESS_LEVELS` sırası)
+        track_ids: (N,) int64 takip ID'leri (-1 ise henüz atanmamış)
+    """
+    bboxes: np.ndarray
+    scores: np.ndarray
+    class_ids: np.ndarray
+    class_names: Tuple[str, ...] = ()
+    ripeness: np.ndarray | None = None
+    track_ids: np.ndarray | None = None
+    _labels: np.ndarray | None = field(default=None, repr=False)
+
+    def __post_init__(self) -> None:
+        """Dizileri normalize eder ve vektörel validation uygular."""
+        self.bboxes = np.asarray(self.bboxes, dtype=np.int64).reshape(-1, 4)
+        n = len(self.bboxes)
+        self.scores = np.asarray(self.scores, dtype=np.float64).reshape(n)
+        self.class_ids = np.asarray(self.class_ids, dtype=np.int64).reshape(n)
+        self.class_names = tuple(self.class_names)
+        if self.ripeness is None:
+            self.ripeness = np.full(n, RIPENESS_CODES[Ripeness.UNRIPE], dtype=np.int8)
+        else:
+            self.ripeness = np.asarray(self.ripeness, dtype=np.int8).reshape(n)
+        if self.track_ids is None:
+            self.track_ids = np.full(n, UNTRACKED, dtype=np.int64)
+        else:
+            self.track_ids = np.asarray(self.track_ids, dtype=np.int64).reshape(n)
+        self.validate()
+
+    def validate(self) -> None:
+        """`Detection` ile aynı kuralları tüm satırlara tek seferde uygular."""
+        bad_score = (self.scores < 0.0) | (self.scores > 1.0) | np.isnan(self.scores)
+        if bad_score.any():
+            raise ValueError(f"Score must be between 0 and 1, got {self.scores[bad_score][0]}")
+        bad_bbox = (self.bboxes < 0).any(axis=1)
+        if bad_bbox.any():
+            raise ValueError(f"Bbox values must be non-negative, got {tuple(self.bboxes[bad_bbox][0].tolist())}")
+        bad_code = (self.ripeness < 0) | (self.ripeness >= len(RIPENESS_LEVELS))
+        if bad_code.any():
+            raise ValueError(f"Unknown ripeness code: {int(self.ripeness[bad_code][0])}")
+
+    @classmethod
+    def empty(cls, class_names: Sequence[str] = ()) -> "DetectionBatch":
+        return cls(np.empty((0, 4), dtype=np.int64), np.empty(0), np.empty(0, dtype=np.int64), tuple(class_names))
+
+    @classmethod
+    def from_xyxy(
+        cls,
+        boxes: np.ndarray,
+        scores: np.ndarray,
+        class_ids: np.ndarray,
+        class_names: Sequence[str] = (),
+    ) -> "DetectionBatch":
+        """(x1, y1, x2, y2) kutulardan batch oluşturur; koordinatlar int() gibi sıfıra doğru kesilir."""
+        boxes = np.asarray(boxes).reshape(-1, 4)
+        xywh = np.empty((len(boxes), 4), dtype=np.int64)
+        xywh[:, :2] = boxes[:, :2].astype(np.int64)
+        xywh[:, 2:] = (boxes[:, 2:] - boxes[:, :2]).astype(np.int64)
+        return cls(xywh, scores, class_ids, tuple(class_names))
+
+    @classmethod
+    def from_detections(
+        cls, detections: Iterable[Detection], class_names: Sequence[str] = ()
+    ) -> "DetectionBatch":
+        """Detection listesinden batch oluşturur; bilinmeyen etiketler tabloya eklenir."""
+        detections = list(detections)
+        names = list(class_names)
+        index = {name: i for i, name in enumerate(names)}
+        class_ids = []
+        for det in detections:
+            if det.label not in index:
+                index[det.label] = len(names)
+                names.append(det.label)
+            class_ids.append(index[det.label])
+        return cls(
+            [det.bbox for det in detections] or np.empty((0, 4), dtype=np.int64),
+            [det.score for det in detections],
+            class_ids,
+            tuple(names),
+        )
+
+    @classmethod
+    def from_strawberries(cls, strawberries: Iterable[Strawberry]) -> "DetectionBatch":
+        """Strawberry listesinden (olgunluk ve takip ID'leriyle) batch oluşturur."""
+        strawberries = list(strawberries)
+        batch = cls.from_detections(s.detection for s in strawberries)
+        batch.ripeness[:] = [RIPENESS_CODES[s.ripeness] for s in strawberries]
+        batch.track_ids[:] = [UNTRACKED if s.id is None else s.id for s in strawberries]
+        return batch
+
+    def __len__(self) -> int:
+        return len(self.bboxes)
+
+    def __iter__(self) -> Iterator[Strawberry]:
+        return iter(self.to_strawberries())
+
+    def copy(self) -> "DetectionBatch":
+        return _view(
+            DetectionBatch,
+            bboxes=self.bboxes.copy(),
+            scores=self.scores.copy(),
+            class_ids=self.class_ids.copy(),
+            class_names=self.class_names,
+            ripeness=self.ripeness.copy(),
+            track_ids=self.track_ids.copy(),
+            _labels=self._labels,
+        )
+
+    @property
+    def labels(self) -> np.ndarray:
+        """Satır başına etiket dizisi (tablo dışı sınıf ID'leri sayı olarak yazılır)."""
+        return self._labels_for(self.class_ids)
+
+    def _labels_for(self, class_ids: np.ndarray) -> np.ndarray:
+        if self._labels is None or len(self._labels) != len(self.class_names):
+            self._labels = np.array(self.class_names, dtype=object)
+        labels = np.empty(len(class_ids), dtype=object)
+        known = (class_ids >= 0) & (class_ids < len(self._labels))
+        labels[known] = self._labels[class_ids[known]]
+        if not known.all():
+            labels[~known] = [str(c) for c in class_ids[~known].tolist()]
+        return labels
+
+    @property
+    def tracked(self) -> np.ndarray:
+        """Takip ID'si atanmış satırların maskesi."""
+        return self.track_ids != UNTRACKED
+
+    def label_counts(self) -> Dict[str, int]:
+        """Etiket başına tespit sayısı."""
+        ids, counts = np.unique(self.class_ids, return_counts=True)
+        return dict(zip(self._labels_for(ids).tolist(), counts.tolist()))
+
+    def detection(self, i: int) -> Detection:
+        """i. satırın `Detection` görünümü."""
+        i = range(len(self))[i]
+        return _view(Detection, bbox=tuple(self.bboxes[i].tolist()), score=float(self.scores[i]), label=self.labels[i])
+
+    def strawberry(self, i: int) -> Strawberry:
+        """i. satırın `Strawberry` görünümü."""
+        i = range(len(self))[i]
+        return self._strawberry_view(self.detection(i), int(self.ripeness[i]), int(self.track_ids[i]))
+
+    def to_detections(self) -> List[Detection]:
+        """Satırları `Detection` nesnelerine çevirir (yeniden doğrulama yapılmaz)."""
+        return [
+            _view(Detection, bbox=tuple(bbox), score=score, label=label)
+            for bbox, score, label in zip(self.bboxes.tolist(), self.scores.tolist(), self.labels.tolist())
+        ]
+
+    def to_strawberries(self) -> List[Strawberry]:
+        """Satırları `Strawberry` nesnelerine çevirir."""
+        return [
+            self._strawberry_view(det, code, track_id)
+            for det, code, track_id in zip(self.to_detections(), self.ripeness.tolist(), self.track_ids.tolist())
+        ]
+
+    @staticmethod
+    def _strawberry_view(det: Detection, code: int, track_id: int) -> Strawberry:
+        return Strawberry(
+            id=None if track_id == UNTRACKED else track_id,
+            detection=det,
+            ripeness=RIPENESS_LEVELS[code],
+        )
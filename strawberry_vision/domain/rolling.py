@@ -0,0 +1,76 @@
+import numpy as np
+
+
+class RollingWindow:
+    """Son `span` saniyedeki sayım vektörlerinin toplamı (halka tampon).
+
+    Pencere `buckets` eşit zaman kovasına bölünür; her kova o aralıkta eklenen
+    vektörlerin toplamını, `total` ise tüm kovaların toplamını tutar. Ekleme
+    yalnızca güncel kovayı ve toplamı günceller; süresi dolan kovalar zaman
+    ilerledikçe toplamdan çıkarılıp sıfırlanır. Böylece ekleme ve sorgu,
+    pencerede kaç frame olursa olsun O(1)'dir (kova sayısıyla sınırlı). Pencere
+    çözünürlüğü bir kovadır: toplam son `span - span / buckets` ile `span`
+    saniye arasını kapsar.
+
+    Args:
+        span: Pencere uzunluğu (saniye)
+        buckets: Zaman kovası sayısı
+        width: Sayım vektörünün uzunluğu
+    """
+
+    def __init__(self, span: float, buckets: int = 60, width: int = 1) -> None:
+        if span <= 0 or buckets <= 0:
+            raise ValueError(f"span and buckets must be positive, got {span}, {buckets}")
+        self.span = span
+        self.bucket_span = span / buckets
+        self._buckets = np.zeros((buckets, width), dtype=np.int64)
+        self._total = np.zeros(width, dtype=np.int64)
+        self._head: int | None = None
+
+    def _advance(self, timestamp: float) -> None:
+        """Güncel kovayı `timestamp`'e taşır; aradaki (süresi dolan) kovaları boşaltır."""
+        index = int(timestamp // self.bucket_span)
+        if self._head is None:
+            self._head = index
+            return
+        steps = index - self._head
+        if steps <= 0:
+            # Geriye giden saat güncel kovaya yazılır
+            return
+        n = len(self._buckets)
+        if steps >= n:
+            self._buckets[:] = 0
+            self._total[:] = 0
+        else:
+            for k in range(1, steps + 1):
+                slot = (self._head + k) % n
+                self._total -= self._buckets[slot]
+                self._buckets[slot] = 0
+        self._head = index
+
+    def add(self, vector: np.ndarray, timestamp: float) -> None:
+        self._advance(timestamp)
+        self._buckets[self._head % len(self._buckets)] += vector
+        self._total += vector
+
+    def total(self, timestamp: float | None = None) -> np.ndarray:
+        """Penceredeki toplam vektör; `timestamp` verilirse süresi dolan kovalar hariç tutulur.
+
+        Durumu değiştirmez: metrik thread'i `add` ile eşzamanlı okuyabilir.
+        """
+        head = self._head
+        total = self._total.copy()
+        if timestamp is None or head is None:
+            return total
+        steps = int(timestamp // self.bucket_span) - head
+        n = len(self._buckets)
+        if steps >= n:
+            return np.zeros_like(total)
+        for k in range(1, steps + 1):
+            total -= self._buckets[(head + k) % n]
+        return total
+
+    def reset(self) -> None:
+        self._buckets[:] = 0
+        self._total[:] = 0
+        self._head = None
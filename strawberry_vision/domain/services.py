@@ -1,75 +1,448 @@
 from collections import Counter
-from typing import Dict, List
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+import time
 
+import numpy as np
+
+from .batch import RIPENESS_LEVELS, UNTRACKED, DetectionBatch
 from .entities import Strawberry, Ripeness
+from .rolling import RollingWindow
+from .tracking import MATCHERS, KalmanBoxState, TrackStore, greedy_match, hungarian_match, iou_matrix, xywh_to_xyxy
+
+MOTION_MODELS = ("none", "kalman")
+
+# Liste veya sütun düzeninde (DetectionBatch) çilekler
+Strawberries = Union[List[Strawberry], DetectionBatch]
+
+CONFIDENCE_LEVELS = ("low", "medium", "high")
+CONFIDENCE_BINS = np.array([0.7, 0.9])
+
+# Sayım vektörü: olgunluk x güven ortak histogramı, ardından frame ve takip sayısı
+JOINT_BINS = len(RIPENESS_LEVELS) * len(CONFIDENCE_LEVELS)
+FRAMES_COLUMN = JOINT_BINS
+TRACKED_COLUMN = JOINT_BINS + 1
+STAT_WIDTH = JOINT_BINS + 2
+
+# Varsayılan kayan pencereler (saniye)
+DEFAULT_WINDOWS = {"minute": 60.0, "hour": 3600.0, "day": 86400.0}
 
 
 class TrackingService:
-    """Çilek takip servisi.
-    
-    Her çileğe benzersiz ID atar ve frame'ler arası takibi sağlar.
-    Basit ID atama stratejisi kullanır (gelişmiş tracking için ByteTrack/DeepSORT entegre edilebilir).
+    """Çilek takip servisi (IoU tabanlı, frame'den frame'e).
+
+    Aktif track'lerin son kutuları tutulur. Her frame'de track'ler ile
+    tespitler arasındaki IoU matrisi tek seferde (broadcasting) hesaplanır ve
+    açgözlü (varsayılan) veya Hungarian eşleştirme ile atanır. Eşleşmeyen
+    tespitler yeni track başlatır; `min_hits` kez görülen track onaylanır ve
+    ID alır (onaylanmamış track'lerin tespitleri takipsiz kalır). `max_age`
+    frame boyunca eşleşmeyen onaylı track'ler, ilk kaçırmada ise onaylanmamış
+    track'ler silinir.
+
+    Track'ler sabit kapasiteli bir `TrackStore`'da tutulur; silinen track'in
+    slotu yeni track'lere verilir, böylece 7/24 akışlarda bellek sabit kalır.
+    Depo dolduğunda en uzun süredir görülmeyen track'ler erkenden silinir,
+    yine yer kalmazsa fazla tespitler takipsiz bırakılır (`dropped_tracks`).
+    Biten onaylı track'lerin kayıtları (`TRACK_RECORD_DTYPE`) verilirse `spill`
+    çağrısına aktarılır (ör. diske yazan `TrackArchive`).
+
+    Zaten ID'si olan çilekler (ör. dışarıda takip edilenler) olduğu gibi
+    bırakılır; yalnızca ID'si olmayanlar takip edilir.
+
+    Batch'lerin sınıf ID'leri kendi `class_names` tablolarına göredir (listeden
+    kurulan batch'lerde frame'e özgü); `assign_ids` bunları servisin sabit
+    etiket tablosuna çevirir, böylece sınıfa duyarlı eşleştirme frame'ler
+    arasında etiketleri karşılaştırır.
+
+    `motion="kalman"` ile her track sabit hızlı bir Kalman durumu taşır:
+    eşleştirme tahmin edilen kutularla yapılır ve detector'ün çalışmadığı
+    frame'lerde `predict()` track'leri ilerletip tahmini kutuları döndürür.
+
+    Args:
+        iou_threshold: Eşleşme için en düşük IoU
+        max_age: Onaylı track'in silinmeden önce kaçırabileceği frame sayısı (TTL)
+        min_hits: Track'in ID alması için gereken eşleşme sayısı
+        matcher: "greedy" veya "hungarian" (scipy gerekir)
+        class_aware: Yalnızca aynı sınıftaki track ve tespitleri eşleştir
+        motion: "none" (son kutu) veya "kalman" (sabit hızlı tahmin)
+        capacity: Aynı anda tutulabilecek en fazla track sayısı
+        spill: Biten onaylı track kayıtlarını alan çağrı (records dizisi)
     """
-    
-    def __init__(self) -> None:
+
+    def __init__(
+        self,
+        iou_threshold: float = 0.3,
+        max_age: int = 5,
+        min_hits: int = 1,
+        matcher: str = "greedy",
+        class_aware: bool = True,
+        motion: str = "none",
+        capacity: int = 4096,
+        spill: Callable[[np.ndarray], None] | None = None,
+    ) -> None:
+        if matcher not in MATCHERS:
+            raise ValueError(f"Unknown matcher: {matcher} (expected one of {MATCHERS})")
+        if motion not in MOTION_MODELS:
+            raise ValueError(f"Unknown motion model: {motion} (expected one of {MOTION_MODELS})")
+        self.iou_threshold = iou_threshold
+        self.max_age = max_age
+        self.min_hits = max(1, min_hits)
+        self.matcher = matcher
+        self.class_aware = class_aware
+        self.motion = motion
+        self.spill = spill
+        self._match = greedy_match if matcher == "greedy" else hungarian_match
+        self._store = TrackStore(capacity)
+        self._kalman = KalmanBoxState(capacity) if motion == "kalman" else None
+        # Etiket → sabit sınıf ID'si (store.classes bu tabloya göredir)
+        self._class_index: Dict[str, int] = {}
+        self._reset_counters()
+
+    def _reset_counters(self) -> None:
         self._next_id = 1
         self._tracked_count = 0
+        self._frame = 0
+        self._finished = 0
+        self._dropped = 0
+
+    @property
+    def predicts(self) -> bool:
+        """Detector'süz frame'lerde hareket tahmini yapılıyor mu."""
+        return self._kalman is not None
 
-    def assign_ids(self, strawberries: List[Strawberry]) -> List[Strawberry]:
-        """Çileklere ID atar.
+    @property
+    def class_names(self) -> Tuple[str, ...]:
+        """Sabit sınıf ID'si → etiket tablosu."""
+        return tuple(self._class_index)
+
+    def _class_codes(self, batch: DetectionBatch) -> np.ndarray:
+        """Batch'in sınıf ID'lerini sabit etiket tablosuna çevirir (yeni etiketler eklenir)."""
+        if not batch.class_names:
+            return batch.class_ids
+        for name in batch.class_names:
+            self._class_index.setdefault(name, len(self._class_index))
+        lookup = np.array([self._class_index[name] for name in batch.class_names], dtype=np.int64)
+        return lookup[batch.class_ids]
+
+    def assign_ids(self, strawberries: Strawberries) -> Strawberries:
+        """Çilekleri aktif track'lerle eşleştirip ID atar.
         
         Args:
-            strawberries: ID atanacak çilek listesi
+            strawberries: ID atanacak çilek listesi veya DetectionBatch
             
         Returns:
-            ID'leri atanmış çilek listesi
+            ID'leri atanmış çilek listesi (batch verildiyse aynı batch)
         """
-        for s in strawberries:
-            if s.id is None:
-                s.id = self._next_id
-                self._next_id += 1
-                self._tracked_count += 1
+        if isinstance(strawberries, DetectionBatch):
+            new = ~strawberries.tracked
+            strawberries.track_ids[new] = self.update(
+                strawberries.bboxes[new], self._class_codes(strawberries)[new], strawberries.scores[new]
+            )
+            return strawberries
+        pending = [s for s in strawberries if s.id is None]
+        batch = DetectionBatch.from_detections(s.detection for s in pending)
+        for s, track_id in zip(pending, self.update(batch.bboxes, self._class_codes(batch), batch.scores).tolist()):
+            s.id = None if track_id == UNTRACKED else track_id
         return strawberries
 
+    def update(
+        self, bboxes: np.ndarray, class_ids: np.ndarray | None = None, scores: np.ndarray | None = None
+    ) -> np.ndarray:
+        """Bir frame'in kutularıyla track'leri günceller.
+
+        Args:
+            bboxes: (N, 4) x, y, w, h kutular
+            class_ids: (N,) frame'ler arasında sabit sınıf ID'leri (verilmezse hepsi aynı sınıf)
+            scores: (N,) güven skorları (tahmini frame'lerde kullanılır)
+
+        Returns:
+            (N,) track ID'leri; onaylanmamış veya depoya sığmayan tespitler için UNTRACKED (-1)
+        """
+        boxes = xywh_to_xyxy(bboxes)
+        n = len(boxes)
+        class_ids = np.zeros(n, dtype=np.int64) if class_ids is None else np.asarray(class_ids, dtype=np.int64)
+        scores = np.ones(n) if scores is None else np.asarray(scores, dtype=np.float64)
+        store = self._store
+        self._frame += 1
+        active = store.active()
+        if self._kalman is not None:
+            self._advance(active)
+
+        iou = iou_matrix(store.boxes[active], boxes)
+        if self.class_aware and iou.size:
+            iou[store.classes[active][:, None] != class_ids[None, :]] = 0.0
+        rows, cols = self._match(iou, self.iou_threshold)
+
+        # Eşleşen track'ler yeni kutuya taşınır; eşleşmeyenlerin kaçırma sayısı artar
+        matched = active[rows]
+        store.misses[active] += 1
+        store.boxes[matched] = boxes[cols]
+        store.scores[matched] = scores[cols]
+        store.hits[matched] += 1
+        store.misses[matched] = 0
+        store.last_frame[matched] = self._frame
+        if self._kalman is not None:
+            self._kalman.update(matched, boxes[cols])
+
+        # Süresi dolan track'ler (TTL) yeni doğanlardan önce silinir ki slotları yeniden kullanılsın
+        tentative = store.ids[active] == UNTRACKED
+        expired = np.where(tentative, store.misses[active] > 0, store.misses[active] > self.max_age)
+        self._finish(active[expired])
+
+        # Eşleşmeyen tespitler yeni (onaylanmamış) track başlatır
+        born = np.ones(n, dtype=bool)
+        born[cols] = False
+        born = np.flatnonzero(born)
+        slots = self._allocate(len(born))
+        born = born[: len(slots)]
+        store.boxes[slots] = boxes[born]
+        store.scores[slots] = scores[born]
+        store.classes[slots] = class_ids[born]
+        store.hits[slots] = 1
+        store.misses[slots] = 0
+        store.first_frame[slots] = self._frame
+        store.last_frame[slots] = self._frame
+        if self._kalman is not None:
+            self._kalman.init(slots, boxes[born])
+        track_of = np.full(n, -1, dtype=np.int64)
+        track_of[cols] = matched
+        track_of[born] = slots
+
+        # Yeterince görülen track'ler tespit sırasıyla ID alır
+        seen = track_of >= 0
+        hit = track_of[seen]
+        confirmed = hit[(store.ids[hit] == UNTRACKED) & (store.hits[hit] >= self.min_hits)]
+        count = len(confirmed)
+        store.ids[confirmed] = np.arange(self._next_id, self._next_id + count)
+        self._next_id += count
+        self._tracked_count += count
+
+        ids = np.full(n, UNTRACKED, dtype=np.int64)
+        ids[seen] = store.ids[hit]
+        return ids
+
+    def _allocate(self, count: int) -> np.ndarray:
+        """Yeni track'ler için slot ayırır; depo doluysa en eski görülen track'leri siler."""
+        store = self._store
+        shortage = count - store.free
+        if shortage > 0:
+            active = store.active()
+            stale = active[store.misses[active] > 0]
+            oldest = stale[np.argsort(-store.misses[stale], kind="stable")[:shortage]]
+            self._finish(oldest)
+        slots = store.allocate(count)
+        if len(slots) < count:
+            self._dropped += count - len(slots)
+        return slots
+
+    def _finish(self, slots: np.ndarray) -> None:
+        if not len(slots):
+            return
+        records = self._store.release(slots)
+        self._finished += len(records)
+        if self.spill is not None and len(records):
+            self.spill(records)
+
+    def _advance(self, active: np.ndarray) -> None:
+        self._kalman.predict(active)
+        self._store.boxes[active] = self._kalman.boxes(active)
+
+    def predict(self, class_names: Sequence[str] = (), frame_hw: Tuple[int, int] | None = None) -> DetectionBatch:
+        """Detector çalışmayan frame için track'leri bir frame ilerletir.
+
+        Son tespitte görülen onaylı track'lerin (tahmini) kutuları, son skorları
+        ve ID'leriyle batch döner. Kalman yoksa kutular son ölçümde kalır.
+        Kaçırma sayaçları değişmez; track ömrü yalnızca tespit yapılan
+        frame'lerde ilerler.
+
+        Args:
+            class_names: Sınıf isimleri tablosu (servis etiketleri görmediyse, ör. doğrudan `update`)
+            frame_hw: Verilirse kutular frame sınırlarına kırpılır
+        """
+        store = self._store
+        active = store.active()
+        if self._kalman is not None:
+            self._advance(active)
+        visible = active[(store.ids[active] != UNTRACKED) & (store.misses[active] == 0)]
+        boxes = store.boxes[visible]
+        if frame_hw is not None:
+            boxes = boxes.clip(0, [frame_hw[1], frame_hw[0], frame_hw[1], frame_hw[0]])
+        else:
+            boxes = np.maximum(boxes, 0.0)
+        xywh = np.round(np.concatenate([boxes[:, :2], boxes[:, 2:] - boxes[:, :2]], axis=1)).astype(np.int64)
+        return DetectionBatch(
+            np.maximum(xywh, 0),
+            store.scores[visible],
+            store.classes[visible],
+            self.class_names or tuple(class_names),
+            track_ids=store.ids[visible],
+        )
+
+    def flush(self) -> None:
+        """Tüm aktif track'leri bitirir; onaylı olanlar `spill`'e aktarılır (ör. akış sonunda)."""
+        self._finish(self._store.active())
+
     def reset(self) -> None:
         """Tracking durumunu sıfırlar."""
-        self._next_id = 1
-        self._tracked_count = 0
+        self._store.clear()
+        self._class_index.clear()
+        self._reset_counters()
 
     @property
     def total_tracked(self) -> int:
-        """Toplam takip edilen çilek sayısını döndürür."""
+        """Toplam takip edilen (onaylanmış) çilek sayısını döndürür."""
         return self._tracked_count
 
+    @property
+    def active_tracks(self) -> int:
+        """Şu anda bellekte tutulan track sayısı (onaylanmamışlar dahil)."""
+        return len(self._store)
+
+    @property
+    def capacity(self) -> int:
+        return self._store.capacity
+
+    @property
+    def finished_tracks(self) -> int:
+        """Silinen (TTL, kapasite veya flush) onaylı track sayısı."""
+        return self._finished
+
+    @property
+    def dropped_tracks(self) -> int:
+        """Depo dolu olduğu için takip edilemeyen tespit sayısı."""
+        return self._dropped
+
+    @property
+    def memory_bytes(self) -> int:
+        """Track durumunun (depo ve Kalman dizileri) bellek kullanımı; kapasiteyle sabittir."""
+        return self._store.nbytes + (self._kalman.nbytes if self._kalman is not None else 0)
+
 
 class CountingService:
     """Çilek sayım servisi.
     
     Olgunluk durumuna göre çilekleri sayar ve istatistik üretir.
+
+    `observe` bir frame'in tüm istatistiklerini (olgunluk, güven seviyesi,
+    takip) olgunluk x güven ortak kodları üzerinde tek `np.bincount` ile
+    çıkarır ve sonucu kayan zaman pencerelerine (varsayılan son dakika, saat ve
+    gün) ekler. Pencereler `RollingWindow` halka tamponlarıdır: frame başına
+    güncelleme ve sorgu O(1)'dir, `get_window_statistics` ile her an okunabilir.
+
+    Args:
+        windows: Pencere adı → uzunluk (saniye); None ise `DEFAULT_WINDOWS`
+        buckets: Pencere başına zaman kovası sayısı (çözünürlük = uzunluk / kova)
+        clock: Zaman damgası verilmediğinde kullanılan saat (saniye)
     """
-    
-    def count_by_ripeness(self, strawberries: List[Strawberry]) -> Dict[str, int]:
+
+    def __init__(
+        self,
+        windows: Dict[str, float] | None = None,
+        buckets: int = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.clock = clock
+        self.windows = {
+            name: RollingWindow(span, buckets, width=STAT_WIDTH)
+            for name, span in (DEFAULT_WINDOWS if windows is None else windows).items()
+        }
+        self._cumulative = np.zeros(STAT_WIDTH, dtype=np.int64)
+
+    @staticmethod
+    def _frame_vector(batch: DetectionBatch) -> np.ndarray:
+        """Frame'in sayım vektörü: olgunluk x güven ortak histogramı, frame ve takip sayısı."""
+        # searchsorted(side="right") = np.digitize (artan eşikler), daha az ek yükle
+        levels = CONFIDENCE_BINS.searchsorted(batch.scores, side="right")
+        joint = batch.ripeness * len(CONFIDENCE_LEVELS) + levels
+        vector = np.bincount(joint, minlength=STAT_WIDTH).astype(np.int64, copy=False)
+        vector[FRAMES_COLUMN] = 1
+        vector[TRACKED_COLUMN] = np.count_nonzero(batch.track_ids != UNTRACKED)
+        return vector
+
+    @staticmethod
+    def _statistics(vector: np.ndarray, frames: bool = False) -> Dict[str, any]:
+        """Sayım vektöründen `get_statistics` biçiminde sözlük (sıfırlar hariç)."""
+        # 9 elemanlı vektörde marjinaller Python listesiyle NumPy çağrılarından ucuzdur
+        values = vector.tolist()
+        k = len(CONFIDENCE_LEVELS)
+        by_ripeness = [sum(values[i * k : (i + 1) * k]) for i in range(len(RIPENESS_LEVELS))]
+        by_confidence = [sum(values[j:JOINT_BINS:k]) for j in range(k)]
+        statistics = {
+            "total": sum(by_ripeness),
+            "by_ripeness": {level.value: n for level, n in zip(RIPENESS_LEVELS, by_ripeness) if n},
+            "by_confidence": {name: n for name, n in zip(CONFIDENCE_LEVELS, by_confidence) if n},
+            "tracked": values[TRACKED_COLUMN],
+        }
+        if frames:
+            statistics["frames"] = values[FRAMES_COLUMN]
+        return statistics
+
+    def observe(self, strawberries: Strawberries, timestamp: float | None = None) -> Dict[str, any]:
+        """Frame istatistiklerini tek geçişte hesaplar ve kayan pencerelere ekler.
+
+        Args:
+            strawberries: Frame'in çilekleri (liste veya DetectionBatch)
+            timestamp: Frame zamanı (saniye); verilmezse `clock()`
+
+        Returns:
+            `get_statistics` ile aynı sözlük (yalnızca bu frame)
+        """
+        batch = strawberries if isinstance(strawberries, DetectionBatch) else DetectionBatch.from_strawberries(strawberries)
+        vector = self._frame_vector(batch)
+        now = self.clock() if timestamp is None else timestamp
+        for window in self.windows.values():
+            window.add(vector, now)
+        self._cumulative += vector
+        return self._statistics(vector)
+
+    def get_window_statistics(self, timestamp: float | None = None) -> Dict[str, Dict[str, any]]:
+        """Pencere adı → o penceredeki istatistikler (frame sayısı dahil); `total` başlangıçtan beri."""
+        now = self.clock() if timestamp is None else timestamp
+        statistics = {name: self._statistics(window.total(now), frames=True) for name, window in self.windows.items()}
+        statistics["total"] = self._statistics(self._cumulative, frames=True)
+        return statistics
+
+    def reset(self) -> None:
+        """Kayan pencereleri ve toplamları sıfırlar."""
+        for window in self.windows.values():
+            window.reset()
+        self._cumulative[:] = 0
+
+    def count_by_ripeness(self, strawberries: Strawberries) -> Dict[str, int]:
         """Olgunluk durumuna göre çilekleri sayar.
         
         Args:
-            strawberries: Sayılacak çilek listesi
+            strawberries: Sayılacak çilek listesi veya DetectionBatch
             
         Returns:
             Olgunluk durumlarına göre sayım dictionary'si
         """
+        if isinstance(strawberries, DetectionBatch):
+            counts = np.bincount(strawberries.ripeness, minlength=len(RIPENESS_LEVELS))
+            return {level.value: int(n) for level, n in zip(RIPENESS_LEVELS, counts.tolist()) if n}
         c = Counter(s.ripeness.value for s in strawberries)
         return {k: int(v) for k, v in c.items()}
 
-    def count_total(self, strawberries: List[Strawberry]) -> int:
+    def count_total(self, strawberries: Strawberries) -> int:
         """Toplam çilek sayısını döndürür."""
         return len(strawberries)
 
-    def count_by_confidence(self, strawberries: List[Strawberry]) -> Dict[str, int]:
+    def count_by_confidence(self, strawberries: Strawberries) -> Dict[str, int]:
         """Güven seviyesine göre çilekleri sayar."""
+        if isinstance(strawberries, DetectionBatch):
+            # Strawberry.confidence_level ile aynı eşikler: <0.7 low, <0.9 medium, diğerleri high
+            levels = np.digitize(strawberries.scores, CONFIDENCE_BINS)
+            counts = np.bincount(levels, minlength=len(CONFIDENCE_LEVELS))
+            return {name: int(n) for name, n in zip(CONFIDENCE_LEVELS, counts.tolist()) if n}
         c = Counter(s.confidence_level() for s in strawberries)
         return {k: int(v) for k, v in c.items()}
 
-    def get_statistics(self, strawberries: List[Strawberry]) -> Dict[str, any]:
+    def count_tracked(self, strawberries: Strawberries) -> int:
+        """Takip ID'si atanmış çilek sayısını döndürür."""
+        if isinstance(strawberries, DetectionBatch):
+            return int(strawberries.tracked.sum())
+        return sum(1 for s in strawberries if s.is_tracked())
+
+    def get_statistics(self, strawberries: Strawberries) -> Dict[str, any]:
         """Detaylı istatistik üretir.
         
         Returns:
@@ -78,9 +451,12 @@ class CountingService:
             by_confidence: Güven seviyesine göre dağılım
             tracked: Takip edilen çilek sayısı
         """
+        if isinstance(strawberries, DetectionBatch):
+            # Tek bincount geçişi; pencerelere eklenmez (bkz. observe)
+            return self._statistics(self._frame_vector(strawberries))
         return {
             "total": self.count_total(strawberries),
             "by_ripeness": self.count_by_ripeness(strawberries),
             "by_confidence": self.count_by_confidence(strawberries),
-            "tracked": sum(1 for s in strawberries if s.is_tracked()),
+            "tracked": self.count_tracked(strawberries),
         }
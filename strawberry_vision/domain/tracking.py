@@ -0,0 +1,262 @@
+from typing import Tuple
+
+import numpy as np
+
+from ..lazy import LazyModule
+from .batch import UNTRACKED
+
+scipy_optimize = LazyModule("scipy.optimize")
+
+MATCHERS = ("greedy", "hungarian")
+
+
+def xywh_to_xyxy(boxes: np.ndarray) -> np.ndarray:
+    """(N, 4) x, y, w, h kutuları float64 x1, y1, x2, y2'ye çevirir."""
+    boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+    return np.concatenate([boxes[:, :2], boxes[:, :2] + boxes[:, 2:]], axis=1)
+
+
+def iou_matrix(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """(M, 4) ve (N, 4) xyxy kutular arasındaki (M, N) float32 IoU matrisi.
+
+    Koordinat sütunlarının dış (outer) min/max'ı ile hesaplanır; (M, N, 2)
+    ara diziler oluşturulmaz ve işlemler yerinde yapılır. Eşik karşılaştırması
+    için float32 hassasiyeti yeterlidir ve bellek trafiğini yarıya indirir.
+    """
+    if not len(a) or not len(b):
+        return np.zeros((len(a), len(b)), dtype=np.float32)
+    ax1, ay1, ax2, ay2 = np.asarray(a, dtype=np.float32).T
+    bx1, by1, bx2, by2 = np.asarray(b, dtype=np.float32).T
+    inter = np.minimum.outer(ax2, bx2)
+    inter -= np.maximum.outer(ax1, bx1)
+    np.maximum(inter, 0.0, out=inter)
+    h = np.minimum.outer(ay2, by2)
+    h -= np.maximum.outer(ay1, by1)
+    np.maximum(h, 0.0, out=h)
+    inter *= h
+    union = np.add.outer((ax2 - ax1) * (ay2 - ay1), (bx2 - bx1) * (by2 - by1))
+    union -= inter
+    # Alanı sıfır kutularda kesişim de sıfırdır; bölen yalnızca sıfırdan korunur
+    np.maximum(union, np.finfo(np.float32).tiny, out=union)
+    inter /= union
+    return inter
+
+
+def greedy_match(iou: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Eşiği geçen çiftleri IoU'ya göre azalan sırada açgözlü eşleştirir.
+
+    Yalnızca eşik üstündeki (seyrek) adaylar sıralanır; her satır ve sütun en
+    fazla bir kez kullanılır.
+
+    Returns:
+        (track indeksleri, tespit indeksleri)
+    """
+    rows, cols = np.nonzero(iou >= threshold)
+    if not len(rows):
+        return rows, cols
+    order = np.argsort(-iou[rows, cols], kind="stable")
+    rows, cols = rows[order], cols[order]
+    used_rows = np.zeros(iou.shape[0], dtype=bool)
+    used_cols = np.zeros(iou.shape[1], dtype=bool)
+    keep = np.zeros(len(rows), dtype=bool)
+    for k, (r, c) in enumerate(zip(rows.tolist(), cols.tolist())):
+        if not used_rows[r] and not used_cols[c]:
+            used_rows[r] = used_cols[c] = True
+            keep[k] = True
+    return rows[keep], cols[keep]
+
+
+def hungarian_match(iou: np.ndarray, threshold: float) -> Tuple[np.ndarray, np.ndarray]:
+    """Toplam IoU'yu en büyükleyen optimal eşleştirme (scipy gerekir); eşik altı çiftler atılır."""
+    if not iou.size:
+        return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+    rows, cols = scipy_optimize.linear_sum_assignment(iou, maximize=True)
+    keep = iou[rows, cols] >= threshold
+    return rows[keep], cols[keep]
+
+
+class KalmanBoxState:
+    """Tüm track'ler için sabit hızlı Kalman durumu (NumPy dizileri).
+
+    Durum vektörü `[cx, cy, w, h, vx, vy, vw, vh]`; ölçüm kutu merkezi ve
+    boyutudur. Diziler `capacity` slot için bir kez ayrılır ve `TrackStore`
+    slot indeksleriyle adreslenir. Tahmin ve düzeltme adımları verilen slotlar
+    için tek seferde, yığılmış (T, 8, 8) kovaryanslarla yapılır. Süreç ve
+    ölçüm gürültüsü kutu yüksekliğiyle ölçeklenir (DeepSORT'taki gibi); böylece
+    büyük ve küçük nesneler aynı ayarlarla izlenir.
+
+    Args:
+        capacity: Slot sayısı
+        std_position: Konum gürültüsünün kutu yüksekliğine oranı
+        std_velocity: Hız gürültüsünün kutu yüksekliğine oranı
+    """
+
+    DIM = 4
+
+    def __init__(self, capacity: int, std_position: float = 1.0 / 20, std_velocity: float = 1.0 / 160) -> None:
+        self.std_position = std_position
+        self.std_velocity = std_velocity
+        self._transition = np.eye(2 * self.DIM)
+        self._transition[: self.DIM, self.DIM :] = np.eye(self.DIM)
+        self.mean = np.zeros((capacity, 2 * self.DIM))
+        self.covariance = np.zeros((capacity, 2 * self.DIM, 2 * self.DIM))
+
+    @property
+    def nbytes(self) -> int:
+        return self.mean.nbytes + self.covariance.nbytes
+
+    def _noise(self, heights: np.ndarray, position: float, velocity: float | None) -> np.ndarray:
+        """Kutu yüksekliğiyle ölçeklenen köşegen gürültü matrisleri (T, d, d)."""
+        h = np.maximum(heights, 1.0)[:, None]
+        std = [position * h, position * h, position * h, position * h]
+        if velocity is not None:
+            std += [velocity * h, velocity * h, velocity * h, velocity * h]
+        variances = np.concatenate(std, axis=1) ** 2
+        noise = np.zeros(variances.shape + (variances.shape[1],))
+        idx = np.arange(variances.shape[1])
+        noise[:, idx, idx] = variances
+        return noise
+
+    def init(self, index: np.ndarray, boxes: np.ndarray) -> None:
+        """`index` slotlarını yeni track'ler (xyxy kutular) için sıfır hızla başlatır."""
+        measurement = self.to_measurement(boxes)
+        self.mean[index] = np.concatenate([measurement, np.zeros_like(measurement)], axis=1)
+        self.covariance[index] = self._noise(measurement[:, 3], 2 * self.std_position, 10 * self.std_velocity)
+
+    def predict(self, index: np.ndarray) -> None:
+        """`index` slotlarındaki track'leri bir frame ileri taşır."""
+        if not len(index):
+            return
+        F = self._transition
+        mean = self.mean[index] @ F.T
+        self.mean[index] = mean
+        self.covariance[index] = F @ self.covariance[index] @ F.T + self._noise(mean[:, 3], self.std_position, self.std_velocity)
+
+    def update(self, index: np.ndarray, boxes: np.ndarray) -> None:
+        """`index` slotlarındaki track'leri ölçülen kutularla (xyxy) düzeltir."""
+        if not len(index):
+            return
+        d = self.DIM
+        mean, covariance = self.mean[index], self.covariance[index]
+        innovation = self.to_measurement(boxes) - mean[:, :d]
+        projected = covariance[:, :d, :d] + self._noise(mean[:, 3], self.std_position, None)
+        # K = P Hᵀ S⁻¹; S simetrik olduğundan Kᵀ = S⁻¹ H P çözülür
+        gain = np.linalg.solve(projected, covariance[:, :d, :]).transpose(0, 2, 1)
+        self.mean[index] = mean + (gain @ innovation[:, :, None])[:, :, 0]
+        self.covariance[index] = covariance - gain @ covariance[:, :d, :]
+
+    def boxes(self, index: np.ndarray) -> np.ndarray:
+        """`index` slotlarının durumundan (T, 4) xyxy kutular (genişlik/yükseklik negatif olamaz)."""
+        mean = self.mean[index]
+        center, size = mean[:, :2], np.maximum(mean[:, 2:4], 0.0)
+        return np.concatenate([center - size / 2, center + size / 2], axis=1)
+
+    @staticmethod
+    def to_measurement(boxes: np.ndarray) -> np.ndarray:
+        """(N, 4) xyxy → (N, 4) cx, cy, w, h."""
+        boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+        return np.concatenate([(boxes[:, :2] + boxes[:, 2:]) / 2, boxes[:, 2:] - boxes[:, :2]], axis=1)
+
+
+# Biten (silinen) onaylı track'lerin diske/dışarıya aktarılan kaydı
+TRACK_RECORD_DTYPE = np.dtype(
+    [
+        ("track_id", np.int64),
+        ("class_id", np.int32),
+        ("hits", np.int32),
+        ("first_frame", np.int64),
+        ("last_frame", np.int64),
+        ("x1", np.float32),
+        ("y1", np.float32),
+        ("x2", np.float32),
+        ("y2", np.float32),
+        ("score", np.float32),
+    ]
+)
+
+
+class TrackStore:
+    """Sabit kapasiteli, sütun düzeninde (array-backed) track deposu.
+
+    Tüm sütunlar `capacity` slot için başlangıçta bir kez ayrılır; frame
+    başına dizi büyütme veya kopyalama yapılmaz, bu yüzden bellek kullanımı
+    akış ne kadar uzun sürerse sürsün sabittir. Silinen track'lerin slotları
+    boş slot yığınına döner ve yeni track'lere yeniden verilir.
+
+    Args:
+        capacity: Aynı anda tutulabilecek en fazla track sayısı
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.capacity = capacity
+        self.boxes = np.zeros((capacity, 4))
+        self.scores = np.zeros(capacity)
+        self.classes = np.zeros(capacity, dtype=np.int64)
+        self.ids = np.full(capacity, UNTRACKED, dtype=np.int64)
+        self.hits = np.zeros(capacity, dtype=np.int32)
+        self.misses = np.zeros(capacity, dtype=np.int32)
+        self.first_frame = np.zeros(capacity, dtype=np.int64)
+        self.last_frame = np.zeros(capacity, dtype=np.int64)
+        self.used = np.zeros(capacity, dtype=bool)
+        # Boş slot yığını: ilk `_free_count` eleman boştur, tepe sondadır
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int64)
+        self._free_count = capacity
+
+    def __len__(self) -> int:
+        return self.capacity - self._free_count
+
+    @property
+    def free(self) -> int:
+        return self._free_count
+
+    @property
+    def nbytes(self) -> int:
+        """Sütunların toplam bellek kullanımı (bayt)."""
+        columns = (
+            self.boxes, self.scores, self.classes, self.ids, self.hits,
+            self.misses, self.first_frame, self.last_frame, self.used, self._free,
+        )
+        return sum(column.nbytes for column in columns)
+
+    def active(self) -> np.ndarray:
+        """Dolu slotların (artan sıralı) indeksleri."""
+        return np.flatnonzero(self.used)
+
+    def allocate(self, count: int) -> np.ndarray:
+        """En fazla `count` boş slot ayırır (yer yoksa daha az döner)."""
+        count = min(count, self._free_count)
+        top = self._free_count
+        slots = self._free[top - count : top][::-1].copy()
+        self._free_count -= count
+        self.used[slots] = True
+        return slots
+
+    def release(self, slots: np.ndarray) -> np.ndarray:
+        """Slotları boşaltır; onaylı track'lerin kayıtlarını (TRACK_RECORD_DTYPE) döndürür."""
+        slots = np.asarray(slots, dtype=np.int64)
+        records = self.records(slots[self.ids[slots] != UNTRACKED])
+        self.used[slots] = False
+        self.ids[slots] = UNTRACKED
+        self._free[self._free_count : self._free_count + len(slots)] = slots[::-1]
+        self._free_count += len(slots)
+        return records
+
+    def records(self, slots: np.ndarray) -> np.ndarray:
+        records = np.empty(len(slots), dtype=TRACK_RECORD_DTYPE)
+        records["track_id"] = self.ids[slots]
+        records["class_id"] = self.classes[slots]
+        records["hits"] = self.hits[slots]
+        records["first_frame"] = self.first_frame[slots]
+        records["last_frame"] = self.last_frame[slots]
+        for k, name in enumerate(("x1", "y1", "x2", "y2")):
+            records[name] = self.boxes[slots, k]
+        records["score"] = self.scores[slots]
+        return records
+
+    def clear(self) -> None:
+        self.used[:] = False
+        self.ids[:] = UNTRACKED
+        self._free[:] = np.arange(self.capacity - 1, -1, -1)
+        self._free_count = self.capacity
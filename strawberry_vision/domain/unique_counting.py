@@ -0,0 +1,204 @@
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from .batch import RIPENESS_LEVELS, UNTRACKED, DetectionBatch
+from .zones import CountingLine, CountingRegion, CountingZone, box_centers, crossing_matrix, zone_matrix
+
+# Benzersiz sayımda etiket kaynağı; bölge tanımlanmazsa tüm track'ler ALL_REGION altında sayılır
+COUNT_LABELS = ("class", "ripeness")
+ALL_REGION = "all"
+
+
+class UniqueCountingService:
+    """Video boyunca benzersiz birey sayımı (track ID'leri + sayım çizgileri/bölgeleri).
+
+    Tek frame'in tespitlerini sayan `CountingService`'in aksine her track bölge
+    başına yalnızca bir kez sayılır. Track merkezi bir sayım çizgisini
+    geçtiğinde veya bir bölgenin içinde görüldüğünde o bölge için işaretlenir;
+    bölge verilmezse her track `all` altında sayılır. Etiket (detector sınıfı
+    veya olgunluk) frame'lik tahminlerin track ömrü boyunca çoğunluk oyuyla
+    belirlenir: track `ttl` frame görülmeyince (veya `finish()` ile)
+    sonuçlandırılır, hâlâ aktif track'ler o ana kadarki çoğunluk etiketiyle
+    geçici olarak sayılır.
+
+    Track başına durum sabit kapasiteli dizilerde tutulur; çizgi geçişi ve
+    bölge testleri her frame'de tüm aktif track'ler için tek adımda yapılır.
+
+    Args:
+        regions: Sayım çizgileri ve bölgeleri (`CountingLine`, `CountingZone`)
+        label: "class" (detector sınıfı) veya "ripeness" (olgunluk)
+        ttl: Görülmeyen track'in sonuçlandırılmadan önce beklediği frame sayısı
+        capacity: Aynı anda tutulabilecek en fazla track sayısı
+    """
+
+    def __init__(
+        self,
+        regions: Sequence[CountingRegion] = (),
+        label: str = "class",
+        ttl: int = 30,
+        capacity: int = 4096,
+    ) -> None:
+        if label not in COUNT_LABELS:
+            raise ValueError(f"Unknown count label: {label} (expected one of {COUNT_LABELS})")
+        if capacity <= 0:
+            raise ValueError(f"capacity must be positive, got {capacity}")
+        self.lines = [r for r in regions if isinstance(r, CountingLine)]
+        self.zones = [r for r in regions if isinstance(r, CountingZone)]
+        self.region_names = [r.name for r in self.lines + self.zones] or [ALL_REGION]
+        if len(set(self.region_names)) != len(self.region_names):
+            raise ValueError(f"Counting region names must be unique, got {self.region_names}")
+        self.label = label
+        self.ttl = ttl
+        self.capacity = capacity
+        self.labels: List[str] = [level.value for level in RIPENESS_LEVELS] if label == "ripeness" else []
+        self._label_index = {name: i for i, name in enumerate(self.labels)}
+        n_regions = len(self.region_names)
+        self._votes = np.zeros((capacity, len(self.labels)), dtype=np.int32)
+        self._points = np.zeros((capacity, 2))
+        self._last_seen = np.zeros(capacity, dtype=np.int64)
+        self._hits = np.zeros((capacity, n_regions), dtype=bool)
+        self._used = np.zeros(capacity, dtype=bool)
+        self._row_ids = np.full(capacity, UNTRACKED, dtype=np.int64)
+        self._final = np.zeros((n_regions, len(self.labels)), dtype=np.int64)
+        self._clear()
+
+    def _clear(self) -> None:
+        self._votes[:] = 0
+        self._hits[:] = False
+        self._used[:] = False
+        self._row_ids[:] = UNTRACKED
+        self._final[:] = 0
+        self._rows: Dict[int, int] = {}
+        self._free = list(range(self.capacity - 1, -1, -1))
+        self._frame = 0
+        self._finished = 0
+        self._dropped = 0
+
+    def _label_codes(self, batch: DetectionBatch, rows: np.ndarray) -> np.ndarray:
+        """Satırların etiket indeksleri (`labels` içinde); yeni sınıf adları tabloya eklenir."""
+        if self.label == "ripeness":
+            return batch.ripeness[rows].astype(np.int64)
+        names = batch.class_names or tuple(str(i) for i in range(int(batch.class_ids.max(initial=-1)) + 1))
+        for name in names:
+            if name not in self._label_index:
+                self._label_index[name] = len(self.labels)
+                self.labels.append(name)
+        grow = len(self.labels) - self._votes.shape[1]
+        if grow > 0:
+            self._votes = np.pad(self._votes, ((0, 0), (0, grow)))
+            self._final = np.pad(self._final, ((0, 0), (0, grow)))
+        lookup = np.array([self._label_index[name] for name in names], dtype=np.int64)
+        return lookup[batch.class_ids[rows]]
+
+    def _allocate(self, track_ids: List[int], keep: np.ndarray) -> np.ndarray:
+        """Yeni track'lere satır ayırır; yer yoksa bu frame'de görülmeyen en eski track'ler sonuçlandırılır."""
+        shortage = len(track_ids) - len(self._free)
+        if shortage > 0:
+            idle = self._used.copy()
+            idle[keep] = False
+            candidates = np.flatnonzero(idle)
+            self._finalize(candidates[np.argsort(self._last_seen[candidates], kind="stable")[:shortage]])
+        rows = np.full(len(track_ids), -1, dtype=np.int64)
+        for k, track_id in enumerate(track_ids[: len(self._free)]):
+            row = self._free.pop()
+            self._rows[track_id] = row
+            self._row_ids[row] = track_id
+            rows[k] = row
+        self._used[rows[rows >= 0]] = True
+        self._dropped += int((rows < 0).sum())
+        return rows
+
+    def update(self, batch: DetectionBatch, vote: bool = True) -> None:
+        """Bir frame'in takip edilen tespitleriyle oyları ve bölge geçişlerini günceller.
+
+        Args:
+            batch: Track ID'leri atanmış tespitler
+            vote: Etiketler çoğunluk oyuna katılsın mı (ör. detector'ün atlandığı
+                frame'lerde tekrar kullanılan tespitler için False)
+        """
+        self._frame += 1
+        tracked = np.flatnonzero(batch.track_ids != UNTRACKED)
+        if len(tracked):
+            track_ids = batch.track_ids[tracked].tolist()
+            rows = np.array([self._rows.get(track_id, -1) for track_id in track_ids], dtype=np.int64)
+            fresh = rows < 0
+            if fresh.any():
+                rows[fresh] = self._allocate([t for t, f in zip(track_ids, fresh.tolist()) if f], rows[~fresh])
+            ok = rows >= 0
+            tracked, rows, fresh = tracked[ok], rows[ok], fresh[ok]
+            centers = box_centers(batch.bboxes[tracked])
+
+            if vote:
+                # Yeni sınıf adları oy tablosunu genişletebilir; kodlar önce hesaplanır
+                codes = self._label_codes(batch, tracked)
+                np.add.at(self._votes, (rows, codes), 1)
+            if self.lines:
+                moved = ~fresh
+                crossed = crossing_matrix(self._points[rows[moved]], centers[moved], self.lines)
+                self._hits[rows[moved], : len(self.lines)] |= crossed
+            if self.zones:
+                self._hits[rows, len(self.lines) :] |= zone_matrix(centers, self.zones)
+            if not self.lines and not self.zones:
+                self._hits[rows, 0] = True
+            self._points[rows] = centers
+            self._last_seen[rows] = self._frame
+
+        self._finalize(np.flatnonzero(self._used & (self._frame - self._last_seen > self.ttl)))
+
+    def _finalize(self, rows: np.ndarray) -> None:
+        """Track'leri çoğunluk etiketiyle sayıma ekler ve satırlarını boşaltır."""
+        if not len(rows):
+            return
+        votes = self._votes[rows]
+        if votes.shape[1]:
+            voted = votes.any(axis=1)
+            track, region = np.nonzero(self._hits[rows] & voted[:, None])
+            np.add.at(self._final, (region, votes.argmax(axis=1)[track]), 1)
+        self._finished += len(rows)
+        for track_id in self._row_ids[rows].tolist():
+            del self._rows[track_id]
+        self._votes[rows] = 0
+        self._hits[rows] = False
+        self._used[rows] = False
+        self._row_ids[rows] = UNTRACKED
+        self._free.extend(rows[::-1].tolist())
+
+    def count_matrix(self) -> np.ndarray:
+        """(bölge, etiket) sayım matrisi: sonuçlanmış + aktif track'lerin geçici çoğunluk etiketi."""
+        active = np.flatnonzero(self._used)
+        votes = self._votes[active]
+        if not votes.shape[1]:
+            return self._final.copy()
+        majority = np.zeros_like(votes, dtype=np.int64)
+        majority[np.arange(len(active)), votes.argmax(axis=1)] = votes.any(axis=1)
+        return self._final + self._hits[active].T.astype(np.int64) @ majority
+
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Bölge → etiket → benzersiz birey sayısı (sıfırlar hariç)."""
+        return {
+            region: {label: n for label, n in zip(self.labels, row) if n}
+            for region, row in zip(self.region_names, self.count_matrix().tolist())
+        }
+
+    def finish(self) -> Dict[str, Dict[str, int]]:
+        """Tüm aktif track'leri sonuçlandırır (ör. video sonunda) ve nihai sayımı döndürür."""
+        self._finalize(np.flatnonzero(self._used))
+        return self.counts()
+
+    def reset(self) -> None:
+        """Sayım durumunu sıfırlar."""
+        self._clear()
+
+    @property
+    def active_tracks(self) -> int:
+        return len(self._rows)
+
+    @property
+    def finished_tracks(self) -> int:
+        return self._finished
+
+    @property
+    def dropped_tracks(self) -> int:
+        """Kapasite dolu olduğu için sayılamayan track sayısı."""
+        return self._dropped
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from typing import Sequence, Tuple, Union
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class CountingLine:
+    """Geçen track'lerin sayıldığı doğru parçası (frame koordinatları).
+
+    Attributes:
+        name: Sayım bölgesi adı
+        start: Başlangıç noktası (x, y)
+        end: Bitiş noktası (x, y)
+    """
+    name: str
+    start: Tuple[float, float]
+    end: Tuple[float, float]
+
+    def __post_init__(self) -> None:
+        if tuple(self.start) == tuple(self.end):
+            raise ValueError(f"Counting line '{self.name}' has zero length")
+
+
+@dataclass(frozen=True, eq=False)
+class CountingZone:
+    """İçine giren track'lerin sayıldığı poligon (frame koordinatları).
+
+    Attributes:
+        name: Sayım bölgesi adı
+        polygon: (K, 2) köşe noktaları
+    """
+    name: str
+    polygon: np.ndarray
+
+    def __post_init__(self) -> None:
+        polygon = np.asarray(self.polygon, dtype=np.float64)
+        if polygon.ndim != 2 or polygon.shape[1] != 2 or len(polygon) < 3:
+            raise ValueError(f"Counting zone '{self.name}' needs at least 3 (x, y) points, got shape {polygon.shape}")
+        object.__setattr__(self, "polygon", polygon)
+
+
+CountingRegion = Union[CountingLine, CountingZone]
+
+
+def box_centers(bboxes: np.ndarray) -> np.ndarray:
+    """(N, 4) x, y, w, h kutulardan (N, 2) float64 merkezler."""
+    bboxes = np.asarray(bboxes, dtype=np.float64).reshape(-1, 4)
+    return bboxes[:, :2] + bboxes[:, 2:] / 2
+
+
+def _orient(ax, ay, bx, by, px, py):
+    """a→b doğrultusuna göre p'nin yönü (çapraz çarpım işareti)."""
+    return (bx - ax) * (py - ay) - (by - ay) * (px - ax)
+
+
+def crossing_matrix(previous: np.ndarray, current: np.ndarray, lines: Sequence[CountingLine]) -> np.ndarray:
+    """Tüm track hareketlerinin tüm çizgilerle kesişimi, (T, L) bool.
+
+    Track'in önceki ve şimdiki merkezi arasındaki hareket, çizginin bir
+    tarafından diğerine geçiyor ve çizgi parçasının uçları arasından geçiyorsa
+    True'dur. Çizginin tam üstü bir taraf sayılır (yarı açık), böylece çizgi
+    üzerinde duran merkez geçişi ne kaçırır ne de iki kez sayar.
+    """
+    if not len(lines) or not len(previous):
+        return np.zeros((len(previous), len(lines)), dtype=bool)
+    ends = np.array([[*line.start, *line.end] for line in lines], dtype=np.float64)
+    ax, ay, bx, by = (ends[None, :, k] for k in range(4))
+    px, py = previous[:, 0:1], previous[:, 1:2]
+    qx, qy = current[:, 0:1], current[:, 1:2]
+    side_before = _orient(ax, ay, bx, by, px, py) >= 0
+    side_after = _orient(ax, ay, bx, by, qx, qy) >= 0
+    straddles = _orient(px, py, qx, qy, ax, ay) * _orient(px, py, qx, qy, bx, by) <= 0
+    return (side_before != side_after) & straddles
+
+
+def points_in_polygon(points: np.ndarray, polygon: np.ndarray) -> np.ndarray:
+    """(T, 2) noktaların poligon içinde olup olmadığı (çift-tek kuralı, T x K tek adımda)."""
+    if not len(points):
+        return np.zeros(0, dtype=bool)
+    x, y = points[:, 0:1], points[:, 1:2]
+    x0, y0 = polygon[None, :, 0], polygon[None, :, 1]
+    x1, y1 = np.roll(x0, -1, axis=1), np.roll(y0, -1, axis=1)
+    crosses = (y0 > y) != (y1 > y)
+    # Yatay kenarlar hiç kesmez; bölen yalnızca sıfırdan korunur
+    dy = np.where(y1 != y0, y1 - y0, 1.0)
+    x_at = x0 + (y - y0) * (x1 - x0) / dy
+    return (crosses & (x < x_at)).sum(axis=1) % 2 == 1
+
+
+def zone_matrix(points: np.ndarray, zones: Sequence[CountingZone]) -> np.ndarray:
+    """(T, Z) bool: her merkezin her bölgenin içinde olup olmadığı."""
+    if not len(zones):
+        return np.zeros((len(points), 0), dtype=bool)
+    return np.stack([points_in_polygon(points, zone.polygon) for zone in zones], axis=1)
@@ -0,0 +1,165 @@
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+# (xyxy float32 (N, 4), skor float32 (N,), sınıf id int64 (N,))
+BoxArrays = Tuple[np.ndarray, np.ndarray, np.ndarray]
+
+
+def empty_box_arrays() -> BoxArrays:
+    """Boş tespit dizileri."""
+    return (
+        np.empty((0, 4), dtype=np.float32),
+        np.empty(0, dtype=np.float32),
+        np.empty(0, dtype=np.int64),
+    )
+
+
+def concat_box_arrays(parts: List[BoxArrays]) -> BoxArrays:
+    """Birden fazla tespit dizisini birleştirir."""
+    if not parts:
+        return empty_box_arrays()
+    if len(parts) == 1:
+        return parts[0]
+    return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+
+def cxcywh_to_xyxy(boxes: np.ndarray) -> np.ndarray:
+    """(cx, cy, w, h) kutuları (x1, y1, x2, y2) formatına çevirir."""
+    out = np.empty_like(boxes)
+    half_w = boxes[:, 2] / 2
+    half_h = boxes[:, 3] / 2
+    out[:, 0] = boxes[:, 0] - half_w
+    out[:, 1] = boxes[:, 1] - half_h
+    out[:, 2] = boxes[:, 0] + half_w
+    out[:, 3] = boxes[:, 1] + half_h
+    return out
+
+
+def box_iou(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """İki xyxy kutu kümesi arasındaki IoU matrisini (len(a), len(b)) hesaplar."""
+    area_a = (a[:, 2] - a[:, 0]).clip(0) * (a[:, 3] - a[:, 1]).clip(0)
+    area_b = (b[:, 2] - b[:, 0]).clip(0) * (b[:, 3] - b[:, 1]).clip(0)
+    lt = np.maximum(a[:, None, :2], b[None, :, :2])
+    rb = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    wh = (rb - lt).clip(0)
+    inter = wh[..., 0] * wh[..., 1]
+    union = area_a[:, None] + area_b[None, :] - inter
+    return np.where(union > 0, inter / np.maximum(union, 1e-12), 0.0)
+
+
+def box_ios(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Kesişim / küçük kutu alanı (IoS) matrisini (len(a), len(b)) hesaplar.
+
+    Bir kutu diğerinin içinde kaldığında 1 olur; karo kenarında kesilmiş parça
+    kutuları tam kutuyla eşleştirmek için kullanılır.
+    """
+    area_a = (a[:, 2] - a[:, 0]).clip(0) * (a[:, 3] - a[:, 1]).clip(0)
+    area_b = (b[:, 2] - b[:, 0]).clip(0) * (b[:, 3] - b[:, 1]).clip(0)
+    lt = np.maximum(a[:, None, :2], b[None, :, :2])
+    rb = np.minimum(a[:, None, 2:], b[None, :, 2:])
+    wh = (rb - lt).clip(0)
+    inter = wh[..., 0] * wh[..., 1]
+    smaller = np.minimum(area_a[:, None], area_b[None, :])
+    return np.where(smaller > 0, inter / np.maximum(smaller, 1e-12), 0.0)
+
+
+OVERLAP_METRICS = {"iou": box_iou, "ios": box_ios}
+
+
+def nms(
+    boxes: np.ndarray,
+    scores: np.ndarray,
+    iou_threshold: float = 0.7,
+    class_ids: np.ndarray | None = None,
+    max_det: int = 300,
+    metric: str = "iou",
+) -> np.ndarray:
+    """Greedy non-maximum suppression; tutulan indeksleri skor sırasıyla döndürür.
+
+    `class_ids` verilirse sınıflar birbirini bastırmaz (kutular sınıfa göre
+    ötelenerek tek geçişte sınıf bazlı NMS yapılır). Her adımda seçilen kutunun
+    kalanlarla örtüşmesi (`metric`: "iou" veya "ios") vektörel hesaplanır; döngü
+    yalnızca tutulan kutu sayısı kadar döner.
+    """
+    if metric not in OVERLAP_METRICS:
+        raise ValueError(f"Unknown overlap metric: {metric} (expected one of {tuple(OVERLAP_METRICS)})")
+    overlap = OVERLAP_METRICS[metric]
+    if len(boxes) == 0:
+        return np.empty(0, dtype=np.int64)
+    boxes = boxes.astype(np.float32, copy=False)
+    if class_ids is not None:
+        offset = float(boxes.max() - boxes.min()) + 1.0
+        boxes = boxes + (class_ids.astype(np.float32) * offset)[:, None]
+
+    order = np.argsort(-scores, kind="stable")
+    keep = []
+    while order.size and len(keep) < max_det:
+        i = order[0]
+        keep.append(i)
+        if order.size == 1:
+            break
+        overlaps = overlap(boxes[i : i + 1], boxes[order[1:]])[0]
+        order = order[1:][overlaps <= iou_threshold]
+    return np.asarray(keep, dtype=np.int64)
+
+
+def weighted_box_fusion(
+    parts: Sequence[BoxArrays],
+    weights: Sequence[float] | None = None,
+    iou_threshold: float = 0.55,
+    skip_threshold: float = 0.0,
+) -> BoxArrays:
+    """Birden fazla modelin kutularını weighted box fusion (WBF) ile birleştirir.
+
+    Kümeler sınıf bazlı greedy NMS'in tuttuğu kutular etrafında oluşur (döngü
+    yalnızca küme sayısı kadar döner); diğer kutular aynı sınıftan en çok
+    örtüştükleri küme merkezine atanır. Koordinatlar `skor * model ağırlığı` ile
+    ağırlıklı ortalanır; skor, kümedeki ağırlıklı skorların ortalamasının kaç
+    modelin kutuya katkı verdiğine göre ölçeklenmiş hâlidir (tek modelin
+    gördüğü kutu cezalandırılır).
+
+    Args:
+        parts: Model başına (xyxy, skor, sınıf id) dizileri
+        weights: Model ağırlıkları (varsayılan: hepsi 1)
+        iou_threshold: Aynı kümeye girme eşiği
+        skip_threshold: Bu skorun altındaki kutular yok sayılır
+
+    Returns:
+        Skora göre azalan sırada birleştirilmiş (xyxy, skor, sınıf id)
+    """
+    weights = np.ones(len(parts), dtype=np.float64) if weights is None else np.asarray(weights, dtype=np.float64)
+    if len(weights) != len(parts):
+        raise ValueError(f"Expected {len(parts)} weights, got {len(weights)}")
+    if not parts:
+        return empty_box_arrays()
+    boxes, scores, class_ids = concat_box_arrays(list(parts))
+    model_weight = np.repeat(weights, [len(p[0]) for p in parts])
+    keep = scores >= skip_threshold
+    boxes, scores, class_ids, model_weight = boxes[keep], scores[keep], class_ids[keep], model_weight[keep]
+    if len(boxes) == 0:
+        return empty_box_arrays()
+
+    weighted = scores.astype(np.float64) * model_weight
+    leaders = nms(boxes, weighted, iou_threshold, class_ids=class_ids, max_det=len(boxes))
+    # Her kutu aynı sınıftan en çok örtüştüğü küme merkezine atanır (merkezler kendilerine)
+    overlap = box_iou(boxes, boxes[leaders])
+    overlap[class_ids[:, None] != class_ids[leaders][None, :]] = -1.0
+    overlap[leaders, np.arange(len(leaders))] = 2.0
+    cluster = overlap.argmax(axis=1)
+
+    k = len(leaders)
+    total = np.bincount(cluster, weights=weighted, minlength=k)
+    fused = np.stack(
+        [np.bincount(cluster, weights=weighted * boxes[:, c], minlength=k) for c in range(4)], axis=1
+    ) / np.maximum(total, 1e-12)[:, None]
+    members = np.bincount(cluster, minlength=k)
+    fused_scores = (total / members) * np.minimum(members, len(parts)) / weights.sum()
+    fused_scores = np.clip(fused_scores, 0.0, 1.0)
+
+    order = np.argsort(-fused_scores, kind="stable")
+    return (
+        fused[order].astype(np.float32),
+        fused_scores[order].astype(np.float32),
+        class_ids[leaders][order].astype(np.int64),
+    )
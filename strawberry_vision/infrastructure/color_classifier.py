@@ -0,0 +1,200 @@
+from typing import Any, Dict, List, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from strawberry_vision.domain.batch import RIPENESS_CODES, RIPENESS_LEVELS
+from strawberry_vision.domain.entities import Ripeness
+from strawberry_vision.infrastructure.detectors import classify_ripeness_batch
+from strawberry_vision.lazy import LazyModule
+
+yaml = LazyModule("yaml")
+
+logger = logging.getLogger(__name__)
+
+# BGR kanal başına tutulan bit sayısı; LUT 2^(3*bit) girdi içerir (5 bit → 32768)
+LUT_BITS = 5
+
+# Yapılandırma verilmezse kullanılan prototipler (hue derece 0-360, doygunluk 0-1)
+DEFAULT_PROTOTYPES: Dict[str, List[Dict[str, Any]]] = {
+    "ripe": [{"hue": [330, 20], "saturation": [0.4, 1.0]}],
+    "semi_ripe": [{"hue": [20, 60], "saturation": [0.3, 1.0]}],
+    "unripe": [
+        {"hue": [60, 180], "saturation": [0.2, 1.0]},
+        {"hue": [0, 360], "saturation": [0.0, 0.25]},
+    ],
+}
+
+
+class RedMeanClassifier:
+    """Varsayılan renk aşaması: ortalama kırmızı kanal eşikleri (`classify_ripeness`)."""
+
+    def classify_batch(self, frame: np.ndarray, bboxes: np.ndarray) -> np.ndarray:
+        return classify_ripeness_batch(frame, bboxes)
+
+
+def _bgr_to_hue_saturation(bgr: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(K, 3) BGR (0-255) renkleri hue (derece, 0-360) ve doygunluğa (0-1) çevirir."""
+    bgr = bgr.astype(np.float64) / 255.0
+    b, g, r = bgr[:, 0], bgr[:, 1], bgr[:, 2]
+    value = bgr.max(axis=1)
+    delta = value - bgr.min(axis=1)
+    safe = np.where(delta > 0, delta, 1.0)
+    hue = np.select(
+        [delta == 0, value == r, value == g],
+        [0.0, ((g - b) / safe) % 6.0, (b - r) / safe + 2.0],
+        (r - g) / safe + 4.0,
+    ) * 60.0
+    saturation = np.where(value > 0, delta / np.where(value > 0, value, 1.0), 0.0)
+    return hue, saturation
+
+
+class HistogramClassifier:
+    """Kutu başına hue/doygunluk histogramı ile olgunluk sınıflandırıcısı.
+
+    Renkler önceden hesaplanmış bir LUT ile tek adımda histogram kutusuna
+    çevrilir: BGR kanal başına `LUT_BITS` bite indirgenir ve her indirgenmiş
+    renk için HSV dönüşümü ve (hue, doygunluk) kutusu başlangıçta bir kez
+    hesaplanır. Her tespit kutusundan `samples` x `samples` ızgarada piksel
+    okunur; tüm kutuların histogramları tek `np.bincount` ile çıkarılır, böylece
+    maliyet kutu boyutundan bağımsız ve kutu sayısına göre doğrusaldır.
+    Histogramlar prototiplerle Bhattacharyya katsayısıyla (tek matris çarpımı)
+    karşılaştırılır; en benzer prototipin olgunluk seviyesi döner.
+
+    Args:
+        prototypes: Olgunluk seviyesi → prototip listesi. Prototip ya
+            `{"histogram": [...]}` (h_bins * s_bins uzunluğunda) ya da
+            `{"hue": [lo, hi], "saturation": [lo, hi]}` aralığıdır (hue derece,
+            lo > hi ise 360'ta sarar). Verilmezse `DEFAULT_PROTOTYPES`.
+        h_bins: Hue kutu sayısı
+        s_bins: Doygunluk kutu sayısı
+        samples: Kutu başına ızgara kenarındaki örnek sayısı
+    """
+
+    def __init__(
+        self,
+        prototypes: Dict[str, Sequence[Dict[str, Any]]] | None = None,
+        h_bins: int = 12,
+        s_bins: int = 4,
+        samples: int = 16,
+    ) -> None:
+        if h_bins <= 0 or s_bins <= 0 or samples <= 0:
+            raise ValueError(f"h_bins, s_bins and samples must be positive, got {h_bins}, {s_bins}, {samples}")
+        self.h_bins = h_bins
+        self.s_bins = s_bins
+        self.samples = samples
+        self.lut = self._build_lut()
+        self._prototypes = np.zeros((0, self.n_bins))
+        self._prototype_codes = np.zeros(0, dtype=np.int8)
+        for level, entries in (prototypes or DEFAULT_PROTOTYPES).items():
+            ripeness = level if isinstance(level, Ripeness) else Ripeness(level)
+            for entry in entries:
+                self.add_prototype(ripeness, self._prototype_histogram(entry))
+
+    @property
+    def n_bins(self) -> int:
+        return self.h_bins * self.s_bins
+
+    @classmethod
+    def from_config(cls, config: str | Dict[str, Any]) -> "HistogramClassifier":
+        """YAML dosyasından veya dict'ten sınıflandırıcı oluşturur (bkz. configs/color_classifier.yaml)."""
+        if isinstance(config, str):
+            with open(config, "r", encoding="utf-8") as f:
+                config = yaml.safe_load(f) or {}
+        cfg = config.get("color_classifier", config)
+        return cls(
+            prototypes=cfg.get("prototypes"),
+            h_bins=cfg.get("h_bins", 12),
+            s_bins=cfg.get("s_bins", 4),
+            samples=cfg.get("samples", 16),
+        )
+
+    def _build_lut(self) -> np.ndarray:
+        """İndirgenmiş her BGR rengi için (hue, doygunluk) kutu indeksi."""
+        levels = 1 << LUT_BITS
+        step = 256 // levels
+        codes = np.arange(levels ** 3)
+        centers = np.stack(
+            [(codes >> (2 * LUT_BITS)) & (levels - 1), (codes >> LUT_BITS) & (levels - 1), codes & (levels - 1)],
+            axis=1,
+        ) * step + step // 2
+        hue, saturation = _bgr_to_hue_saturation(centers)
+        h_bin = np.minimum((hue / 360.0 * self.h_bins).astype(np.int64), self.h_bins - 1)
+        s_bin = np.minimum((saturation * self.s_bins).astype(np.int64), self.s_bins - 1)
+        dtype = np.uint8 if self.n_bins <= 256 else np.uint16
+        return (h_bin * self.s_bins + s_bin).astype(dtype)
+
+    def _prototype_histogram(self, entry: Dict[str, Any]) -> np.ndarray:
+        if "histogram" in entry:
+            histogram = np.asarray(entry["histogram"], dtype=np.float64).reshape(-1)
+            if histogram.size != self.n_bins:
+                raise ValueError(f"Prototype histogram must have {self.n_bins} bins, got {histogram.size}")
+            return histogram
+        h_lo, h_hi = entry.get("hue", (0, 360))
+        s_lo, s_hi = entry.get("saturation", (0.0, 1.0))
+        h_centers = (np.arange(self.h_bins) + 0.5) * 360.0 / self.h_bins
+        s_centers = (np.arange(self.s_bins) + 0.5) / self.s_bins
+        in_hue = (h_centers >= h_lo) & (h_centers < h_hi) if h_lo <= h_hi else (h_centers >= h_lo) | (h_centers < h_hi)
+        in_saturation = (s_centers >= s_lo) & (s_centers <= s_hi)
+        histogram = (in_hue[:, None] & in_saturation[None, :]).astype(np.float64).reshape(-1)
+        if not histogram.any():
+            raise ValueError(f"Prototype range covers no histogram bins: {entry}")
+        return histogram
+
+    def add_prototype(self, ripeness: Ripeness, histogram: np.ndarray) -> None:
+        """Olgunluk seviyesi için (normalize edilmiş) prototip histogramı ekler."""
+        histogram = np.asarray(histogram, dtype=np.float64).reshape(1, self.n_bins)
+        self._prototypes = np.vstack([self._prototypes, histogram / histogram.sum()])
+        self._prototype_codes = np.append(self._prototype_codes, np.int8(RIPENESS_CODES[ripeness]))
+
+    def fit(self, frame: np.ndarray, bboxes: np.ndarray, ripeness: Sequence[Ripeness]) -> "HistogramClassifier":
+        """Etiketli kutulardan seviye başına ortalama histogramı prototip olarak ekler."""
+        histograms, valid = self.histograms(frame, bboxes)
+        codes = np.array([RIPENESS_CODES[r] for r in ripeness], dtype=np.int8)
+        for code in np.unique(codes[valid]):
+            self.add_prototype(RIPENESS_LEVELS[code], histograms[valid & (codes == code)].mean(axis=0))
+        return self
+
+    def histograms(self, frame: np.ndarray, bboxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Kutu başına normalize (N, h_bins * s_bins) histogram ve frame'le kesişen kutu maskesi."""
+        bboxes = np.asarray(bboxes, dtype=np.int64).reshape(-1, 4)
+        n = len(bboxes)
+        h, w = frame.shape[:2]
+        x1 = bboxes[:, 0].clip(0, w)
+        y1 = bboxes[:, 1].clip(0, h)
+        x2 = (bboxes[:, 0] + bboxes[:, 2]).clip(0, w)
+        y2 = (bboxes[:, 1] + bboxes[:, 3]).clip(0, h)
+        valid = (x2 > x1) & (y2 > y1)
+        histograms = np.zeros((n, self.n_bins))
+        if frame.ndim != 3 or frame.shape[2] < 3:
+            valid[:] = False
+        if not valid.any():
+            return histograms, valid
+
+        # Kutu içinde eşit aralıklı örnek ızgarası: (M, k) x ve y koordinatları
+        steps = (np.arange(self.samples) + 0.5) / self.samples
+        xs = x1[valid, None] + (steps[None, :] * (x2 - x1)[valid, None]).astype(np.int64)
+        ys = y1[valid, None] + (steps[None, :] * (y2 - y1)[valid, None]).astype(np.int64)
+        m = len(xs)
+        # Düz piksel indeksleriyle tek `take`: (M * k * k, C)
+        flat = (ys[:, :, None] * w + xs[:, None, :]).reshape(-1)
+        pixels = np.take(frame.reshape(h * w, -1), flat, axis=0)
+        shift = 8 - LUT_BITS
+        colors = (
+            ((pixels[:, 0] >> shift).astype(np.uint16) << (2 * LUT_BITS))
+            | ((pixels[:, 1] >> shift).astype(np.uint16) << LUT_BITS)
+            | (pixels[:, 2] >> shift)
+        )
+        bins = self.lut[colors].reshape(m, -1) + (np.arange(m, dtype=np.int64) * self.n_bins)[:, None]
+        counts = np.bincount(bins.reshape(-1), minlength=m * self.n_bins).reshape(m, self.n_bins)
+        histograms[valid] = counts / float(self.samples * self.samples)
+        return histograms, valid
+
+    def classify_batch(self, frame: np.ndarray, bboxes: np.ndarray) -> np.ndarray:
+        """(N,) int8 olgunluk kodları (`RIPENESS_LEVELS` sırası); boş kutular UNRIPE."""
+        histograms, valid = self.histograms(frame, bboxes)
+        codes = np.full(len(histograms), RIPENESS_CODES[Ripeness.UNRIPE], dtype=np.int8)
+        if valid.any() and len(self._prototypes):
+            similarity = np.sqrt(histograms[valid]) @ np.sqrt(self._prototypes).T
+            codes[valid] = self._prototype_codes[similarity.argmax(axis=1)]
+        return codes
@@ -0,0 +1,46 @@
+from typing import Any, Dict, List
+
+from strawberry_vision.domain.zones import CountingLine, CountingRegion, CountingZone
+from strawberry_vision.lazy import LazyModule
+
+yaml = LazyModule("yaml")
+
+# Kameraya özel sayım tanımı olmayan kaynaklar için kullanılan anahtar
+DEFAULT_COUNTING_KEY = "default"
+
+
+def load_counting_config(config: str | Dict[str, Any]) -> Dict[str, List[CountingRegion]]:
+    """YAML dosyasından veya dict'ten kamera → sayım çizgileri/bölgeleri eşlemesini okur.
+
+    Beklenen yapı (bkz. configs/counting_config.yaml)::
+
+        counting:
+          "0":
+            lines:
+              - name: exit
+                points: [[960, 80], [960, 680]]
+            zones:
+              - name: sorting_tray
+                polygon: [[40, 120], [600, 120], [600, 680], [40, 680]]
+    """
+    if isinstance(config, str):
+        with open(config, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    cfg = config.get("counting", config)
+    regions: Dict[str, List[CountingRegion]] = {}
+    for name, entry in cfg.items():
+        entry = entry or {}
+        lines = []
+        for line in entry.get("lines", []):
+            points = line.get("points", [])
+            if len(points) != 2:
+                raise ValueError(f"Counting line '{line.get('name')}' needs exactly 2 points, got {len(points)}")
+            lines.append(CountingLine(str(line["name"]), tuple(points[0]), tuple(points[1])))
+        zones = [CountingZone(str(zone["name"]), zone["polygon"]) for zone in entry.get("zones", [])]
+        regions[str(name)] = lines + zones
+    return regions
+
+
+def regions_for(config: Dict[str, List[CountingRegion]], name: str) -> List[CountingRegion]:
+    """Kaynağa ait sayım bölgeleri; tanım yoksa `default`, o da yoksa boş liste (her track bir kez)."""
+    return config.get(str(name), config.get(DEFAULT_COUNTING_KEY, []))
@@ -1,67 +1,276 @@
-from typing import List, Tuple
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+import logging
+import threading
 
 import numpy as np
-import yaml
 from pathlib import Path
 
+from strawberry_vision.domain.batch import RIPENESS_CODES, DetectionBatch
 from strawberry_vision.domain.entities import Detection, Ripeness
+from strawberry_vision.infrastructure.box_ops import BoxArrays, concat_box_arrays, empty_box_arrays
+from strawberry_vision.lazy import LazyModule
 
-try:
-    from ultralytics import YOLO  # type: ignore
-except Exception:  # pragma: no cover
-    YOLO = None  # fallback when ultralytics isn't available
+cv2 = LazyModule("cv2")
+ultralytics = LazyModule("ultralytics")
+yaml = LazyModule("yaml")
+
+logger = logging.getLogger(__name__)
+
+BACKENDS = ("ultralytics", "onnx", "onnx-int8")
+WARMUP_SIZE = 640
+
+# classify_ripeness eşikleri (ortalama kırmızı kanal seviyesi)
+RIPE_RED_MEAN = 150
+SEMI_RIPE_RED_MEAN = 100
+# Kutu başına doğrudan toplamın sabit maliyeti (piksel cinsinden); az sayıda küçük
+# kutuda toplam-alan tablosu kurmak kutuları doğrudan toplamaktan pahalıdır
+DIRECT_SUM_BOX_COST = 4096
+
+_UNLOADED = object()
+
+
+def int8_model_path(model_path: str) -> str:
+    """INT8 model yolunu döndürür: `best.pt` / `best.onnx` → `best.int8.onnx`."""
+    p = Path(model_path)
+    if p.name.endswith(".int8.onnx"):
+        return str(p)
+    return str(p.with_name(f"{p.stem}.int8.onnx"))
+
+
+def load_class_names() -> list[str]:
+    """Sınıf isimlerini dataset YAML'ından (silkworm, yoksa strawberry) okur.
+
+    YAML process başına bir kez okunur; her çağrı kendi listesini alır.
+    """
+    return list(_read_class_names())
+
+
+@lru_cache(maxsize=1)
+def _read_class_names() -> Tuple[str, ...]:
+    try:
+        project_root = Path(__file__).resolve().parents[2]
+        silkworm_yaml_path = project_root / 'configs' / 'silkworm_data.yaml'
+        strawberry_yaml_path = project_root / 'configs' / 'strawberry_data.yaml'
+
+        data_yaml_path = silkworm_yaml_path if silkworm_yaml_path.exists() else strawberry_yaml_path
+        if data_yaml_path.exists():
+            with open(data_yaml_path, 'r', encoding='utf-8') as f:
+                data_cfg = yaml.safe_load(f) or {}
+                names = data_cfg.get('names')
+                if isinstance(names, list):
+                    return tuple(str(n) for n in names)
+    except Exception:
+        pass
+    return ()
 
 
 class YOLODetector:
-    def __init__(self, model_path: str | None = None) -> None:
-        self.model = None
-        self.class_names: list[str] = []
+    """YOLO tabanlı detector.
+
+    Model kurucuda değil, ilk ihtiyaç duyulduğunda (`model` erişimi, ilk
+    `detect`) yüklenir ve sahte bir frame ile ısıtılır; böylece ilk gerçek frame
+    model kurulum maliyetini ödemez. `warmup()` bu adımı önceden yapmak için çağrılabilir.
+
+    Args:
+        model_path: Model dosyası (ultralytics için .pt, onnx için .onnx)
+        backend: "ultralytics" (varsayılan), "onnx" (ONNX Runtime, CPU) veya
+            "onnx-int8" (scripts/quantize_model.py ile üretilen INT8 model)
+        warmup_on_load: Model yüklenince sahte bir inference çalıştır
+        **backend_options: Backend'e iletilen ek ayarlar (ör. imgsz, conf_threshold)
+    """
 
+    def __init__(
+        self,
+        model_path: str | None = None,
+        backend: str = "ultralytics",
+        warmup_on_load: bool = True,
+        **backend_options,
+    ) -> None:
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend} (expected one of {BACKENDS})")
+        if backend == "onnx-int8" and model_path:
+            model_path = int8_model_path(model_path)
+        self.model_path = model_path
+        self.backend = backend
+        self.backend_options = backend_options
+        # ultralytics'te predict'e verilen, ONNX'te giriş tamponunun boyutu (None: model varsayılanı)
+        self.imgsz: int | None = backend_options.get("imgsz")
+        self.warmup_on_load = warmup_on_load
+        self._model = _UNLOADED if model_path else None
+        self._class_names: list[str] | None = None
+        self._warm = False
+        self._load_lock = threading.Lock()
+
+    @property
+    def model(self):
+        """Yüklenmiş model (yüklenemediyse veya yol verilmediyse None)."""
+        if self._model is _UNLOADED:
+            self.load()
+        return self._model
+
+    @model.setter
+    def model(self, value) -> None:
+        self._model = value
+
+    @property
+    def loaded(self) -> bool:
+        """Model yüklenmeye çalışıldı mı."""
+        return self._model is not _UNLOADED
+
+    @property
+    def class_names(self) -> list[str]:
+        if self._class_names is None:
+            self._class_names = load_class_names()
+        return self._class_names
+
+    @class_names.setter
+    def class_names(self, value: list[str]) -> None:
+        self._class_names = list(value)
+
+    def load(self) -> "YOLODetector":
+        """Modeli (bir kez) yükler; `warmup_on_load` açıksa ardından ısıtır."""
+        with self._load_lock:
+            if self._model is not _UNLOADED:
+                return self
+            self._model = self._load_model()
+        if self.warmup_on_load:
+            self.warmup()
+        return self
+
+    def warmup(self, imgsz: int | None = None) -> "YOLODetector":
+        """Modeli yükler ve sahte bir frame ile bir kez inference çalıştırır."""
+        model = self.model
+        if model is None or self._warm:
+            return self
+        self._warm = True
+        if self.backend == "ultralytics":
+            size = imgsz or WARMUP_SIZE
+        else:
+            size = imgsz or max(model.input_hw)
         try:
-            project_root = Path(__file__).resolve().parents[2]
-            silkworm_yaml_path = project_root / 'configs' / 'silkworm_data.yaml'
-            strawberry_yaml_path = project_root / 'configs' / 'strawberry_data.yaml'
-
-            data_yaml_path = silkworm_yaml_path if silkworm_yaml_path.exists() else strawberry_yaml_path
-            if data_yaml_path.exists():
-                with open(data_yaml_path, 'r', encoding='utf-8') as f:
-                    data_cfg = yaml.safe_load(f) or {}
-                    names = data_cfg.get('names')
-                    if isinstance(names, list):
-                        self.class_names = [str(n) for n in names]
-        except Exception:
-            self.class_names = []
+            self.detect_arrays(np.zeros((size, size, 3), dtype=np.uint8))
+        except Exception as e:
+            logger.warning(f"Warm-up failed: {e}")
+        return self
+
+    def set_imgsz(self, imgsz: int) -> bool:
+        """Inference görüntü boyutunu değiştirir.
+
+        Returns:
+            Uygulandıysa True (sabit girişli ONNX modellerinde False)
+        """
+        if self.backend != "ultralytics":
+            model = self.model
+            if model is None or not model.set_input_size(imgsz):
+                return False
+        self.imgsz = imgsz
+        return True
+
+    def _predict_options(self) -> dict:
+        return {"imgsz": self.imgsz} if self.imgsz else {}
 
-        if YOLO is not None and model_path:
+    def _load_model(self):
+        if self.backend in ("onnx", "onnx-int8"):
             try:
-                self.model = YOLO(model_path)
-            except Exception:
-                self.model = None
+                from strawberry_vision.infrastructure.onnx_backend import OnnxBackend
+
+                return OnnxBackend(self.model_path, **self.backend_options)
+            except Exception as e:
+                logger.warning(f"ONNX backend unavailable ({e}); running without a model")
+                return None
+        if not ultralytics:
+            return None
+        try:
+            return ultralytics.YOLO(self.model_path)
+        except Exception:
+            return None
 
     def detect(self, frame: np.ndarray) -> List[Detection]:
-        if frame is None:
-            return []
-        if self.model is None:
+        return self.detect_columnar(frame).to_detections()
+
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> List[List[Detection]]:
+        """Birden fazla frame'i tek bir predict çağrısıyla işler.
+
+        Args:
+            frames: İşlenecek frame listesi
+
+        Returns:
+            Her frame için (aynı sırada) tespit listesi
+        """
+        return [batch.to_detections() for batch in self.detect_columnar_batch(frames)]
+
+    def detect_columnar(self, frame: np.ndarray) -> DetectionBatch:
+        """Tespitleri sütun düzeninde (DetectionBatch) döndürür."""
+        return self.to_batch(self.detect_arrays(frame))
+
+    def detect_columnar_batch(self, frames: Sequence[np.ndarray]) -> List[DetectionBatch]:
+        """`detect_batch` karşılığı; her frame için bir DetectionBatch döndürür."""
+        return [self.to_batch(arrays) for arrays in self.detect_arrays_batch(frames)]
+
+    def detect_arrays(self, frame: np.ndarray) -> BoxArrays:
+        """Tespitleri nesne oluşturmadan dizi olarak döndürür.
+
+        Returns:
+            (xyxy float32 (N, 4), skor float32 (N,), sınıf id int64 (N,))
+        """
+        if frame is None or self.model is None:
             # Dummy: no detections when model not loaded
-            return []
+            return empty_box_arrays()
         try:
-            results = self.model.predict(source=frame, verbose=False)
-            detections: List[Detection] = []
-            for r in results:
-                for b in r.boxes:
-                    x1, y1, x2, y2 = b.xyxy[0].tolist()
-                    w, h = int(x2 - x1), int(y2 - y1)
-                    cls_id = int(b.cls[0])
-                    label = (
-                        self.class_names[cls_id]
-                        if 0 <= cls_id < len(self.class_names)
-                        else str(cls_id)
-                    )
-                    det = Detection(bbox=(int(x1), int(y1), w, h), score=float(b.conf[0]), label=label)
-                    detections.append(det)
-            return detections
-        except Exception:
-            return []
+            if self.backend != "ultralytics":
+                return self.model.predict(frame)
+            results = self.model.predict(source=frame, verbose=False, **self._predict_options())
+            return concat_box_arrays([self._result_to_arrays(r) for r in results])
+        except Exception as e:
+            logger.error(f"Inference error: {e}")
+            return empty_box_arrays()
+
+    def detect_arrays_batch(self, frames: Sequence[np.ndarray]) -> List[BoxArrays]:
+        """`detect_arrays` karşılığı; ultralytics'te tek predict çağrısı kullanır."""
+        outputs: List[BoxArrays] = [empty_box_arrays() for _ in frames]
+        if self.model is None:
+            return outputs
+        valid = [i for i, f in enumerate(frames) if f is not None]
+        if not valid:
+            return outputs
+        if self.backend != "ultralytics":
+            # Dışa aktarılan modellerin batch ekseni sabit (1) olduğundan frame'ler sırayla işlenir
+            for i in valid:
+                outputs[i] = self.detect_arrays(frames[i])
+            return outputs
+        try:
+            results = self.model.predict(source=[frames[i] for i in valid], verbose=False, **self._predict_options())
+            for i, r in zip(valid, results):
+                outputs[i] = self._result_to_arrays(r)
+            return outputs
+        except Exception as e:
+            logger.error(f"Batch inference error: {e}")
+            return [empty_box_arrays() for _ in frames]
+
+    def to_batch(self, arrays: BoxArrays) -> DetectionBatch:
+        """Dizileri sınıf isimleriyle birlikte DetectionBatch'e çevirir."""
+        return DetectionBatch.from_xyxy(*arrays, class_names=self.class_names)
+
+    def to_detections(self, arrays: BoxArrays) -> List[Detection]:
+        """Dizileri Detection nesnelerine çevirir (nesne başına iş yalnızca burada yapılır)."""
+        return self.to_batch(arrays).to_detections()
+
+    @staticmethod
+    def _result_to_arrays(result) -> BoxArrays:
+        boxes = result.boxes
+        if boxes is None or len(boxes) == 0:
+            return empty_box_arrays()
+        # Tüm tensör tek seferde NumPy'a aktarılır (kutu başına tensör indeksleme yok)
+        return (
+            _to_numpy(boxes.xyxy).astype(np.float32, copy=False).reshape(-1, 4),
+            _to_numpy(boxes.conf).astype(np.float32, copy=False).reshape(-1),
+            _to_numpy(boxes.cls).astype(np.int64).reshape(-1),
+        )
+
+
+def _to_numpy(tensor) -> np.ndarray:
+    return tensor.cpu().numpy() if hasattr(tensor, "cpu") else np.asarray(tensor)
 
 
 def classify_ripeness(frame: np.ndarray, bbox: Tuple[int, int, int, int]) -> Ripeness:
@@ -73,8 +282,80 @@ def classify_ripeness(frame: np.ndarray, bbox: Tuple[int, int, int, int]) -> Rip
         return Ripeness.UNRIPE
     # Simple heuristic: average red channel level
     red_mean = float(np.mean(roi[:, :, 2])) if roi.ndim == 3 and roi.shape[2] >= 3 else 0.0
-    if red_mean > 150:
+    if red_mean > RIPE_RED_MEAN:
         return Ripeness.RIPE
-    if red_mean > 100:
+    if red_mean > SEMI_RIPE_RED_MEAN:
         return Ripeness.SEMI_RIPE
     return Ripeness.UNRIPE
+
+
+def integral_image(channel: np.ndarray) -> np.ndarray:
+    """(H, W) kanalın (H+1, W+1) toplam-alan tablosu (ilk satır/sütun sıfır).
+
+    cv2 varsa float64 tablo üretilir (2^53'e kadar tam sayılar kesin; 8 bit
+    kanalda her frame boyutu için yeterli), yoksa NumPy ile int64.
+    """
+    channel = np.ascontiguousarray(channel)
+    if cv2:
+        return cv2.integral(channel, sdepth=cv2.CV_64F)
+    h, w = channel.shape
+    table = np.zeros((h + 1, w + 1), dtype=np.int64)
+    np.cumsum(channel, axis=1, dtype=np.int64, out=table[1:, 1:])
+    np.cumsum(table[1:, 1:], axis=0, out=table[1:, 1:])
+    return table
+
+
+def _slice_bounds(start: np.ndarray, end: np.ndarray, length: int) -> Tuple[np.ndarray, np.ndarray]:
+    """`frame[start:end]` dilimlemesinin gerçek sınırları (negatif bitiş sondan sayılır)."""
+    start = np.minimum(start, length)
+    end = np.where(end < 0, np.maximum(end + length, 0), np.minimum(end, length))
+    return start, np.maximum(end, start)
+
+
+def classify_ripeness_batch(frame: np.ndarray, bboxes: np.ndarray) -> np.ndarray:
+    """Tüm kutuları tek seferde sınıflandırır; `classify_ripeness` ile aynı sonucu verir.
+
+    Kırmızı kanalın toplam-alan tablosu frame başına bir kez hesaplanır; her
+    kutunun ortalaması dört okumayla bulunur. Kutuların toplam alanı (ve kutu
+    başına sabit maliyet) frame'den küçükse tablo kurulmaz, kutular doğrudan
+    toplanır; iki yol da aynı toplamı verir. Kutu kırpma kuralları
+    `classify_ripeness`'teki dilimlemeyle birebir aynıdır (negatif x/y sıfıra
+    çekilir, negatif bitiş sondan sayılır, boş bölge UNRIPE).
+
+    Args:
+        frame: BGR görüntü
+        bboxes: (N, 4) x, y, w, h kutular
+
+    Returns:
+        (N,) int8 olgunluk kodları (`RIPENESS_LEVELS` sırası)
+    """
+    bboxes = np.asarray(bboxes, dtype=np.int64).reshape(-1, 4)
+    codes = np.full(len(bboxes), RIPENESS_CODES[Ripeness.UNRIPE], dtype=np.int8)
+    if not len(bboxes) or frame.ndim != 3 or frame.shape[2] < 3:
+        return codes
+    h, w = frame.shape[:2]
+    x, y, bw, bh = bboxes.T
+    x1, x2 = _slice_bounds(np.maximum(x, 0), x + bw, w)
+    y1, y2 = _slice_bounds(np.maximum(y, 0), y + bh, h)
+    area = (x2 - x1) * (y2 - y1)
+    valid = area > 0
+    if not valid.any():
+        return codes
+
+    x1, x2, y1, y2, area = x1[valid], x2[valid], y1[valid], y2[valid], area[valid]
+    red = frame[:, :, 2]
+    if len(area) * DIRECT_SUM_BOX_COST + area.sum() < h * w:
+        sums = np.array(
+            [red[b:d, a:c].sum(dtype=np.int64) for a, b, c, d in zip(x1.tolist(), y1.tolist(), x2.tolist(), y2.tolist())],
+            dtype=np.int64,
+        )
+    else:
+        table = integral_image(red)
+        sums = table[y2, x2] - table[y1, x2] - table[y2, x1] + table[y1, x1]
+    red_mean = sums / area
+    codes[valid] = np.where(
+        red_mean > RIPE_RED_MEAN,
+        RIPENESS_CODES[Ripeness.RIPE],
+        np.where(red_mean > SEMI_RIPE_RED_MEAN, RIPENESS_CODES[Ripeness.SEMI_RIPE], RIPENESS_CODES[Ripeness.UNRIPE]),
+    )
+    return codes
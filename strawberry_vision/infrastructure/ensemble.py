@@ -0,0 +1,176 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Sequence
+import logging
+
+import numpy as np
+
+from strawberry_vision.domain.batch import DetectionBatch
+from strawberry_vision.domain.entities import Detection
+from strawberry_vision.infrastructure.box_ops import BoxArrays, empty_box_arrays, weighted_box_fusion
+from strawberry_vision.infrastructure.model_registry import get_registry
+from strawberry_vision.lazy import LazyModule
+
+yaml = LazyModule("yaml")
+
+logger = logging.getLogger(__name__)
+
+
+class EnsembleDetector:
+    """Birden fazla modeli çalıştırıp çıktıları weighted box fusion ile birleştiren detector.
+
+    `YOLODetector` ile aynı arayüzü sunar (`detect`, `detect_batch`,
+    `detect_columnar`, ...). Modeller ayrı thread'lerde paralel çalışır
+    (torch ve ONNX Runtime inference sırasında GIL'i bırakır); sonuçlar
+    `weighted_box_fusion` ile vektörel olarak birleştirilir.
+
+    Args:
+        detectors: Çalıştırılacak detector'ler (`detect_arrays_batch` sunmalı)
+        weights: Model başına ağırlık (varsayılan: hepsi 1)
+        iou_threshold: WBF küme eşiği
+        skip_threshold: Füzyondan önce atılacak düşük skor eşiği
+        parallel: Modelleri ayrı thread'lerde çalıştır
+    """
+
+    def __init__(
+        self,
+        detectors: Sequence,
+        weights: Sequence[float] | None = None,
+        iou_threshold: float = 0.55,
+        skip_threshold: float = 0.0,
+        parallel: bool = True,
+    ) -> None:
+        if not detectors:
+            raise ValueError("At least one detector is required")
+        self.detectors = list(detectors)
+        self.weights = [1.0] * len(self.detectors) if weights is None else [float(w) for w in weights]
+        if len(self.weights) != len(self.detectors):
+            raise ValueError(f"Expected {len(self.detectors)} weights, got {len(self.weights)}")
+        self.iou_threshold = iou_threshold
+        self.skip_threshold = skip_threshold
+        self._executor = (
+            ThreadPoolExecutor(max_workers=len(self.detectors), thread_name_prefix="sv-ensemble")
+            if parallel and len(self.detectors) > 1
+            else None
+        )
+        names = [list(d.class_names) for d in self.detectors]
+        if any(n != names[0] for n in names[1:]):
+            logger.warning("Ensemble models have different class names; class ids are fused as-is")
+
+    @classmethod
+    def from_config(cls, config: str | Dict[str, Any], acquire=None) -> "EnsembleDetector":
+        """YAML dosyasından veya dict'ten ensemble oluşturur.
+
+        Beklenen yapı (bkz. configs/ensemble_config.yaml)::
+
+            ensemble:
+              iou_threshold: 0.55
+              skip_threshold: 0.05
+              models:
+                - {path: yolo26n.pt, weight: 1.0}
+                - {path: yolo26m.onnx, backend: onnx, weight: 2.0}
+
+        Modeller varsayılan olarak process genelindeki registry'den alınır.
+        """
+        if isinstance(config, str):
+            with open(config, "r", encoding="utf-8") as f:
+                config = yaml.safe_load(f) or {}
+        cfg = config.get("ensemble", config)
+        models = cfg.get("models") or []
+        if not models:
+            raise ValueError("Ensemble config must list at least one model")
+        acquire = acquire or get_registry().acquire
+        detectors = [
+            acquire(m["path"], backend=m.get("backend", "ultralytics"), **(m.get("options") or {}))
+            for m in models
+        ]
+        return cls(
+            detectors,
+            weights=[m.get("weight", 1.0) for m in models],
+            iou_threshold=cfg.get("iou_threshold", 0.55),
+            skip_threshold=cfg.get("skip_threshold", 0.0),
+            parallel=cfg.get("parallel", True),
+        )
+
+    @property
+    def model(self):
+        """İlk yüklenebilen model (model yoksa None)."""
+        return next((d.model for d in self.detectors if d.model is not None), None)
+
+    @property
+    def class_names(self) -> List[str]:
+        return self.detectors[0].class_names
+
+    @property
+    def imgsz(self) -> int | None:
+        return getattr(self.detectors[0], "imgsz", None)
+
+    def set_imgsz(self, imgsz: int) -> bool:
+        """Tüm modellerin giriş boyutunu değiştirir.
+
+        Bir model boyutu uygulayamazsa (ör. sabit girişli ONNX) değiştirilen
+        modeller eski boyutlarına döndürülür ve False döner; modeller hep aynı
+        boyutta kalır.
+        """
+        applied = []
+        for detector in self.detectors:
+            set_imgsz = getattr(detector, "set_imgsz", None)
+            previous = getattr(detector, "imgsz", None)
+            if set_imgsz is None or not set_imgsz(imgsz):
+                for done, size in applied:
+                    if size is not None:
+                        done.set_imgsz(size)
+                return False
+            applied.append((detector, previous))
+        return True
+
+    def warmup(self, imgsz: int | None = None) -> "EnsembleDetector":
+        self._map(lambda d: d.warmup(imgsz))
+        return self
+
+    def detect(self, frame: np.ndarray) -> List[Detection]:
+        return self.detect_columnar(frame).to_detections()
+
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> List[List[Detection]]:
+        return [batch.to_detections() for batch in self.detect_columnar_batch(frames)]
+
+    def detect_columnar(self, frame: np.ndarray) -> DetectionBatch:
+        return self.to_batch(self.detect_arrays(frame))
+
+    def detect_columnar_batch(self, frames: Sequence[np.ndarray]) -> List[DetectionBatch]:
+        return [self.to_batch(arrays) for arrays in self.detect_arrays_batch(frames)]
+
+    def to_batch(self, arrays: BoxArrays) -> DetectionBatch:
+        return DetectionBatch.from_xyxy(*arrays, class_names=self.class_names)
+
+    def detect_arrays(self, frame: np.ndarray) -> BoxArrays:
+        if frame is None:
+            return empty_box_arrays()
+        return self.detect_arrays_batch([frame])[0]
+
+    def detect_arrays_batch(self, frames: Sequence[np.ndarray]) -> List[BoxArrays]:
+        """Her model frame'leri kendi batch'inde işler; frame başına çıktılar birleştirilir."""
+        per_model = self._map(lambda d: d.detect_arrays_batch(frames))
+        return [
+            weighted_box_fusion(
+                [outputs[i] for outputs in per_model],
+                self.weights,
+                iou_threshold=self.iou_threshold,
+                skip_threshold=self.skip_threshold,
+            )
+            for i in range(len(frames))
+        ]
+
+    def _map(self, fn) -> List[Any]:
+        if self._executor is None:
+            return [fn(d) for d in self.detectors]
+        return list(self._executor.map(fn, self.detectors))
+
+    def close(self) -> None:
+        """Thread havuzunu kapatır ve registry tutamaçlarını bırakır."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for detector in self.detectors:
+            release = getattr(detector, "release", None)
+            if release is not None:
+                release()
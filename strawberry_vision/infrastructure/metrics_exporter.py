@@ -0,0 +1,199 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List
+import logging
+import math
+import threading
+
+from strawberry_vision.infrastructure.model_registry import ModelRegistry, get_registry
+
+logger = logging.getLogger(__name__)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    parts = [f'{k}="{_escape(v)}"' for k, v in labels.items() if v is not None]
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else f"{bound:.6g}"
+
+
+class PrometheusExporter:
+    """Uzun süre çalışan pipeline'lar için Prometheus metrik endpoint'i.
+
+    `get_metrics()` ve aşama histogramlarını Prometheus text formatında
+    `/metrics` adresinden sunar. Scrape sırasında yalnızca sayaçlar okunur ve
+    histogram bucket'ları kopyalanır; inference döngüsü hiçbir kilit almadığı
+    için scrape'ler pipeline'ı bekletmez.
+
+    Args:
+        pipelines: Tek pipeline veya akış adı → pipeline eşlemesi (akış adı `stream` etiketi olur)
+        host: Dinlenecek adres
+        port: Dinlenecek port (0 ise boş bir port seçilir)
+        namespace: Metrik adı öneki
+        bucket_stride: Histogram bucket'larından her kaçında bir yayınlanacağı
+        registry: Model bellek kullanımı okunacak registry (varsayılan: process geneli)
+    """
+
+    def __init__(
+        self,
+        pipelines,
+        host: str = "127.0.0.1",
+        port: int = 9108,
+        namespace: str = "strawberry_vision",
+        bucket_stride: int = 5,
+        registry: ModelRegistry | None = None,
+    ) -> None:
+        self.pipelines: Dict[str | None, object] = pipelines if isinstance(pipelines, dict) else {None: pipelines}
+        self.host = host
+        self.port = port
+        self.namespace = namespace
+        self.bucket_stride = max(1, bucket_stride)
+        self.registry = registry or get_registry()
+        self._server: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> "PrometheusExporter":
+        """HTTP sunucusunu arka plan thread'inde başlatır."""
+        exporter = self
+
+        class _Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/metrics", "/"):
+                    self.send_error(404)
+                    return
+                try:
+                    body = exporter.render().encode("utf-8")
+                except Exception as e:
+                    logger.error(f"Metrics render error: {e}")
+                    self.send_error(500)
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args) -> None:
+                logger.debug("metrics: " + format % args)
+
+        self._server = ThreadingHTTPServer((self.host, self.port), _Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, name="sv-metrics", daemon=True)
+        self._thread.start()
+        logger.info(f"Metrics exporter listening on http://{self.host}:{self.port}/metrics")
+        return self
+
+    def stop(self) -> None:
+        """Sunucuyu durdurur."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            self._thread = None
+
+    def __enter__(self) -> "PrometheusExporter":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def render(self) -> str:
+        """Tüm pipeline'ların metriklerini Prometheus text formatında üretir."""
+        ns = self.namespace
+        families: Dict[str, List[str]] = {}
+        meta = {
+            "frames_processed_total": ("counter", "Processed frames"),
+            "frames_skipped_total": ("counter", "Frames where detection was skipped (motion gate)"),
+            "frames_dropped_total": ("counter", "Frames dropped before reaching the pipeline"),
+            "frames_predicted_total": ("counter", "Frames whose boxes came from track prediction"),
+            "fps": ("gauge", "Average frames per second"),
+            "tracked_total": ("counter", "Objects that received a tracking ID"),
+            "active_tracks": ("gauge", "Tracks currently held by the tracker"),
+            "tracks_dropped_total": ("counter", "Detections left untracked because the track store was full"),
+            "tracker_memory_bytes": ("gauge", "Memory held by the tracker's track store"),
+            "window_frames": ("gauge", "Frames processed in the rolling window"),
+            "window_detections": ("gauge", "Detections per ripeness level in the rolling window"),
+            "unique_individuals": ("gauge", "Distinct tracked individuals per counting region and majority label"),
+            "detections_total": ("counter", "Detections per class"),
+            "stage_latency_seconds": ("histogram", "Pipeline stage latency"),
+            "imgsz": ("gauge", "Current inference image size"),
+            "detect_stride": ("gauge", "Run the detector every N frames"),
+            "adjustments_total": ("counter", "Runtime adjustments of image size / stride"),
+            "model_memory_bytes": ("gauge", "Estimated memory of loaded models"),
+            "model_refs": ("gauge", "Active references to a loaded model"),
+        }
+
+        def add(name: str, line: str) -> None:
+            families.setdefault(name, []).append(line)
+
+        for stream, pipeline in self.pipelines.items():
+            m = pipeline.get_metrics()
+            base = {"stream": stream}
+
+            add("frames_processed_total", f"{ns}_frames_processed_total{_labels(**base)} {m['total_frames']}")
+            add("frames_skipped_total", f"{ns}_frames_skipped_total{_labels(**base)} {m.get('skipped_frames', 0)}")
+            add("frames_dropped_total", f"{ns}_frames_dropped_total{_labels(**base)} {m.get('dropped_frames', 0)}")
+            add("frames_predicted_total", f"{ns}_frames_predicted_total{_labels(**base)} {m.get('predicted_frames', 0)}")
+            add("fps", f"{ns}_fps{_labels(**base)} {m['fps']}")
+            add("tracked_total", f"{ns}_tracked_total{_labels(**base)} {m['total_tracked']}")
+            add("active_tracks", f"{ns}_active_tracks{_labels(**base)} {m.get('active_tracks', 0)}")
+            add("tracks_dropped_total", f"{ns}_tracks_dropped_total{_labels(**base)} {m.get('dropped_tracks', 0)}")
+            add("tracker_memory_bytes", f"{ns}_tracker_memory_bytes{_labels(**base)} {m.get('tracker_memory_bytes', 0)}")
+            if m.get("imgsz"):
+                add("imgsz", f"{ns}_imgsz{_labels(**base)} {m['imgsz']}")
+            add("detect_stride", f"{ns}_detect_stride{_labels(**base)} {m.get('detect_stride', 1)}")
+            add("adjustments_total", f"{ns}_adjustments_total{_labels(**base)} {m.get('adjustment_count', 0)}")
+            for window, stats in m.get("windows", {}).items():
+                if window == "total":
+                    continue
+                add("window_frames", f"{ns}_window_frames{_labels(**base, window=window)} {stats['frames']}")
+                for level, count in sorted(stats["by_ripeness"].items()):
+                    add(
+                        "window_detections",
+                        f"{ns}_window_detections{_labels(**base, window=window, ripeness=level)} {count}",
+                    )
+            for region, labels in m.get("unique_counts", {}).items():
+                for label, count in sorted(labels.items()):
+                    add(
+                        "unique_individuals",
+                        f"{ns}_unique_individuals{_labels(**base, region=region, label=label)} {count}",
+                    )
+            for cls, count in sorted(m.get("detections_by_class", {}).items()):
+                add("detections_total", f"{ns}_detections_total{_labels(**base, **{'class': cls})} {count}")
+
+            latency = getattr(pipeline, "latency", None)
+            if latency is None:
+                continue
+            for stage, histogram in latency.histograms.items():
+                labels = dict(base, stage=stage)
+                buckets = histogram.buckets()
+                exported = buckets[self.bucket_stride - 1 : -1 : self.bucket_stride] + [buckets[-1]]
+                for bound, cumulative in exported:
+                    add(
+                        "stage_latency_seconds",
+                        f"{ns}_stage_latency_seconds_bucket{_labels(**labels, le=_format_bound(bound))} {cumulative}",
+                    )
+                add("stage_latency_seconds", f"{ns}_stage_latency_seconds_sum{_labels(**labels)} {histogram.sum:.9f}")
+                add("stage_latency_seconds", f"{ns}_stage_latency_seconds_count{_labels(**labels)} {buckets[-1][1]}")
+
+        for row in self.registry.memory_report():
+            labels = _labels(model=row["model_path"] or "dummy", backend=row["backend"])
+            add("model_memory_bytes", f"{ns}_model_memory_bytes{labels} {row['memory_bytes']}")
+            add("model_refs", f"{ns}_model_refs{labels} {row['refs']}")
+
+        lines: List[str] = []
+        for name, (kind, help_text) in meta.items():
+            if name not in families:
+                continue
+            lines.append(f"# HELP {ns}_{name} {help_text}")
+            lines.append(f"# TYPE {ns}_{name} {kind}")
+            lines.extend(families[name])
+        return "\n".join(lines) + "\n"
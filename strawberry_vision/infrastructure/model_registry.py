@@ -0,0 +1,315 @@
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+import hashlib
+import logging
+import threading
+import time
+
+import numpy as np
+
+from strawberry_vision.domain.batch import DetectionBatch
+from strawberry_vision.domain.entities import Detection
+from strawberry_vision.infrastructure.box_ops import BoxArrays
+from strawberry_vision.infrastructure.detectors import YOLODetector, int8_model_path
+
+logger = logging.getLogger(__name__)
+
+# (çözümlenmiş yol, backend, dosya hash'i, backend ayarları)
+ModelKey = Tuple[str | None, str, str | None, Tuple[Tuple[str, Any], ...]]
+
+_HASH_CHUNK = 1 << 20
+
+# Modelin varsayılan giriş boyutu henüz kaydedilmedi (hiçbir tutamaç boyut değiştirmedi)
+_UNSET = object()
+
+
+def estimate_model_bytes(model) -> int:
+    """Yüklü modelin ağırlık + sabit tampon belleğini (byte) tahmin eder.
+
+    ultralytics modellerinde torch parametre/buffer boyutları toplanır; ONNX
+    backend'inde model dosyası boyutu ve önceden ayrılmış giriş tamponları sayılır.
+    """
+    if model is None:
+        return 0
+    module = getattr(model, "model", None)
+    if hasattr(module, "parameters"):
+        tensors = list(module.parameters()) + list(module.buffers())
+        return int(sum(t.numel() * t.element_size() for t in tensors))
+    total = 0
+    path = getattr(model, "model_path", None)
+    if path and Path(path).exists():
+        total += Path(path).stat().st_size
+    for name in ("_canvas", "_input"):
+        buffer = getattr(model, name, None)
+        if isinstance(buffer, np.ndarray):
+            total += buffer.nbytes
+    return total
+
+
+def _effective_imgsz(detector) -> int | None:
+    """Detector'ün şu an kullandığı giriş boyutu (ONNX'te tampon boyutu, ultralytics'te None = model varsayılanı)."""
+    imgsz = getattr(detector, "imgsz", None)
+    if imgsz:
+        return imgsz
+    input_hw = getattr(getattr(detector, "model", None), "input_hw", None)
+    return max(input_hw) if input_hw else None
+
+
+class SharedDetector:
+    """Registry'den alınan, thread-safe detector tutamacı (handle).
+
+    Aynı modeli kullanan tüm tutamaçlar tek detector örneğini ve tek kilidi
+    paylaşır; inference çağrıları kilit altında sırayla çalışır. `release()`
+    (veya `with` bloğunun sonu) registry'deki referans sayısını bir azaltır.
+
+    Giriş boyutu tutamaca özeldir: `set_imgsz` yalnızca bu tutamacın
+    inference'ını etkiler (ör. bir akışın `AdaptiveController`'ı). Boyut
+    modele kilit altında, her çağrıdan hemen önce uygulanır; boyut seçmeyen
+    tutamaçlar modelin ilk (varsayılan) boyutuyla çalışır.
+    """
+
+    def __init__(self, registry: "ModelRegistry", entry: "_Entry") -> None:
+        self._registry = registry
+        self._entry = entry
+        self._released = False
+        self._imgsz: int | None = None
+
+    @property
+    def detector(self) -> YOLODetector:
+        if self._released:
+            raise RuntimeError("Detector handle has been released")
+        return self._entry.detector
+
+    @property
+    def key(self) -> ModelKey:
+        return self._entry.key
+
+    @property
+    def imgsz(self) -> int | None:
+        """Bu tutamacın giriş boyutu (seçilmediyse modelinki)."""
+        return self._imgsz if self._imgsz is not None else getattr(self.detector, "imgsz", None)
+
+    def _call(self, method: str, *args, **kwargs):
+        detector = self.detector
+        with self._entry.lock:
+            self._entry.last_used = self._registry.clock()
+            self._apply_imgsz(detector)
+            return getattr(detector, method)(*args, **kwargs)
+
+    def _apply_imgsz(self, detector) -> None:
+        # Kilit altında çağrılır: başka bir tutamacın seçtiği boyut bu çağrıya sızmaz
+        wanted = self._imgsz if self._imgsz is not None else self._entry.base_imgsz
+        if wanted is not _UNSET and detector.imgsz != wanted:
+            detector.set_imgsz(wanted)
+
+    def set_imgsz(self, imgsz: int) -> bool:
+        """Bu tutamacın giriş boyutunu değiştirir (diğer tutamaçlar etkilenmez).
+
+        Returns:
+            Model bu boyutu destekliyorsa True (sabit girişli ONNX modellerinde False)
+        """
+        detector = self.detector
+        set_imgsz = getattr(detector, "set_imgsz", None)
+        if set_imgsz is None:
+            return False
+        with self._entry.lock:
+            if self._entry.base_imgsz is _UNSET:
+                self._entry.base_imgsz = _effective_imgsz(detector)
+            if not set_imgsz(imgsz):
+                self._apply_imgsz(detector)
+                return False
+            self._imgsz = imgsz
+            return True
+
+    def detect(self, frame: np.ndarray) -> List[Detection]:
+        return self._call("detect", frame)
+
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> List[List[Detection]]:
+        return self._call("detect_batch", frames)
+
+    def detect_arrays(self, frame: np.ndarray) -> BoxArrays:
+        return self._call("detect_arrays", frame)
+
+    def detect_arrays_batch(self, frames: Sequence[np.ndarray]) -> List[BoxArrays]:
+        return self._call("detect_arrays_batch", frames)
+
+    def detect_columnar(self, frame: np.ndarray) -> DetectionBatch:
+        return self._call("detect_columnar", frame)
+
+    def detect_columnar_batch(self, frames: Sequence[np.ndarray]) -> List[DetectionBatch]:
+        return self._call("detect_columnar_batch", frames)
+
+    def warmup(self, imgsz: int | None = None) -> "SharedDetector":
+        self._call("warmup", imgsz)
+        return self
+
+    def __getattr__(self, name: str):
+        # Kilit gerektirmeyen alanlar (class_names, model, to_batch, backend...) doğrudan okunur
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.detector, name)
+
+    def release(self) -> None:
+        """Referansı bırakır (birden fazla çağrı güvenlidir)."""
+        if not self._released:
+            self._released = True
+            self._registry._release(self._entry)
+
+    def __enter__(self) -> "SharedDetector":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+@dataclass
+class _Entry:
+    key: ModelKey
+    detector: YOLODetector
+    refs: int = 0
+    created: float = 0.0
+    last_used: float = 0.0
+    last_released: float = 0.0
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    # İlk boyut değişikliğinden önceki giriş boyutu; boyut seçmeyen tutamaçlar buna döner
+    base_imgsz: Any = _UNSET
+
+
+class ModelRegistry:
+    """Process genelinde paylaşılan model kayıt defteri.
+
+    Aynı model yolu, backend, dosya içeriği (SHA-256) ve backend ayarları için
+    tek bir detector yüklenir ve `acquire()` çağrılarına paylaşılan tutamaçlar
+    verilir. Referans sayısı sıfıra inen modeller `idle_timeout` saniye
+    kullanılmazsa bellekten atılır; böylece dosya değişirse (farklı hash) yeni
+    model yüklenir, eskisi boşa çıkınca temizlenir.
+
+    Args:
+        idle_timeout: Referanssız modelin tutulacağı süre (saniye); None ise hiç atılmaz
+        factory: Detector oluşturucu (varsayılan: YOLODetector)
+        clock: Zaman kaynağı (test için değiştirilebilir)
+    """
+
+    def __init__(
+        self,
+        idle_timeout: float | None = 300.0,
+        factory: Callable[..., YOLODetector] = YOLODetector,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.idle_timeout = idle_timeout
+        self.factory = factory
+        self.clock = clock
+        self._entries: Dict[ModelKey, _Entry] = {}
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+        self._lock = threading.RLock()
+
+    def acquire(self, model_path: str | None = None, backend: str = "ultralytics", **options) -> SharedDetector:
+        """Model için paylaşılan tutamaç döndürür; model yoksa oluşturulur."""
+        key = self.key_for(model_path, backend, **options)
+        with self._lock:
+            self.evict_idle()
+            entry = self._entries.get(key)
+            if entry is None:
+                now = self.clock()
+                entry = _Entry(key=key, detector=self.factory(model_path=model_path, backend=backend, **options), created=now, last_used=now)
+                self._entries[key] = entry
+                logger.info(f"Model registered: {model_path or '<dummy>'} ({backend})")
+            entry.refs += 1
+            return SharedDetector(self, entry)
+
+    def key_for(self, model_path: str | None, backend: str = "ultralytics", **options) -> ModelKey:
+        """Model yolu, backend, dosya hash'i ve ayarlardan registry anahtarı üretir."""
+        path = None
+        if model_path:
+            actual = int8_model_path(model_path) if backend == "onnx-int8" else model_path
+            path = str(Path(actual).resolve())
+        return (path, backend, self.file_hash(path), tuple(sorted(options.items())))
+
+    def file_hash(self, path: str | None) -> str | None:
+        """Dosyanın SHA-256 özeti; dosya değişmedikçe (mtime, boyut) yeniden hesaplanmaz."""
+        if not path:
+            return None
+        try:
+            stat = Path(path).stat()
+        except OSError:
+            return None
+        cache_key = (path, stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._hashes.get(cache_key)
+        if cached is not None:
+            return cached
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+                digest.update(chunk)
+        value = digest.hexdigest()
+        with self._lock:
+            self._hashes[cache_key] = value
+        return value
+
+    def _release(self, entry: _Entry) -> None:
+        with self._lock:
+            entry.refs = max(0, entry.refs - 1)
+            if entry.refs == 0:
+                entry.last_released = self.clock()
+            self.evict_idle()
+
+    def evict_idle(self) -> List[ModelKey]:
+        """Referanssız ve `idle_timeout` süresince kullanılmamış modelleri atar."""
+        if self.idle_timeout is None:
+            return []
+        now = self.clock()
+        with self._lock:
+            evicted = [
+                key
+                for key, entry in self._entries.items()
+                if entry.refs == 0 and now - max(entry.last_used, entry.last_released) >= self.idle_timeout
+            ]
+            for key in evicted:
+                del self._entries[key]
+                logger.info(f"Model evicted after idle timeout: {key[0] or '<dummy>'} ({key[1]})")
+        return evicted
+
+    def memory_report(self) -> List[Dict[str, Any]]:
+        """Kayıtlı her model için referans sayısı, boşta kalma süresi ve bellek kullanımı."""
+        now = self.clock()
+        with self._lock:
+            entries = list(self._entries.values())
+        report = []
+        for entry in entries:
+            path, backend, file_hash, _ = entry.key
+            detector = entry.detector
+            loaded = getattr(detector, "loaded", True)
+            report.append({
+                "model_path": path,
+                "backend": backend,
+                "hash": file_hash[:12] if file_hash else None,
+                "refs": entry.refs,
+                "loaded": loaded,
+                "memory_bytes": estimate_model_bytes(detector.model) if loaded else 0,
+                "idle_seconds": round(now - entry.last_used, 3),
+            })
+        return report
+
+    def clear(self) -> None:
+        """Tüm modelleri (referanslara bakmadan) bırakır."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_default_registry: ModelRegistry | None = None
+_default_lock = threading.Lock()
+
+
+def get_registry() -> ModelRegistry:
+    """Process genelindeki varsayılan registry."""
+    global _default_registry
+    if _default_registry is None:
+        with _default_lock:
+            if _default_registry is None:
+                _default_registry = ModelRegistry()
+    return _default_registry
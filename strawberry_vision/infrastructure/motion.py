@@ -0,0 +1,78 @@
+import logging
+
+import numpy as np
+
+from strawberry_vision.lazy import LazyModule
+
+cv2 = LazyModule("cv2")
+
+logger = logging.getLogger(__name__)
+
+
+class MotionGate:
+    """Değişmeyen frame'lerde detector'ü atlamak için hareket kapısı.
+
+    Frame küçültülmüş gri tonlamalı hale getirilir ve en son tam işlenen frame
+    ile piksel bazında (vektörel) mutlak fark alınır. Eşiği aşan piksel oranı
+    `min_changed_ratio` altında kalırsa frame "değişmemiş" sayılır. Yavaş
+    değişimlerin (ışık, kayma) birikmesine karşı her `refresh_interval` frame'de
+    bir işleme zorlanır.
+    """
+
+    def __init__(
+        self,
+        pixel_threshold: int = 15,
+        min_changed_ratio: float = 0.002,
+        downscale_width: int = 160,
+        refresh_interval: int = 30,
+    ) -> None:
+        if downscale_width < 1:
+            raise ValueError(f"downscale_width must be >= 1, got {downscale_width}")
+        self.pixel_threshold = pixel_threshold
+        self.min_changed_ratio = min_changed_ratio
+        self.downscale_width = downscale_width
+        self.refresh_interval = refresh_interval
+        self._reference: np.ndarray | None = None
+        self._since_refresh = 0
+
+    def should_process(self, frame: np.ndarray) -> bool:
+        """Frame'in detector'den geçmesi gerekiyorsa True döndürür.
+
+        True döndüğünde frame yeni referans olarak saklanır.
+        """
+        small = self._downscale(frame)
+        self._since_refresh += 1
+        if (
+            self._reference is None
+            or self._reference.shape != small.shape
+            or (self.refresh_interval > 0 and self._since_refresh >= self.refresh_interval)
+            or self.changed_ratio(small) > self.min_changed_ratio
+        ):
+            self._reference = small
+            self._since_refresh = 0
+            return True
+        return False
+
+    def changed_ratio(self, small: np.ndarray) -> float:
+        """Küçültülmüş frame'de referansa göre değişen piksel oranı."""
+        if cv2:
+            diff = cv2.absdiff(small, self._reference)
+        else:
+            diff = np.abs(small.astype(np.int16) - self._reference.astype(np.int16))
+        return float(np.count_nonzero(diff > self.pixel_threshold)) / diff.size
+
+    def reset(self) -> None:
+        """Referans frame'i temizler."""
+        self._reference = None
+        self._since_refresh = 0
+
+    def _downscale(self, frame: np.ndarray) -> np.ndarray:
+        h, w = frame.shape[:2]
+        step = max(1, w // self.downscale_width)
+        if cv2:
+            gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+            return cv2.resize(gray, (max(1, w // step), max(1, h // step)), interpolation=cv2.INTER_AREA)
+        small = frame[::step, ::step]
+        if small.ndim == 3:
+            small = small.mean(axis=2)
+        return small.astype(np.uint8)
@@ -0,0 +1,158 @@
+from typing import Sequence, Tuple
+import logging
+
+import numpy as np
+
+from strawberry_vision.infrastructure.box_ops import BoxArrays, cxcywh_to_xyxy, nms
+from strawberry_vision.lazy import LazyModule
+
+cv2 = LazyModule("cv2")
+ort = LazyModule("onnxruntime")
+
+logger = logging.getLogger(__name__)
+
+LETTERBOX_FILL = 114
+
+
+class OnnxBackend:
+    """ONNX Runtime ile CPU inference backend'i.
+
+    Dışa aktarılmış (`YOLO.export(format="onnx")`) YOLO modelini tek bir
+    `InferenceSession` içinde tutar ve her çağrıda yeniden kullanır. Letterbox
+    ön işleme önceden ayrılmış tamponlara yazılır; giriş tamponu session'a bir kez
+    bağlanır (IOBinding). Çıktılar NumPy ile vektörel olarak çözülür ve NMS uygulanır.
+
+    İki çıktı düzeni desteklenir:
+        - (1, 4 + nc, N): klasik YOLOv8/11 başlığı (cx, cy, w, h, sınıf skorları) → NMS gerekir
+        - (1, N, 6): uçtan uca modeller (x1, y1, x2, y2, skor, sınıf) → NMS gerekmez
+    """
+
+    def __init__(
+        self,
+        model_path: str,
+        imgsz: int | None = None,
+        conf_threshold: float = 0.25,
+        iou_threshold: float = 0.7,
+        max_det: int = 300,
+        intra_op_threads: int | None = None,
+        providers: Sequence[str] = ("CPUExecutionProvider",),
+        session=None,
+    ) -> None:
+        if session is None:
+            if not ort:
+                raise RuntimeError("onnxruntime is not installed")
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            if intra_op_threads:
+                options.intra_op_num_threads = intra_op_threads
+            session = ort.InferenceSession(model_path, sess_options=options, providers=list(providers))
+        self.session = session
+        self.model_path = model_path
+        self.conf_threshold = conf_threshold
+        self.iou_threshold = iou_threshold
+        self.max_det = max_det
+
+        model_input = session.get_inputs()[0]
+        self.input_name = model_input.name
+        self.output_name = session.get_outputs()[0].name
+        h, w = model_input.shape[2], model_input.shape[3]
+        # Dinamik eksenli modellerde boyut isim (str) olarak gelir
+        self.dynamic = not isinstance(h, int) or not isinstance(w, int)
+        if self.dynamic:
+            h = w = imgsz or 640
+        self._allocate(h, w)
+        logger.info(f"ONNX model loaded: {model_path} (input {w}x{h})")
+
+    def _allocate(self, h: int, w: int) -> None:
+        """Letterbox ve giriş tamponlarını ayırır ve girişi session'a bağlar."""
+        self.input_hw = (h, w)
+        self._canvas = np.full((h, w, 3), LETTERBOX_FILL, dtype=np.uint8)
+        self._input = np.empty((1, 3, h, w), dtype=np.float32)
+        self._binding = None
+        if hasattr(self.session, "io_binding"):
+            try:
+                self._binding = self.session.io_binding()
+                self._binding.bind_cpu_input(self.input_name, self._input)
+                self._binding.bind_output(self.output_name, "cpu")
+            except Exception as e:
+                logger.warning(f"IOBinding unavailable, falling back to session.run: {e}")
+                self._binding = None
+
+    def set_input_size(self, imgsz: int) -> bool:
+        """Dinamik eksenli modellerde giriş boyutunu değiştirir; sabit modellerde False döner."""
+        if not self.dynamic:
+            return False
+        if self.input_hw != (imgsz, imgsz):
+            self._allocate(imgsz, imgsz)
+        return True
+
+    def letterbox(self, frame: np.ndarray) -> Tuple[float, Tuple[int, int]]:
+        """Frame'i oranı koruyarak giriş tamponuna yerleştirir.
+
+        Returns:
+            (ölçek oranı, (sol, üst) dolgu)
+        """
+        if not cv2:
+            raise RuntimeError("OpenCV is required for ONNX preprocessing")
+        h, w = self.input_hw
+        fh, fw = frame.shape[:2]
+        ratio = min(h / fh, w / fw)
+        nh, nw = int(round(fh * ratio)), int(round(fw * ratio))
+        top, left = (h - nh) // 2, (w - nw) // 2
+
+        self._canvas.fill(LETTERBOX_FILL)
+        resized = frame if (nh, nw) == (fh, fw) else cv2.resize(frame, (nw, nh), interpolation=cv2.INTER_LINEAR)
+        self._canvas[top : top + nh, left : left + nw] = resized
+        # BGR → RGB, HWC → CHW, [0, 255] → [0, 1]; doğrudan bağlı giriş tamponuna yazılır
+        np.multiply(self._canvas[:, :, ::-1].transpose(2, 0, 1), 1.0 / 255.0, out=self._input[0], casting="unsafe")
+        return ratio, (left, top)
+
+    def predict(self, frame: np.ndarray) -> BoxArrays:
+        """Tek frame için kutuları frame koordinatlarında döndürür."""
+        ratio, pad = self.letterbox(frame)
+        if self._binding is not None:
+            self.session.run_with_iobinding(self._binding)
+            output = self._binding.copy_outputs_to_cpu()[0]
+        else:
+            output = self.session.run([self.output_name], {self.input_name: self._input})[0]
+        return self.decode(output, ratio, pad, frame.shape[:2])
+
+    def decode(
+        self,
+        output: np.ndarray,
+        ratio: float,
+        pad: Tuple[int, int],
+        frame_hw: Tuple[int, int],
+    ) -> BoxArrays:
+        """Ham model çıktısını frame koordinatlarında kutulara çevirir."""
+        pred = output[0]
+        if pred.ndim == 2 and pred.shape[1] == 6 and pred.shape[0] != 6:
+            # Uçtan uca çıktı: (N, 6)
+            scores = pred[:, 4]
+            mask = scores > self.conf_threshold
+            boxes = pred[mask, :4]
+            scores = scores[mask]
+            class_ids = pred[mask, 5].astype(np.int64)
+            order = np.argsort(-scores, kind="stable")[: self.max_det]
+            boxes, scores, class_ids = boxes[order], scores[order], class_ids[order]
+        else:
+            # (4 + nc, N) → (N, 4 + nc)
+            pred = pred.T
+            class_scores = pred[:, 4:]
+            class_ids = class_scores.argmax(axis=1)
+            scores = class_scores[np.arange(len(pred)), class_ids]
+            mask = scores > self.conf_threshold
+            boxes = cxcywh_to_xyxy(pred[mask, :4])
+            scores = scores[mask]
+            class_ids = class_ids[mask]
+            keep = nms(boxes, scores, self.iou_threshold, class_ids=class_ids, max_det=self.max_det)
+            boxes, scores, class_ids = boxes[keep], scores[keep], class_ids[keep]
+
+        boxes = boxes.astype(np.float32, copy=True)
+        boxes[:, [0, 2]] -= pad[0]
+        boxes[:, [1, 3]] -= pad[1]
+        boxes /= ratio
+        fh, fw = frame_hw
+        boxes[:, [0, 2]] = boxes[:, [0, 2]].clip(0, fw)
+        boxes[:, [1, 3]] = boxes[:, [1, 3]].clip(0, fh)
+        return boxes, scores.astype(np.float32), class_ids.astype(np.int64)
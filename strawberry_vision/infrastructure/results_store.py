@@ -0,0 +1,344 @@
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, List, Sequence, Tuple
+import logging
+import queue
+import sqlite3
+import threading
+import time
+
+from strawberry_vision.domain.batch import RIPENESS_LEVELS, UNTRACKED, DetectionBatch
+from strawberry_vision.domain.zones import CountingRegion, CountingZone, box_centers, zone_matrix
+from strawberry_vision.infrastructure.counting_config import regions_for
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS frames (
+    id INTEGER PRIMARY KEY,
+    camera TEXT NOT NULL,
+    ts REAL NOT NULL,
+    frame INTEGER NOT NULL,
+    total INTEGER NOT NULL,
+    tracked INTEGER NOT NULL,
+    skipped INTEGER NOT NULL,
+    predicted INTEGER NOT NULL,
+    processing_time REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS detections (
+    frame_id INTEGER NOT NULL REFERENCES frames(id),
+    camera TEXT NOT NULL,
+    ts REAL NOT NULL,
+    tray TEXT,
+    class TEXT NOT NULL,
+    ripeness TEXT NOT NULL,
+    score REAL NOT NULL,
+    track_id INTEGER,
+    x INTEGER NOT NULL,
+    y INTEGER NOT NULL,
+    w INTEGER NOT NULL,
+    h INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_frames_camera_ts ON frames(camera, ts);
+CREATE INDEX IF NOT EXISTS idx_frames_ts ON frames(ts);
+CREATE INDEX IF NOT EXISTS idx_detections_camera_ts ON detections(camera, ts);
+CREATE INDEX IF NOT EXISTS idx_detections_class_ts ON detections(class, ts);
+CREATE INDEX IF NOT EXISTS idx_detections_ts ON detections(ts);
+"""
+
+_STOP = object()
+
+
+class _Flush:
+    """Writer'ın bekleyen kayıtları hemen yazması için kuyruk işareti."""
+
+
+class SqliteResultsSink:
+    """Frame özetlerini ve tespit satırlarını SQLite'a (WAL) yazan sonuç deposu.
+
+    `submit` yalnızca frame'in dizilerini sınırlı bir kuyruğa bırakır
+    (`put_nowait`); satır üretimi, tepsi ataması ve disk yazımı arka plandaki
+    tek writer thread'inde yapılır. Kuyruk doluysa frame atılır ve `dropped`
+    artar, böylece inference döngüsü diske hiç beklemez. Writer kayıtları
+    `batch_size` frame'e veya `flush_interval` saniyeye kadar biriktirip tek
+    transaction'da `executemany` ile yazar. WAL modunda okuyucular (sorgu API'si)
+    yazımı engellemez.
+
+    Tespitler kamera, zaman ve sınıf üzerinden indekslenir. `trays` verilirse
+    (kamera → sayım bölgeleri, bkz. `load_counting_config`) kutu merkezi
+    içinde kalan ilk bölgenin adı `tray` sütununa yazılır.
+
+    Args:
+        path: Veritabanı dosyası
+        batch_size: Tek transaction'daki en fazla frame sayısı
+        flush_interval: Bekleyen kayıtların en geç yazılma süresi (saniye)
+        queue_size: Writer kuyruğunun kapasitesi (frame)
+        trays: Kamera → bölgeler; yalnızca `CountingZone`'lar kullanılır
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        batch_size: int = 256,
+        flush_interval: float = 1.0,
+        queue_size: int = 4096,
+        trays: Dict[str, Sequence[CountingRegion]] | None = None,
+    ) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.trays = {
+            name: [r for r in regions if isinstance(r, CountingZone)] for name, regions in (trays or {}).items()
+        }
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._dropped = 0
+        self._written = 0
+        self._failed = 0
+        self._ready = threading.Event()
+        self._error: BaseException | None = None
+        self._thread = threading.Thread(target=self._run, name="sv-results-writer", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        if self._error is not None:
+            raise self._error
+
+    def submit(self, camera: str, result, batch: DetectionBatch, timestamp: float | None = None) -> bool:
+        """Frame'i yazım kuyruğuna bırakır; kuyruk doluysa atar (bloklamaz).
+
+        Returns:
+            Kuyruğa alındıysa True
+        """
+        item = (
+            str(camera),
+            time.time() if timestamp is None else timestamp,
+            result.frame_processed,
+            int(result.skipped),
+            int(result.predicted),
+            result.processing_time,
+            batch,
+        )
+        try:
+            self._queue.put_nowait(item)
+        except queue.Full:
+            self._dropped += 1
+            return False
+        return True
+
+    # --- writer thread ---
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+
+    def _run(self) -> None:
+        try:
+            conn = self._connect()
+            conn.executescript(SCHEMA)
+            self._next_id = conn.execute("SELECT COALESCE(MAX(id), 0) + 1 FROM frames").fetchone()[0]
+        except BaseException as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+
+        pending: List[tuple] = []
+        deadline = 0.0
+        with closing(conn):
+            while True:
+                timeout = self.flush_interval if not pending else max(0.0, deadline - time.monotonic())
+                try:
+                    item = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    item = None
+                if item is not None and item is not _STOP and not isinstance(item, _Flush):
+                    if not pending:
+                        deadline = time.monotonic() + self.flush_interval
+                    pending.append(item)
+                    if len(pending) < self.batch_size and time.monotonic() < deadline:
+                        continue
+                if pending:
+                    self._write(conn, pending)
+                    for _ in pending:
+                        self._queue.task_done()
+                    pending = []
+                if item is not None and not isinstance(item, tuple):
+                    self._queue.task_done()
+                if item is _STOP:
+                    return
+
+    def _rows(self, item: tuple, frame_id: int) -> Tuple[tuple, List[tuple]]:
+        camera, ts, frame, skipped, predicted, processing_time, batch = item
+        tracked = batch.track_ids != UNTRACKED
+        frame_row = (frame_id, camera, ts, frame, len(batch), int(tracked.sum()), skipped, predicted, processing_time)
+        if not len(batch):
+            return frame_row, []
+        names = batch.class_names or tuple(str(i) for i in range(int(batch.class_ids.max()) + 1))
+        classes = [names[i] for i in batch.class_ids.tolist()]
+        ripeness = [RIPENESS_LEVELS[code].value for code in batch.ripeness.tolist()]
+        track_ids = [t if t != UNTRACKED else None for t in batch.track_ids.tolist()]
+        zones = regions_for(self.trays, camera) if self.trays else []
+        if zones:
+            inside = zone_matrix(box_centers(batch.bboxes), zones)
+            first = inside.argmax(axis=1)
+            trays = [zones[k].name if hit else None for k, hit in zip(first.tolist(), inside.any(axis=1).tolist())]
+        else:
+            trays = [None] * len(batch)
+        rows = [
+            (frame_id, camera, ts, tray, cls, level, score, track_id, x, y, w, h)
+            for tray, cls, level, score, track_id, (x, y, w, h) in zip(
+                trays, classes, ripeness, batch.scores.tolist(), track_ids, batch.bboxes.tolist()
+            )
+        ]
+        return frame_row, rows
+
+    def _write(self, conn: sqlite3.Connection, items: List[tuple]) -> None:
+        frames, detections = [], []
+        for item in items:
+            try:
+                frame_row, rows = self._rows(item, self._next_id + len(frames))
+            except Exception as e:
+                # Bozuk frame yalnızca kendisini düşürür; writer thread'i ve partinin geri kalanı yaşar
+                self._failed += 1
+                logger.error(f"Results sink skipped frame {item[2]} of {item[0]}: {e!r}")
+                continue
+            frames.append(frame_row)
+            detections.extend(rows)
+        if not frames:
+            return
+        try:
+            conn.execute("BEGIN")
+            conn.executemany("INSERT INTO frames VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", frames)
+            conn.executemany("INSERT INTO detections VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", detections)
+            conn.execute("COMMIT")
+        except sqlite3.Error as e:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            self._failed += len(frames)
+            logger.error(f"Results sink write failed ({len(frames)} frames): {e}")
+            return
+        self._next_id += len(frames)
+        self._written += len(frames)
+
+    # --- yaşam döngüsü ---
+
+    def flush(self) -> None:
+        """Kuyruktaki tüm frame'ler yazılana kadar bekler (inference döngüsünden çağrılmamalı)."""
+        if self._thread.is_alive():
+            self._queue.put(_Flush())
+            self._queue.join()
+
+    def close(self) -> None:
+        """Bekleyenleri yazar ve writer thread'ini durdurur."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+        logger.info(f"Results sink {self.path}: {self._written} frames written, {self._dropped} dropped, {self._failed} failed")
+
+    def __enter__(self) -> "SqliteResultsSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def written(self) -> int:
+        return self._written
+
+    @property
+    def dropped(self) -> int:
+        """Kuyruk dolu olduğu için yazılmadan atılan frame sayısı."""
+        return self._dropped
+
+    @property
+    def failed(self) -> int:
+        """Satırları kurulamadığı ya da SQLite yazımı başarısız olduğu için kaybedilen frame sayısı."""
+        return self._failed
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize()
+
+    # --- sorgu API'si ---
+
+    def query(self, sql: str, params: Sequence[Any] = ()) -> List[Dict[str, Any]]:
+        """Ayrı bir okuma bağlantısıyla sorgu çalıştırır; satırları sözlük olarak döndürür."""
+        with closing(sqlite3.connect(self.path)) as conn:
+            conn.row_factory = sqlite3.Row
+            return [dict(row) for row in conn.execute(sql, params)]
+
+    @staticmethod
+    def _where(since: float | None, until: float | None, camera: str | None) -> Tuple[str, List[Any]]:
+        clauses, params = [], []
+        if camera is not None:
+            clauses.append("camera = ?")
+            params.append(camera)
+        if since is not None:
+            clauses.append("ts >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("ts < ?")
+            params.append(until)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def prevalence(
+        self,
+        label: str,
+        bucket: float = 3600.0,
+        since: float | None = None,
+        until: float | None = None,
+        camera: str | None = None,
+        unique: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Kamera, tepsi ve zaman kovası başına `label` sınıfının oranı.
+
+        Ör. son bir haftada tepsi ve saat başına Grasserie oranı::
+
+            sink.prevalence("Grasserie", bucket=3600, since=time.time() - 7 * 86400)
+
+        Args:
+            label: Sınıf adı
+            bucket: Zaman kovası (saniye)
+            since, until: Zaman aralığı (epoch saniye, [since, until))
+            camera: Yalnızca bu kamera
+            unique: Tespit yerine benzersiz track'leri say (takipsizler hariç)
+
+        Returns:
+            camera, tray, bucket_start, count, total, prevalence alanlı satırlar
+        """
+        where, params = self._where(since, until, camera)
+        if unique:
+            count = "COUNT(DISTINCT CASE WHEN class = ? THEN track_id END)"
+            total = "COUNT(DISTINCT track_id)"
+        else:
+            count = "SUM(class = ?)"
+            total = "COUNT(*)"
+        sql = (
+            f"SELECT camera, tray, CAST(ts / ? AS INTEGER) * ? AS bucket_start, {count} AS count, {total} AS total "
+            f"FROM detections{where} GROUP BY camera, tray, bucket_start ORDER BY camera, tray, bucket_start"
+        )
+        rows = self.query(sql, [bucket, bucket, label, *params])
+        for row in rows:
+            row["prevalence"] = row["count"] / row["total"] if row["total"] else 0.0
+        return rows
+
+    def class_counts(
+        self, since: float | None = None, until: float | None = None, camera: str | None = None
+    ) -> Dict[str, int]:
+        """Aralıktaki sınıf başına tespit sayısı."""
+        where, params = self._where(since, until, camera)
+        rows = self.query(f"SELECT class, COUNT(*) AS n FROM detections{where} GROUP BY class ORDER BY class", params)
+        return {row["class"]: row["n"] for row in rows}
+
+    def frames(
+        self,
+        since: float | None = None,
+        until: float | None = None,
+        camera: str | None = None,
+        limit: int = 1000,
+    ) -> List[Dict[str, Any]]:
+        """Aralıktaki frame özetleri (en yeni önce)."""
+        where, params = self._where(since, until, camera)
+        return self.query(f"SELECT * FROM frames{where} ORDER BY ts DESC, id DESC LIMIT ?", [*params, limit])
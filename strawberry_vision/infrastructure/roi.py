@@ -0,0 +1,212 @@
+from typing import Any, Dict, List, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from strawberry_vision.domain.batch import DetectionBatch
+from strawberry_vision.domain.entities import Detection
+from strawberry_vision.infrastructure.box_ops import BoxArrays, concat_box_arrays, empty_box_arrays, nms
+from strawberry_vision.lazy import LazyModule
+
+cv2 = LazyModule("cv2")
+yaml = LazyModule("yaml")
+
+logger = logging.getLogger(__name__)
+
+# Kameraya özel ROI tanımı olmayan kaynaklar için kullanılan anahtar
+DEFAULT_ROI_KEY = "default"
+
+
+def load_roi_config(config: str | Dict[str, Any]) -> Dict[str, List[np.ndarray]]:
+    """YAML dosyasından veya dict'ten kamera → ROI poligonları eşlemesini okur.
+
+    Beklenen yapı (bkz. configs/roi_config.yaml)::
+
+        rois:
+          "0":
+            - [[120, 80], [1160, 80], [1160, 690], [120, 690]]
+          default:
+            - [[0, 0], [1280, 0], [1280, 720], [0, 720]]
+    """
+    if isinstance(config, str):
+        with open(config, "r", encoding="utf-8") as f:
+            config = yaml.safe_load(f) or {}
+    cfg = config.get("rois", config)
+    return {str(name): [as_polygon(p) for p in polygons or []] for name, polygons in cfg.items()}
+
+
+def rois_for(config: Dict[str, List[np.ndarray]], name: str) -> List[np.ndarray] | None:
+    """Kaynağa ait ROI listesi; tanım yoksa `default`, o da yoksa None (tüm frame)."""
+    return config.get(str(name), config.get(DEFAULT_ROI_KEY))
+
+
+def as_polygon(points: Sequence[Sequence[float]]) -> np.ndarray:
+    """Nokta listesini (K, 2) int32 poligona çevirir."""
+    polygon = np.asarray(points, dtype=np.float64).round().astype(np.int32)
+    if polygon.ndim != 2 or polygon.shape[1] != 2 or len(polygon) < 3:
+        raise ValueError(f"ROI polygon must have at least 3 (x, y) points, got shape {polygon.shape}")
+    return polygon
+
+
+def polygon_mask(polygons: Sequence[np.ndarray], frame_hw: Tuple[int, int]) -> np.ndarray:
+    """Poligonların içini True yapan (H, W) bool maske."""
+    h, w = frame_hw
+    if cv2:
+        mask = np.zeros((h, w), dtype=np.uint8)
+        # Tek çağrıda örtüşen poligonların kesişimi boş kalır (even-odd); her biri ayrı doldurulur
+        for polygon in polygons:
+            cv2.fillPoly(mask, [np.ascontiguousarray(polygon, dtype=np.int32)], 1)
+        return mask.astype(bool)
+    # cv2 yoksa piksel merkezleri için çift-tek (even-odd) kuralı
+    ys, xs = np.mgrid[0:h, 0:w]
+    mask = np.zeros((h, w), dtype=bool)
+    for polygon in polygons:
+        inside = np.zeros((h, w), dtype=bool)
+        x0, y0 = polygon[:, 0].astype(np.float64), polygon[:, 1].astype(np.float64)
+        x1, y1 = np.roll(x0, -1), np.roll(y0, -1)
+        for ax, ay, bx, by in zip(x0, y0, x1, y1):
+            if ay == by:
+                continue
+            crosses = (ys >= min(ay, by)) & (ys < max(ay, by))
+            inside ^= crosses & (xs <= ax + (ys - ay) * (bx - ax) / (by - ay))
+        mask |= inside
+    return mask
+
+
+def polygon_rects(polygons: Sequence[np.ndarray], frame_hw: Tuple[int, int]) -> np.ndarray:
+    """Poligonları çevreleyen, frame'e kırpılmış dikdörtgenler (M, 4) x1, y1, x2, y2.
+
+    Frame dışında kalan (alanı sıfır) dikdörtgenler atılır.
+    """
+    h, w = frame_hw
+    if not polygons:
+        return np.zeros((0, 4), dtype=np.int64)
+    rects = np.array(
+        [[p[:, 0].min(), p[:, 1].min(), p[:, 0].max() + 1, p[:, 1].max() + 1] for p in polygons],
+        dtype=np.int64,
+    )
+    rects[:, [0, 2]] = rects[:, [0, 2]].clip(0, w)
+    rects[:, [1, 3]] = rects[:, [1, 3]].clip(0, h)
+    return rects[(rects[:, 2] > rects[:, 0]) & (rects[:, 3] > rects[:, 1])]
+
+
+class RoiDetector:
+    """Yalnızca tepsi alanlarını (ROI poligonları) işleyen detector sarmalayıcısı.
+
+    Her poligonun çevreleyen dikdörtgeni kırpılır ve kırpıntılar `batch_size`'lık
+    gruplar hâlinde tek predict çağrısıyla detector'e verilir. Kutular frame
+    koordinatlarına taşınır; örtüşen ROI'lerdeki tekrarlar sınıf bazlı NMS ile
+    birleştirilir. Merkezi ROI dışında kalan tespitler, frame boyutu başına bir
+    kez hazırlanan maskeden tek indeksleme ile atılır.
+
+    Args:
+        detector: Kırpıntıları işleyecek detector (`detect_arrays_batch` sunmalı)
+        polygons: Frame koordinatlarında ROI poligonları [(x, y), ...]
+        batch_size: Tek predict çağrısındaki kırpıntı sayısı
+        merge_threshold: ROI'ler arası birleştirme eşiği
+        merge_metric: "ios" (varsayılan) veya "iou"
+    """
+
+    def __init__(
+        self,
+        detector,
+        polygons: Sequence[Sequence[Sequence[float]]],
+        batch_size: int = 8,
+        merge_threshold: float = 0.6,
+        merge_metric: str = "ios",
+    ) -> None:
+        self.polygons = [as_polygon(p) for p in polygons]
+        if not self.polygons:
+            raise ValueError("At least one ROI polygon is required")
+        self.detector = detector
+        self.batch_size = max(1, batch_size)
+        self.merge_threshold = merge_threshold
+        self.merge_metric = merge_metric
+        self._layouts: Dict[Tuple[int, int], Tuple[np.ndarray, np.ndarray]] = {}
+
+    @property
+    def model(self):
+        return self.detector.model
+
+    @property
+    def class_names(self) -> List[str]:
+        return self.detector.class_names
+
+    @property
+    def imgsz(self) -> int | None:
+        return getattr(self.detector, "imgsz", None)
+
+    def set_imgsz(self, imgsz: int) -> bool:
+        """İç detector'ün giriş boyutunu değiştirir; desteklemiyorsa False."""
+        set_imgsz = getattr(self.detector, "set_imgsz", None)
+        return bool(set_imgsz is not None and set_imgsz(imgsz))
+
+    def warmup(self, imgsz: int | None = None) -> "RoiDetector":
+        self.detector.warmup(imgsz)
+        return self
+
+    def layout(self, frame_hw: Tuple[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Frame boyutu için (ROI maskesi, kırpma dikdörtgenleri); boyut başına bir kez hesaplanır."""
+        frame_hw = (int(frame_hw[0]), int(frame_hw[1]))
+        cached = self._layouts.get(frame_hw)
+        if cached is None:
+            cached = (polygon_mask(self.polygons, frame_hw), polygon_rects(self.polygons, frame_hw))
+            self._layouts[frame_hw] = cached
+            coverage = cached[0].mean() if cached[0].size else 0.0
+            logger.info(f"ROI layout for {frame_hw[1]}x{frame_hw[0]}: {len(cached[1])} crops, {coverage:.0%} of frame")
+        return cached
+
+    def detect(self, frame: np.ndarray) -> List[Detection]:
+        return self.detect_columnar(frame).to_detections()
+
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> List[List[Detection]]:
+        return [self.detect(frame) for frame in frames]
+
+    def detect_columnar(self, frame: np.ndarray) -> DetectionBatch:
+        return self.detector.to_batch(self.detect_arrays(frame))
+
+    def detect_columnar_batch(self, frames: Sequence[np.ndarray]) -> List[DetectionBatch]:
+        return [self.detect_columnar(frame) for frame in frames]
+
+    def detect_arrays_batch(self, frames: Sequence[np.ndarray]) -> List[BoxArrays]:
+        return [self.detect_arrays(frame) for frame in frames]
+
+    def detect_arrays(self, frame: np.ndarray) -> BoxArrays:
+        """ROI kırpıntılarını işler; ROI dışındaki tespitler atılmış, frame koordinatlarında kutular döner."""
+        if frame is None:
+            return empty_box_arrays()
+        mask, rects = self.layout(frame.shape[:2])
+        if not len(rects):
+            return empty_box_arrays()
+        crops = [frame[y1:y2, x1:x2] for x1, y1, x2, y2 in rects.tolist()]
+
+        parts: List[BoxArrays] = []
+        for start in range(0, len(crops), self.batch_size):
+            outputs = self.detector.detect_arrays_batch(crops[start : start + self.batch_size])
+            for (dx, dy), (boxes, scores, class_ids) in zip(rects[start : start + self.batch_size, :2].tolist(), outputs):
+                if len(boxes):
+                    parts.append((boxes + np.array([dx, dy, dx, dy], dtype=np.float32), scores, class_ids))
+
+        boxes, scores, class_ids = concat_box_arrays(parts)
+        if len(crops) > 1 and len(boxes):
+            keep = nms(
+                boxes,
+                scores,
+                self.merge_threshold,
+                class_ids=class_ids,
+                max_det=len(boxes),
+                metric=self.merge_metric,
+            )
+            boxes, scores, class_ids = boxes[keep], scores[keep], class_ids[keep]
+        inside = self.inside(mask, boxes)
+        return boxes[inside], scores[inside], class_ids[inside]
+
+    @staticmethod
+    def inside(mask: np.ndarray, boxes: np.ndarray) -> np.ndarray:
+        """Kutu merkezlerinin ROI maskesi içinde olup olmadığı (tek vektörel indeksleme)."""
+        if not len(boxes):
+            return np.zeros(0, dtype=bool)
+        h, w = mask.shape
+        cx = ((boxes[:, 0] + boxes[:, 2]) * 0.5).astype(np.int64).clip(0, w - 1)
+        cy = ((boxes[:, 1] + boxes[:, 3]) * 0.5).astype(np.int64).clip(0, h - 1)
+        return mask[cy, cx]
@@ -1,10 +1,11 @@
+from pathlib import Path
 from typing import Iterator
 import logging
+import time
 
-try:
-    import cv2  # type: ignore
-except Exception:  # pragma: no cover
-    cv2 = None
+from strawberry_vision.lazy import LazyModule
+
+cv2 = LazyModule("cv2")
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +26,7 @@ class ImageSource:
             logger.warning("ImageSource already consumed")
             return iter(())
         self._yielded = True
-        if cv2 is None:
+        if not cv2:
             logger.error("OpenCV not available")
             return iter(())
         try:
@@ -51,7 +52,7 @@ class VideoSource:
         self.max_frames = max_frames
 
     def __iter__(self) -> Iterator[object]:
-        if cv2 is None:
+        if not cv2:
             logger.error("OpenCV not available")
             return iter(())
         try:
@@ -93,7 +94,7 @@ class CameraSource:
         self.max_frames = max_frames
 
     def __iter__(self) -> Iterator[object]:
-        if cv2 is None:
+        if not cv2:
             logger.error("OpenCV not available")
             return iter(())
         try:
@@ -121,3 +122,99 @@ class CameraSource:
         except Exception as e:
             logger.error(f"Error accessing camera {self.camera_id}: {e}")
             return iter(())
+
+
+IMAGE_EXTENSIONS = (".jpg", ".jpeg", ".png", ".bmp", ".tif", ".tiff", ".webp")
+
+
+class ImageFolderSource:
+    """Görüntü klasörü kaynağı.
+    
+    Klasördeki görüntüleri dosya adı sırasıyla okur; okunamayan dosyalar atlanır.
+    """
+    
+    def __init__(self, folder_path: str, max_frames: int | None = None) -> None:
+        self.folder_path = folder_path
+        self.max_frames = max_frames
+
+    def __iter__(self) -> Iterator[object]:
+        if not cv2:
+            logger.error("OpenCV not available")
+            return
+        folder = Path(self.folder_path)
+        if not folder.is_dir():
+            logger.error(f"Image folder not found: {self.folder_path}")
+            return
+        
+        paths = sorted(p for p in folder.iterdir() if p.suffix.lower() in IMAGE_EXTENSIONS)
+        logger.info(f"Image folder opened: {self.folder_path} ({len(paths)} images)")
+        count = 0
+        for path in paths:
+            if self.max_frames is not None and count >= self.max_frames:
+                logger.info(f"Reached max_frames limit: {self.max_frames}")
+                break
+            frame = cv2.imread(str(path))
+            if frame is None:
+                logger.warning(f"Failed to read image: {path}")
+                continue
+            count += 1
+            yield frame
+
+
+def open_source(path: str, max_frames: int | None = None):
+    """Yola göre uygun kaynağı seçer (klasör, görüntü veya video)."""
+    p = Path(path)
+    if p.is_dir():
+        return ImageFolderSource(path, max_frames=max_frames)
+    if p.suffix.lower() in IMAGE_EXTENSIONS:
+        return ImageSource(path)
+    return VideoSource(path, max_frames=max_frames)
+
+
+class FakeCameraSource:
+    """Dosya tabanlı sahte kamera (test ve simülasyon için).
+    
+    Bir görüntü veya videodan sabit FPS ile frame üretir; `loop` açıksa dosya
+    bittiğinde baştan başlar. Gerçek kamera gibi bloklayan bir generator'dır.
+    """
+    
+    def __init__(self, path: str, fps: float = 15.0, max_frames: int | None = None, loop: bool = True) -> None:
+        if fps <= 0:
+            raise ValueError(f"fps must be positive, got {fps}")
+        self.path = path
+        self.fps = fps
+        self.max_frames = max_frames
+        self.loop = loop
+
+    def _frames_once(self) -> Iterator[object]:
+        if Path(self.path).suffix.lower() in IMAGE_EXTENSIONS:
+            for frame in ImageSource(self.path):
+                # Pipeline frame üzerine çizdiği için her seferinde kopya verilir
+                while True:
+                    yield frame.copy()
+                    if not self.loop:
+                        return
+        else:
+            yield from VideoSource(self.path)
+
+    def __iter__(self) -> Iterator[object]:
+        interval = 1.0 / self.fps
+        next_time = time.monotonic()
+        count = 0
+        while True:
+            emitted = False
+            for frame in self._frames_once():
+                if self.max_frames is not None and count >= self.max_frames:
+                    return
+                delay = next_time - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+                elif delay < -interval:
+                    # Tüketici geride kaldı: birikmiş frame'ler yerine zamanlamayı sıfırla
+                    next_time = time.monotonic()
+                next_time += interval
+                count += 1
+                emitted = True
+                yield frame
+            if not self.loop or not emitted:
+                return
@@ -0,0 +1,135 @@
+from typing import List, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from strawberry_vision.domain.batch import DetectionBatch
+from strawberry_vision.domain.entities import Detection
+from strawberry_vision.infrastructure.box_ops import BoxArrays, concat_box_arrays, empty_box_arrays, nms
+
+logger = logging.getLogger(__name__)
+
+
+def tile_grid(frame_hw: Tuple[int, int], tile_size: int, overlap: float) -> np.ndarray:
+    """Frame'i örten, birbiriyle örtüşen karo koordinatlarını (x1, y1, x2, y2) üretir.
+
+    Son satır/sütun frame kenarına hizalanır; böylece tüm karolar aynı boyutta
+    olur ve kenarda dar şeritler oluşmaz. Karodan küçük frame tek karo olarak döner.
+    """
+    h, w = frame_hw
+    stride = max(1, int(round(tile_size * (1.0 - overlap))))
+
+    def starts(length: int) -> np.ndarray:
+        if length <= tile_size:
+            return np.zeros(1, dtype=np.int64)
+        s = np.arange(0, length - tile_size, stride, dtype=np.int64)
+        return np.append(s, length - tile_size)
+
+    ys, xs = starts(h), starts(w)
+    x1, y1 = np.meshgrid(xs, ys)
+    x1, y1 = x1.ravel(), y1.ravel()
+    return np.stack([x1, y1, np.minimum(x1 + tile_size, w), np.minimum(y1 + tile_size, h)], axis=1)
+
+
+class TiledDetector:
+    """Yüksek çözünürlüklü frame'ler için karolu (sliced) inference.
+
+    Frame örtüşen karolara bölünür ve karolar `batch_size`'lık gruplar hâlinde
+    detector'e verilir. Kutular frame koordinatlarına taşınır ve karolar arasında
+    sınıf bazlı NMS ile birleştirilir. Varsayılan eşleşme ölçütü IoS'tur
+    (kesişim / küçük kutu alanı): karo kenarında kesilmiş parça kutular tam kutunun
+    içinde kaldığından IoU ile bastırılamaz, IoS ile bastırılır.
+
+    Karo boyutu sabittir; `set_imgsz` sunulmaz, bu yüzden `AdaptiveController`
+    karolu detector'de yalnızca frame adımını (stride) ayarlar.
+
+    Args:
+        detector: Karoları işleyecek detector (`detect_arrays_batch` sunmalı)
+        tile_size: Karo kenar uzunluğu (piksel)
+        overlap: Komşu karolar arasındaki örtüşme oranı (0-1)
+        batch_size: Tek predict çağrısındaki karo sayısı
+        merge_threshold: Karolar arası birleştirme eşiği
+        merge_metric: "ios" (varsayılan) veya "iou"
+        include_full_frame: Büyük nesneler için tüm frame'i de ek bir karo olarak işle
+    """
+
+    def __init__(
+        self,
+        detector,
+        tile_size: int = 640,
+        overlap: float = 0.2,
+        batch_size: int = 8,
+        merge_threshold: float = 0.6,
+        merge_metric: str = "ios",
+        include_full_frame: bool = False,
+    ) -> None:
+        if tile_size <= 0:
+            raise ValueError(f"tile_size must be positive, got {tile_size}")
+        if not 0.0 <= overlap < 1.0:
+            raise ValueError(f"overlap must be in [0, 1), got {overlap}")
+        self.detector = detector
+        self.tile_size = tile_size
+        self.overlap = overlap
+        self.batch_size = max(1, batch_size)
+        self.merge_threshold = merge_threshold
+        self.merge_metric = merge_metric
+        self.include_full_frame = include_full_frame
+
+    @property
+    def model(self):
+        return self.detector.model
+
+    @property
+    def class_names(self) -> List[str]:
+        return self.detector.class_names
+
+    def warmup(self) -> "TiledDetector":
+        """Alttaki detector'ü karo boyutunda ısıtır."""
+        self.detector.warmup(imgsz=self.tile_size)
+        return self
+
+    def detect(self, frame: np.ndarray) -> List[Detection]:
+        return self.detect_columnar(frame).to_detections()
+
+    def detect_batch(self, frames: Sequence[np.ndarray]) -> List[List[Detection]]:
+        return [self.detect(frame) for frame in frames]
+
+    def detect_columnar(self, frame: np.ndarray) -> DetectionBatch:
+        return self.detector.to_batch(self.detect_arrays(frame))
+
+    def detect_columnar_batch(self, frames: Sequence[np.ndarray]) -> List[DetectionBatch]:
+        return [self.detect_columnar(frame) for frame in frames]
+
+    def detect_arrays_batch(self, frames: Sequence[np.ndarray]) -> List[BoxArrays]:
+        return [self.detect_arrays(frame) for frame in frames]
+
+    def detect_arrays(self, frame: np.ndarray) -> BoxArrays:
+        """Frame'i karolar üzerinden işler; kutular frame koordinatlarında döner."""
+        if frame is None:
+            return empty_box_arrays()
+        tiles = tile_grid(frame.shape[:2], self.tile_size, self.overlap)
+        crops = [frame[y1:y2, x1:x2] for x1, y1, x2, y2 in tiles.tolist()]
+        offsets = tiles[:, :2]
+        if self.include_full_frame and len(tiles) > 1:
+            crops.append(frame)
+            offsets = np.vstack([offsets, np.zeros((1, 2), dtype=np.int64)])
+
+        parts: List[BoxArrays] = []
+        for start in range(0, len(crops), self.batch_size):
+            outputs = self.detector.detect_arrays_batch(crops[start : start + self.batch_size])
+            for (dx, dy), (boxes, scores, class_ids) in zip(offsets[start : start + self.batch_size].tolist(), outputs):
+                if len(boxes):
+                    parts.append((boxes + np.array([dx, dy, dx, dy], dtype=np.float32), scores, class_ids))
+
+        boxes, scores, class_ids = concat_box_arrays(parts)
+        if len(crops) == 1:
+            return boxes, scores, class_ids
+        keep = nms(
+            boxes,
+            scores,
+            self.merge_threshold,
+            class_ids=class_ids,
+            max_det=len(boxes),
+            metric=self.merge_metric,
+        )
+        return boxes[keep], scores[keep], class_ids[keep]
@@ -0,0 +1,81 @@
+from pathlib import Path
+from typing import List
+import logging
+import threading
+
+import numpy as np
+
+from strawberry_vision.domain.tracking import TRACK_RECORD_DTYPE
+
+logger = logging.getLogger(__name__)
+
+
+class TrackArchive:
+    """Biten track kayıtlarını diske ekleyen (append) ikili arşiv.
+
+    `TrackingService(spill=archive)` ile kullanılır: silinen onaylı track'lerin
+    `TRACK_RECORD_DTYPE` kayıtları bellekte en fazla `buffer_size` kayıt
+    biriktirilir, sonra dosyanın sonuna ham ikili olarak yazılır. Tampon
+    sınırlı olduğundan uzun akışlarda bellek kullanımı sabit kalır; dosya
+    `TrackArchive.read` (veya `np.fromfile`) ile tekrar okunur.
+
+    Args:
+        path: Arşiv dosyası (yoksa oluşturulur, varsa sonuna eklenir)
+        buffer_size: Diske yazmadan önce bellekte tutulan en fazla kayıt sayısı
+    """
+
+    def __init__(self, path: str | Path, buffer_size: int = 4096) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.buffer_size = max(1, buffer_size)
+        self._buffer: List[np.ndarray] = []
+        self._buffered = 0
+        self._written = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, records: np.ndarray) -> None:
+        if not len(records):
+            return
+        with self._lock:
+            self._buffer.append(np.asarray(records, dtype=TRACK_RECORD_DTYPE))
+            self._buffered += len(records)
+            if self._buffered >= self.buffer_size:
+                self._write()
+
+    def _write(self) -> None:
+        if not self._buffer:
+            return
+        records = np.concatenate(self._buffer)
+        with open(self.path, "ab") as f:
+            records.tofile(f)
+        self._written += len(records)
+        self._buffer.clear()
+        self._buffered = 0
+
+    def flush(self) -> None:
+        """Tampondaki kayıtları diske yazar."""
+        with self._lock:
+            self._write()
+
+    def close(self) -> None:
+        self.flush()
+        logger.info(f"Track archive {self.path}: {self._written} records")
+
+    def __enter__(self) -> "TrackArchive":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    @property
+    def written(self) -> int:
+        """Diske yazılmış kayıt sayısı (tampondakiler hariç)."""
+        return self._written
+
+    @staticmethod
+    def read(path: str | Path) -> np.ndarray:
+        """Arşiv dosyasındaki tüm kayıtlar (TRACK_RECORD_DTYPE yapılı dizi)."""
+        path = Path(path)
+        if not path.exists():
+            return np.zeros(0, dtype=TRACK_RECORD_DTYPE)
+        return np.fromfile(path, dtype=TRACK_RECORD_DTYPE)
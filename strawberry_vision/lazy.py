@@ -0,0 +1,54 @@
+from importlib import import_module
+from types import ModuleType
+import threading
+
+_MISSING = object()
+
+
+class LazyModule:
+    """İlk kullanımda import edilen opsiyonel bağımlılık.
+
+    Ağır modüller (cv2, ultralytics, yaml, onnxruntime) paket yüklenirken değil,
+    gerçekten ihtiyaç duyulduğunda import edilir; böylece `--help` veya sahte
+    detector'lü testler bu maliyeti ödemez. Modül yüklenemezse nesne False
+    değerlidir (`if not cv2: ...`) ve attribute erişimi ImportError verir.
+
+    Args:
+        name: Import edilecek modül adı
+    """
+
+    def __init__(self, name: str) -> None:
+        self._name = name
+        self._module: object = _MISSING
+        self._error: Exception | None = None
+        self._lock = threading.Lock()
+
+    def load(self) -> ModuleType | None:
+        """Modülü (bir kez) import eder; yüklenemezse None döndürür."""
+        if self._module is _MISSING:
+            with self._lock:
+                if self._module is _MISSING:
+                    try:
+                        self._module = import_module(self._name)
+                    except Exception as e:  # pragma: no cover - kurulu olmayan bağımlılık
+                        self._error = e
+                        self._module = None
+        return self._module
+
+    @property
+    def loaded(self) -> bool:
+        """Import denemesi yapıldı mı (başarılı ya da değil)."""
+        return self._module is not _MISSING
+
+    def __bool__(self) -> bool:
+        return self.load() is not None
+
+    def __getattr__(self, attr: str):
+        module = self.load()
+        if module is None:
+            raise ImportError(f"{self._name} is not available: {self._error}")
+        return getattr(module, attr)
+
+    def __repr__(self) -> str:
+        state = "not loaded" if not self.loaded else ("missing" if self._module is None else "loaded")
+        return f"<LazyModule {self._name} ({state})>"
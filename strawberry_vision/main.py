@@ -1,8 +1,37 @@
 import argparse
+from pathlib import Path
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List
 
+from strawberry_vision.application.adaptive import AdaptiveController
+from strawberry_vision.application.batch_runner import BatchRunner
+from strawberry_vision.application.multistream import MultiStreamOrchestrator
 from strawberry_vision.application.pipeline import InferencePipeline
-from strawberry_vision.infrastructure.sources import ImageSource, VideoSource
-from strawberry_vision.infrastructure.detectors import YOLODetector
+from strawberry_vision.application.streaming import StreamingPipeline
+from strawberry_vision.domain.services import TrackingService
+from strawberry_vision.domain.unique_counting import COUNT_LABELS, UniqueCountingService
+from strawberry_vision.infrastructure.sources import CameraSource, ImageSource, VideoSource, open_source
+from strawberry_vision.infrastructure.color_classifier import HistogramClassifier
+from strawberry_vision.infrastructure.counting_config import load_counting_config, regions_for
+from strawberry_vision.infrastructure.detectors import BACKENDS
+from strawberry_vision.infrastructure.ensemble import EnsembleDetector
+from strawberry_vision.infrastructure.metrics_exporter import PrometheusExporter
+from strawberry_vision.infrastructure.model_registry import get_registry
+from strawberry_vision.infrastructure.motion import MotionGate
+from strawberry_vision.infrastructure.results_store import SqliteResultsSink
+from strawberry_vision.infrastructure.roi import RoiDetector, load_roi_config, rois_for
+from strawberry_vision.infrastructure.tiling import TiledDetector
+from strawberry_vision.infrastructure.track_archive import TrackArchive
+
+
+def iter_batches(frames: Iterable[object], batch_size: int) -> Iterator[List[object]]:
+    """Frame akışını sabit boyutlu listelere böler (son liste kısa olabilir)."""
+    it = iter(frames)
+    while True:
+        batch = list(islice(it, batch_size))
+        if not batch:
+            return
+        yield batch
 
 
 def main():
@@ -10,20 +39,177 @@ def main():
     parser.add_argument("--image", type=str, default="sample.jpg", help="Tek görüntü yolu")
     parser.add_argument("--video", type=str, default=None, help="Video yolu")
     parser.add_argument("--model", type=str, default=None, help="YOLO model .pt dosya yolu")
+    parser.add_argument("--backend", type=str, default="ultralytics", choices=BACKENDS, help="Inference backend'i (onnx için .onnx model verin)")
     parser.add_argument("--max-frames", type=int, default=None, help="Video için maksimum kare sayısı")
+    parser.add_argument("--batch-size", type=int, default=1, help="Tek predict çağrısında işlenecek kare sayısı")
+    parser.add_argument("--streaming", action="store_true", help="Decode/detect/postprocess/draw aşamalarını ayrı thread'lerde çalıştır")
+    parser.add_argument("--queue-size", type=int, default=4, help="Streaming modunda aşamalar arası kuyruk kapasitesi")
+    parser.add_argument("--inputs", type=str, nargs="+", default=None, help="Paralel işlenecek video/görüntü/klasör yolları")
+    parser.add_argument("--workers", type=int, default=None, help="--inputs için process sayısı (varsayılan: CPU sayısı)")
+    parser.add_argument("--retries", type=int, default=1, help="Hatalı kaynak için tekrar deneme sayısı")
+    parser.add_argument("--max-error-ratio", type=float, default=0.0, help="Kaynağın başarılı sayılması için izin verilen hatalı frame oranı")
+    parser.add_argument("--cameras", type=str, nargs="+", default=None, help="Eşzamanlı işlenecek kamera ID'leri veya video yolları")
+    parser.add_argument("--motion-gate", action="store_true", help="Değişmeyen karelerde detector'ü atla, önceki tespitleri kullan")
+    parser.add_argument("--refresh-every", type=int, default=30, help="Motion gate açıkken en geç kaç karede bir detector çalışsın")
+    parser.add_argument("--ensemble-config", type=str, default=None, help="Birden fazla modeli WBF ile birleştir (ör. configs/ensemble_config.yaml)")
+    parser.add_argument("--tile-size", type=int, default=None, help="Yüksek çözünürlüklü kareleri bu boyutta karolara bölerek işle (varsayılan: kapalı)")
+    parser.add_argument("--tile-overlap", type=float, default=0.2, help="Komşu karolar arasındaki örtüşme oranı")
+    parser.add_argument("--tile-batch", type=int, default=8, help="Tek predict çağrısındaki karo sayısı")
+    parser.add_argument("--color-config", type=str, default=None, help="Olgunluğu hue/doygunluk histogram prototipleriyle sınıflandır (ör. configs/color_classifier.yaml)")
+    parser.add_argument("--roi-config", type=str, default=None, help="Kamera başına tepsi alanı poligonları; yalnızca bu alanlarda tespit yapılır (ör. configs/roi_config.yaml)")
+    parser.add_argument("--detect-every", type=int, default=1, help="Detector'ü her N karede bir çalıştır; aradaki kareler tracker'dan gelir")
+    parser.add_argument("--track-motion", type=str, default="none", choices=["none", "kalman"], help="Atlanan karelerde track kutularının tahmini (kalman: sabit hız)")
+    parser.add_argument("--track-capacity", type=int, default=4096, help="Aynı anda tutulabilecek en fazla track sayısı (bellek sınırı)")
+    parser.add_argument("--track-archive", type=str, default=None, help="Biten track'leri bu ikili dosyaya ekle (ör. runs/tracks.bin)")
+    parser.add_argument("--count-unique", action="store_true", help="Her track'i video boyunca bir kez, çoğunluk etiketiyle say")
+    parser.add_argument("--count-config", type=str, default=None, help="Benzersiz sayım için çizgi/bölge tanımları (ör. configs/counting_config.yaml)")
+    parser.add_argument("--count-label", type=str, default="class", choices=COUNT_LABELS, help="Benzersiz sayımda etiket: detector sınıfı veya olgunluk")
+    parser.add_argument("--results-db", type=str, default=None, help="Frame özetlerini ve tespitleri arka planda bu SQLite dosyasına yaz (ör. runs/results.db); tepsiler --count-config bölgelerinden")
+    parser.add_argument("--target-latency-ms", type=float, default=None, help="Frame başına hedef detect gecikmesi; görüntü boyutu/stride buna göre ayarlanır")
+    parser.add_argument("--imgsz-levels", type=int, nargs="+", default=[320, 416, 512, 640], help="Adaptif modda kullanılacak görüntü boyutları")
+    parser.add_argument("--warmup", action="store_true", help="Modeli kaynak açılmadan önce yükle ve ısıt")
+    parser.add_argument("--metrics-port", type=int, default=None, help="Prometheus metrik endpoint portu (varsayılan: kapalı)")
     args = parser.parse_args()
+    if args.cameras and args.target_latency_ms:
+        # Kameralar tek detector'ü paylaşır; bir akışın imgsz ayarı diğerlerini de etkilerdi
+        parser.error("--target-latency-ms --cameras ile birlikte kullanılamaz")
+
+    if args.inputs:
+        runner = BatchRunner(
+            model_path=args.model,
+            workers=args.workers,
+            retries=args.retries,
+            max_frames=args.max_frames,
+            backend=args.backend,
+            max_error_ratio=args.max_error_ratio,
+        )
+        report = runner.run(args.inputs)
+        for source_report in report.sources:
+            print(source_report.source, source_report.counts if source_report.ok else source_report.error)
+        print(report.summary())
+        return
+
+    # Registry tutamacı ve ensemble finish() içinde bırakılır (sarmalayıcılardan bağımsız)
+    handle = ensemble = None
+    if args.ensemble_config:
+        detector = ensemble = EnsembleDetector.from_config(args.ensemble_config)
+    else:
+        detector = handle = get_registry().acquire(args.model, backend=args.backend)
+    if args.tile_size:
+        detector = TiledDetector(detector, tile_size=args.tile_size, overlap=args.tile_overlap, batch_size=args.tile_batch)
+    if args.warmup:
+        detector.warmup()
+    rois = load_roi_config(args.roi_config) if args.roi_config else None
+    classifier = HistogramClassifier.from_config(args.color_config) if args.color_config else None
+    counting = load_counting_config(args.count_config) if args.count_config else None
+    archives: List[TrackArchive] = []
+    results_sink = SqliteResultsSink(args.results_db, trays=counting) if args.results_db else None
+
+    def make_tracker(name: str | None = None) -> TrackingService:
+        archive = None
+        if args.track_archive:
+            path = Path(args.track_archive)
+            # Akış başına ayrı dosya: tracks.bin → tracks_0.bin
+            archive = TrackArchive(path.with_name(f"{path.stem}_{Path(name).stem}{path.suffix}") if name else path)
+            archives.append(archive)
+        return TrackingService(motion=args.track_motion, capacity=args.track_capacity, spill=archive)
 
-    detector = YOLODetector(model_path=args.model) if args.model else YOLODetector()
-    pipeline = InferencePipeline(detector=detector)
+    def make_counter(name: str) -> UniqueCountingService | None:
+        if not (args.count_unique or counting):
+            return None
+        regions = regions_for(counting, name) if counting else []
+        return UniqueCountingService(regions, label=args.count_label)
+
+    def finish(pipelines: Dict[str, InferencePipeline]) -> None:
+        for name, pipeline in pipelines.items():
+            if pipeline.unique_counter is not None:
+                print(name, {"unique_counts": pipeline.unique_counter.finish()})
+            if archives:
+                pipeline.tracker.flush()
+        for archive in archives:
+            archive.close()
+        if results_sink is not None:
+            results_sink.close()
+        if handle is not None:
+            handle.release()
+        if ensemble is not None:
+            ensemble.close()
+
+    if args.cameras:
+        sources = {
+            name: CameraSource(camera_id=int(name), max_frames=args.max_frames)
+            if name.isdigit()
+            else open_source(name, max_frames=args.max_frames)
+            for name in args.cameras
+        }
+        orchestrator = MultiStreamOrchestrator(
+            sources,
+            detector=detector,
+            on_result=lambda name, result: print(name, result.summary()),
+            rois=rois,
+            classifier=classifier,
+            tracker_factory=make_tracker,
+            counter_factory=make_counter,
+            results_sink=results_sink,
+        )
+        for pipeline in orchestrator.pipelines.values():
+            pipeline.detect_stride = max(1, args.detect_every)
+            if args.motion_gate:
+                pipeline.motion_gate = MotionGate(refresh_interval=args.refresh_every)
+        if args.metrics_port is not None:
+            PrometheusExporter(orchestrator.pipelines, port=args.metrics_port).start()
+        try:
+            print(orchestrator.run())
+        finally:
+            finish(orchestrator.pipelines)
+        return
+
+    polygons = rois_for(rois, args.video or args.image) if rois else None
+    if polygons:
+        detector = RoiDetector(detector, polygons)
+    motion_gate = MotionGate(refresh_interval=args.refresh_every) if args.motion_gate else None
+    pipeline = InferencePipeline(
+        detector=detector,
+        tracker=make_tracker(),
+        unique_counter=make_counter(args.video or args.image),
+        motion_gate=motion_gate,
+        classifier=classifier,
+        results_sink=results_sink,
+        source=str(args.video or args.image),
+    )
+    pipeline.detect_stride = max(1, args.detect_every)
+    if args.metrics_port is not None:
+        PrometheusExporter(pipeline, port=args.metrics_port).start()
 
     if args.video:
         source = VideoSource(video_path=args.video, max_frames=args.max_frames)
     else:
         source = ImageSource(image_path=args.image)
 
-    for frame in source:
-        result = pipeline.run(frame)
-        print(result.summary())
+    try:
+        runner = pipeline
+        if args.target_latency_ms:
+            runner = AdaptiveController(pipeline, target_latency=args.target_latency_ms / 1000.0, imgsz_levels=args.imgsz_levels)
+
+        if args.streaming:
+            controller = runner if isinstance(runner, AdaptiveController) else None
+            streaming = StreamingPipeline(pipeline, queue_size=args.queue_size, controller=controller)
+            for result in streaming.run(source):
+                print(result.summary())
+            print(streaming.get_metrics())
+            return
+
+        if args.batch_size > 1:
+            for frames in iter_batches(source, args.batch_size):
+                for result in runner.run_batch(frames):
+                    print(result.summary())
+            return
+
+        for frame in source:
+            result = runner.run(frame)
+            print(result.summary())
+    finally:
+        finish({args.video or args.image: pipeline})
 
 
 if __name__ == "__main__":
@@ -1,11 +1,12 @@
-from typing import List, Tuple
+from typing import Iterator, List, Tuple
 import logging
 import os
 
-try:
-    import cv2  # type: ignore
-except Exception:  # pragma: no cover
-    cv2 = None
+from strawberry_vision.lazy import LazyModule
+
+cv2 = LazyModule("cv2")
+
+from strawberry_vision.domain.batch import RIPENESS_LEVELS, UNTRACKED, DetectionBatch
 
 logger = logging.getLogger(__name__)
 
@@ -25,32 +26,31 @@ class Visualizer:
             "unripe": (0, 0, 255),    # Kırmızı
         }
 
-    def draw(self, frame, strawberries: List["Strawberry"]):
+    def draw(self, frame, strawberries: "List[Strawberry] | DetectionBatch"):
         """Çilekleri frame üzerine çizer.
         
         Args:
             frame: Görüntü frame'i
-            strawberries: Çilek listesi
+            strawberries: Çilek listesi veya DetectionBatch
             
         Returns:
             Çizilmiş frame
         """
-        if cv2 is None or frame is None:
+        if not cv2 or frame is None:
             return frame
         
-        for s in strawberries:
-            x, y, w, h = s.detection.bbox
-            color = self._color_map.get(s.ripeness.value, (255, 255, 255))
+        for (x, y, w, h), det_label, ripeness, score, track_id in self._rows(strawberries):
+            color = self._color_map.get(ripeness, (255, 255, 255))
             
             # Bounding box
             cv2.rectangle(frame, (x, y), (x + w, y + h), color, 2)
             
             # Label
-            label_parts = [s.detection.label, s.ripeness.value]
+            label_parts = [det_label, ripeness]
             if self.show_confidence:
-                label_parts.append(f"{s.detection.score:.2f}")
-            if self.show_id and s.is_tracked():
-                label_parts.append(f"ID:{s.id}")
+                label_parts.append(f"{score:.2f}")
+            if self.show_id and track_id is not None:
+                label_parts.append(f"ID:{track_id}")
             
             label = " ".join(label_parts)
             
@@ -60,6 +60,23 @@ class Visualizer:
             cv2.putText(frame, label, (x, y - 5), cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 255), 1)
         
         return frame
+
+    @staticmethod
+    def _rows(strawberries) -> Iterator[Tuple[Tuple[int, int, int, int], str, str, float, int | None]]:
+        """(bbox, etiket, olgunluk, skor, takip ID'si) satırları üretir."""
+        if isinstance(strawberries, DetectionBatch):
+            ripeness_values = [level.value for level in RIPENESS_LEVELS]
+            for bbox, label, code, score, track_id in zip(
+                strawberries.bboxes.tolist(),
+                strawberries.labels.tolist(),
+                strawberries.ripeness.tolist(),
+                strawberries.scores.tolist(),
+                strawberries.track_ids.tolist(),
+            ):
+                yield bbox, label, ripeness_values[code], score, None if track_id == UNTRACKED else track_id
+            return
+        for s in strawberries:
+            yield s.detection.bbox, s.detection.label, s.ripeness.value, s.detection.score, s.id
     
     def save_frame(self, frame, output_path: str) -> bool:
         """Frame'i dosyaya kaydeder.
@@ -71,7 +88,7 @@ class Visualizer:
         Returns:
             Başarılı ise True
         """
-        if cv2 is None or frame is None:
+        if not cv2 or frame is None:
             logger.error("Cannot save frame: OpenCV not available or frame is None")
             return False
         
@@ -95,7 +112,7 @@ class Visualizer:
             counts: Olgunluk sayımları
             total: Toplam çilek sayısı
         """
-        if cv2 is None or frame is None:
+        if not cv2 or frame is None:
             return
         
         y_offset = 30
@@ -0,0 +1,92 @@
+import numpy as np
+
+from strawberry_vision.application.adaptive import AdaptiveController
+from strawberry_vision.application.pipeline import InferencePipeline, PipelineResult
+from strawberry_vision.domain.entities import Detection
+
+
+class ResizableDetector:
+    def __init__(self, imgsz=640, resizable=True):
+        self.imgsz = imgsz
+        self.resizable = resizable
+        self.calls = 0
+
+    def set_imgsz(self, imgsz):
+        if not self.resizable:
+            return False
+        self.imgsz = imgsz
+        return True
+
+    def detect(self, frame):
+        self.calls += 1
+        return [Detection(bbox=(0, 0, 10, 10), score=0.9, label="Healthy")]
+
+
+def feed(controller, latency, count=None):
+    for _ in range(count or controller.window):
+        controller.observe(PipelineResult(counts={}, stage_times={"detect": latency}))
+
+
+def make(resizable=True, **kwargs):
+    detector = ResizableDetector(resizable=resizable)
+    pipeline = InferencePipeline(detector=detector, enable_logging=False)
+    return AdaptiveController(pipeline, target_latency=0.1, window=5, **kwargs), pipeline, detector
+
+
+class TestAdaptiveController:
+    def test_slow_detection_lowers_imgsz_then_raises_stride(self):
+        controller, pipeline, detector = make()
+        feed(controller, 0.2)
+        assert detector.imgsz == 512
+        feed(controller, 0.2)
+        feed(controller, 0.2)
+        feed(controller, 0.2)
+        assert detector.imgsz == 320
+        assert pipeline.detect_stride == 2
+        metrics = controller.get_metrics()
+        assert metrics["adjustment_count"] == 4
+        assert [(a["knob"], a["from"], a["to"]) for a in metrics["adjustments"]][-1] == ("stride", 1, 2)
+        assert metrics["adjustments"][0]["latency"] == 0.2
+
+    def test_fast_detection_restores_stride_before_imgsz(self):
+        detector = ResizableDetector(imgsz=320)
+        pipeline = InferencePipeline(detector=detector, enable_logging=False)
+        pipeline.detect_stride = 3
+        controller = AdaptiveController(pipeline, target_latency=0.1, window=5)
+        feed(controller, 0.05)  # 0.05 / 2 < 0.085 → stride 3 → 2
+        assert pipeline.detect_stride == 2
+        feed(controller, 0.05)
+        assert pipeline.detect_stride == 1
+        feed(controller, 0.06)  # 0.06 * (416/320)^2 ≈ 0.101 → üst kademe hedefi aşar
+        assert detector.imgsz == 320
+        feed(controller, 0.03)
+        assert detector.imgsz == 416
+
+    def test_within_band_keeps_settings(self):
+        controller, pipeline, detector = make()
+        feed(controller, 0.1, count=20)
+        assert pipeline.get_metrics()["adjustment_count"] == 0
+
+    def test_fixed_input_model_falls_back_to_stride(self):
+        controller, pipeline, detector = make(resizable=False)
+        feed(controller, 0.3)
+        assert detector.imgsz == 640
+        assert pipeline.detect_stride == 2
+        feed(controller, 0.3)
+        assert pipeline.detect_stride == 3
+
+    def test_skipped_frames_are_not_sampled(self):
+        controller, _, _ = make()
+        controller.observe(PipelineResult(counts={}, skipped=True, stage_times={"detect": 5.0}))
+        assert controller.rolling_latency() == 0.0
+
+
+def test_pipeline_detect_stride_reuses_detections():
+    detector = ResizableDetector()
+    pipeline = InferencePipeline(detector=detector, enable_logging=False)
+    pipeline.detect_stride = 3
+    frame = np.zeros((32, 32, 3), dtype=np.uint8)
+    results = [pipeline.run(frame) for _ in range(7)]
+    assert detector.calls == 3
+    assert [r.skipped for r in results] == [False, True, True, False, True, True, False]
+    assert all(r.total == 1 for r in results)
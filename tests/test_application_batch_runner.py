@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+
+from strawberry_vision.application.batch_runner import BatchRunner
+from strawberry_vision.domain.entities import Detection
+
+cv2 = pytest.importorskip("cv2")
+
+
+class FakeDetector:
+    def detect(self, frame):
+        return [Detection(bbox=(0, 0, 10, 10), score=0.9, label="strawberry")]
+
+
+def fake_detector_factory(model_path):
+    return FakeDetector()
+
+
+class BrokenDetector:
+    def detect(self, frame):
+        raise RuntimeError("corrupt frame")
+
+
+def broken_detector_factory(model_path):
+    return BrokenDetector()
+
+
+def write_images(folder, n):
+    folder.mkdir()
+    frame = np.zeros((20, 20, 3), dtype=np.uint8)
+    frame[:, :, 2] = 200
+    for i in range(n):
+        cv2.imwrite(str(folder / f"{i:03d}.png"), frame)
+    return str(folder)
+
+
+class TestBatchRunner:
+    def test_merges_sources(self, tmp_path):
+        a = write_images(tmp_path / "a", 2)
+        b = write_images(tmp_path / "b", 3)
+        runner = BatchRunner(workers=2, detector_factory=fake_detector_factory)
+
+        report = runner.run([a, b])
+        summary = report.summary()
+
+        assert summary["succeeded"] == 2
+        assert summary["total_frames"] == 5
+        assert summary["total"] == 5
+        assert summary["counts"] == {"ripe": 5}
+        assert [s.metrics["total_frames"] for s in report.sources] == [2, 3]
+
+    def test_failed_source_is_retried_then_skipped(self, tmp_path):
+        good = write_images(tmp_path / "good", 1)
+        missing = str(tmp_path / "missing")
+        runner = BatchRunner(workers=2, retries=2, detector_factory=fake_detector_factory)
+
+        report = runner.run([good, missing])
+
+        assert [s.source for s in report.failed] == [missing]
+        assert report.failed[0].attempts == 3
+        assert report.summary()["total_frames"] == 1
+
+    def test_frame_errors_fail_source(self, tmp_path):
+        source = write_images(tmp_path / "a", 2)
+        runner = BatchRunner(workers=1, retries=1, detector_factory=broken_detector_factory)
+
+        report = runner.run([source])
+
+        failed = report.failed[0]
+        assert failed.attempts == 2
+        assert failed.frame_errors == 2
+        assert failed.error.startswith("2/2 frames failed")
+        assert report.summary()["succeeded"] == 0
+
+    def test_frame_errors_within_ratio_are_reported(self, tmp_path):
+        source = write_images(tmp_path / "a", 2)
+        runner = BatchRunner(workers=1, retries=0, detector_factory=broken_detector_factory, max_error_ratio=1.0)
+
+        report = runner.run([source])
+
+        assert report.sources[0].ok
+        assert report.summary()["frame_errors"] == 2
@@ -0,0 +1,56 @@
+import pytest
+
+from strawberry_vision.application.metrics import LatencyHistogram, StageLatencies
+
+
+class TestLatencyHistogram:
+    def test_empty(self):
+        h = LatencyHistogram()
+        assert h.percentile(50) == 0.0
+        assert h.summary()["count"] == 0
+
+    def test_percentiles_within_bucket_error(self):
+        h = LatencyHistogram(buckets_per_decade=20)
+        values = [i / 1000.0 for i in range(1, 1001)]  # 1ms..1s
+        for v in values:
+            h.record(v)
+
+        assert h.count == 1000
+        assert h.max == pytest.approx(1.0)
+        assert h.percentile(50) == pytest.approx(0.5, rel=0.13)
+        assert h.percentile(95) == pytest.approx(0.95, rel=0.13)
+        assert h.percentile(99) == pytest.approx(0.99, rel=0.13)
+        assert h.percentile(100) == pytest.approx(1.0)
+
+    def test_fixed_memory(self):
+        h = LatencyHistogram()
+        size = len(h._counts)
+        for i in range(10000):
+            h.record(0.001 * (i % 50 + 1))
+        assert len(h._counts) == size
+
+    def test_out_of_range_values(self):
+        h = LatencyHistogram(min_value=1e-3, max_value=1.0)
+        h.record(0.0)
+        h.record(50.0)
+        assert h.count == 2
+        assert h.percentile(100) == 50.0
+        assert h.buckets()[-1][1] == 2
+
+    def test_reset(self):
+        h = LatencyHistogram()
+        h.record(0.01)
+        h.reset()
+        assert h.count == 0 and h.max == 0.0
+
+
+class TestStageLatencies:
+    def test_record_and_summary(self):
+        stages = StageLatencies()
+        stages.record({"detect": 0.02, "classify": 0.001, "unknown": 1.0})
+
+        summary = stages.summary()
+
+        assert set(summary) == set(StageLatencies.STAGES)
+        assert summary["detect"]["count"] == 1
+        assert summary["track"]["count"] == 0
@@ -0,0 +1,132 @@
+import time
+
+import numpy as np
+import pytest
+
+from strawberry_vision.application.multistream import MultiStreamOrchestrator
+from strawberry_vision.domain.entities import Detection
+from strawberry_vision.domain.services import TrackingService
+from strawberry_vision.infrastructure.sources import FakeCameraSource
+
+cv2 = pytest.importorskip("cv2")
+
+
+class SlowDetector:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.calls = 0
+
+    def detect(self, frame):
+        self.calls += 1
+        time.sleep(self.delay)
+        return [Detection(bbox=(0, 0, 10, 10), score=0.9, label="strawberry")]
+
+
+@pytest.fixture
+def image_path(tmp_path):
+    path = tmp_path / "tray.png"
+    cv2.imwrite(str(path), np.zeros((32, 32, 3), dtype=np.uint8))
+    return str(path)
+
+
+class TestFakeCameraSource:
+    def test_emits_at_fixed_fps(self, image_path):
+        start = time.monotonic()
+        frames = list(FakeCameraSource(image_path, fps=50, max_frames=10))
+        elapsed = time.monotonic() - start
+
+        assert len(frames) == 10
+        assert elapsed >= 9 / 50 * 0.9
+
+    def test_without_loop_emits_once(self, image_path):
+        assert len(list(FakeCameraSource(image_path, fps=1000, loop=False))) == 1
+
+
+class TestMultiStreamOrchestrator:
+    def test_slow_model_drops_stale_frames(self, image_path):
+        detector = SlowDetector(delay=0.02)
+        sources = {
+            "cam1": FakeCameraSource(image_path, fps=200, max_frames=40),
+            "cam2": FakeCameraSource(image_path, fps=200, max_frames=40),
+        }
+        orchestrator = MultiStreamOrchestrator(sources, detector=detector)
+
+        metrics = orchestrator.run()
+
+        for name in sources:
+            m = metrics[name]
+            assert m["frames_read"] == 40
+            assert m["frames_dropped"] > 0
+            assert m["total_frames"] + m["frames_dropped"] == 40
+        assert detector.calls == sum(m["total_frames"] for m in metrics.values())
+
+    def test_streams_have_independent_state(self, image_path):
+        results = []
+        sources = {
+            "a": FakeCameraSource(image_path, fps=1000, max_frames=3),
+            "b": FakeCameraSource(image_path, fps=1000, max_frames=5),
+        }
+        orchestrator = MultiStreamOrchestrator(
+            sources,
+            detector=SlowDetector(delay=0.0),
+            on_result=lambda name, result: results.append(name),
+        )
+
+        orchestrator.run()
+
+        assert orchestrator.pipeline("a").tracker is not orchestrator.pipeline("b").tracker
+        assert orchestrator.pipeline("a").counter is not orchestrator.pipeline("b").counter
+        assert set(results) == {"a", "b"}
+
+    def test_tracker_factory_per_stream(self, image_path):
+        created = []
+
+        def make_tracker(name):
+            created.append(name)
+            return TrackingService(capacity=16)
+
+        sources = {name: FakeCameraSource(image_path, fps=1000, max_frames=2) for name in ("a", "b")}
+        orchestrator = MultiStreamOrchestrator(sources, detector=SlowDetector(delay=0.0), tracker_factory=make_tracker)
+
+        assert sorted(created) == ["a", "b"]
+        assert orchestrator.pipeline("a").tracker.capacity == 16
+
+
+def test_shared_detector_locks_every_inference_method():
+    import threading
+
+    from strawberry_vision.application.multistream import _SharedDetector
+
+    class CountingDetector:
+        class_names = ["strawberry"]
+
+        def __init__(self):
+            self.active = 0
+            self.max_active = 0
+
+        def _enter(self, result):
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            time.sleep(0.002)
+            self.active -= 1
+            return result
+
+        def detect_batch(self, frames):
+            return self._enter([[] for _ in frames])
+
+        def detect_arrays(self, frame):
+            return self._enter(None)
+
+    detector = CountingDetector()
+    shared = _SharedDetector(detector)
+    calls = [lambda: shared.detect_batch([None]), lambda: shared.detect_arrays(None)] * 4
+    threads = [threading.Thread(target=lambda c=c: [c() for _ in range(5)]) for c in calls]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert detector.max_active == 1
+    assert shared.class_names == ["strawberry"]
+    # Detector'de olmayan metotlar gizli kalır (pipeline geri dönüş yolunu seçebilsin)
+    assert getattr(shared, "detect_columnar_batch", None) is None
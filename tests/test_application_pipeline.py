@@ -3,6 +3,7 @@ import pytest
 
 from strawberry_vision.application.pipeline import InferencePipeline, PipelineResult
 from strawberry_vision.domain.entities import Detection, Ripeness
+from strawberry_vision.infrastructure.motion import MotionGate
 
 
 class FakeDetector:
@@ -64,3 +65,168 @@ class TestInferencePipeline:
         pipeline.reset()
         assert pipeline._frame_count == 0
         assert pipeline._total_processing_time == 0.0
+    
+    def test_run_batch_uses_detect_batch(self):
+        class BatchDetector(FakeDetector):
+            def __init__(self):
+                self.batch_calls = 0
+            
+            def detect_batch(self, frames):
+                self.batch_calls += 1
+                return [self.detect(f)[: i + 1] for i, f in enumerate(frames)]
+        
+        detector = BatchDetector()
+        pipeline = InferencePipeline(detector=detector, enable_logging=False)
+        frames = [np.zeros((100, 100, 3), dtype=np.uint8) for _ in range(2)]
+        
+        results = pipeline.run_batch(frames)
+        
+        assert detector.batch_calls == 1
+        assert [r.total for r in results] == [1, 2]
+        assert [r.frame_processed for r in results] == [1, 2]
+    
+    def test_run_batch_falls_back_to_detect(self):
+        pipeline = InferencePipeline(detector=FakeDetector(), enable_logging=False)
+        frames = [np.zeros((100, 100, 3), dtype=np.uint8) for _ in range(3)]
+        
+        results = pipeline.run_batch(frames)
+        
+        assert len(results) == 3
+        assert all(r.total == 2 for r in results)
+        assert pipeline.get_metrics()["total_frames"] == 3
+    
+    def test_run_batch_empty(self):
+        pipeline = InferencePipeline(detector=FakeDetector(), enable_logging=False)
+        assert pipeline.run_batch([]) == []
+    
+    def test_motion_gate_reuses_detections(self):
+        class CallCountingDetector(FakeDetector):
+            calls = 0
+            
+            def detect(self, frame):
+                CallCountingDetector.calls += 1
+                return super().detect(frame)
+        
+        detector = CallCountingDetector()
+        pipeline = InferencePipeline(
+            detector=detector,
+            enable_logging=False,
+            motion_gate=MotionGate(refresh_interval=0),
+        )
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        
+        results = [pipeline.run(frame.copy()) for _ in range(3)]
+        
+        assert CallCountingDetector.calls == 1
+        assert [r.skipped for r in results] == [False, True, True]
+        assert all(r.total == 2 for r in results)
+        assert pipeline.get_metrics()["skipped_frames"] == 2
+    
+    def test_motion_gate_with_detect_stride_keeps_change(self):
+        class CallCountingDetector(FakeDetector):
+            calls = 0
+
+            def detect(self, frame):
+                CallCountingDetector.calls += 1
+                return super().detect(frame)
+
+        pipeline = InferencePipeline(
+            detector=CallCountingDetector(),
+            enable_logging=False,
+            motion_gate=MotionGate(refresh_interval=0),
+        )
+        pipeline.detect_stride = 2
+        # Değişim stride yüzünden atlanan frame'e denk gelir; sonraki uygun frame'de tespit edilmeli
+        frames = [np.zeros((100, 100, 3), dtype=np.uint8)] + [np.full((100, 100, 3), 255, dtype=np.uint8) for _ in range(8)]
+
+        results = [pipeline.run(f) for f in frames]
+
+        assert CallCountingDetector.calls == 2
+        assert [r.skipped for r in results] == [False, True, False] + [True] * 6
+
+    def test_motion_gate_in_batch(self):
+        pipeline = InferencePipeline(
+            detector=FakeDetector(),
+            enable_logging=False,
+            motion_gate=MotionGate(refresh_interval=0),
+        )
+        pipeline.run(np.zeros((100, 100, 3), dtype=np.uint8))
+        
+        results = pipeline.run_batch([np.zeros((100, 100, 3), dtype=np.uint8) for _ in range(2)])
+        
+        assert [r.skipped for r in results] == [True, True]
+        assert all(r.total == 2 for r in results)
+    
+    def test_motion_gate_in_batch_compares_with_last_detected_frame(self):
+        pipeline = InferencePipeline(
+            detector=FakeDetector(),
+            enable_logging=False,
+            motion_gate=MotionGate(pixel_threshold=15, refresh_interval=0),
+        )
+        # Her adım eşiğin altında, birikim üstünde: fark son tespit edilen frame'e göre ölçülmeli
+        frames = [np.full((100, 100, 3), level, dtype=np.uint8) for level in (0, 10, 20, 30, 30)]
+
+        results = pipeline.run_batch(frames)
+
+        assert [r.skipped for r in results] == [False, True, False, True, True]
+        assert all(r.total == 2 for r in results)
+
+    def test_stage_latencies(self):
+        pipeline = InferencePipeline(detector=FakeDetector(), enable_logging=False)
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        
+        result = pipeline.run(frame)
+        pipeline.run(frame)
+        
+        assert set(result.stage_times) == {"detect", "classify", "track", "count", "visualize"}
+        stages = pipeline.get_metrics()["stages"]
+        for stage in ("detect", "classify", "track", "count", "visualize"):
+            assert stages[stage]["count"] == 2
+            assert stages[stage]["p50"] <= stages[stage]["p95"] <= stages[stage]["p99"] <= stages[stage]["max"]
+
+    def test_rolling_window_metrics(self):
+        pipeline = InferencePipeline(detector=FakeDetector(), enable_logging=False)
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        for _ in range(3):
+            pipeline.run(frame)
+
+        windows = pipeline.get_metrics()["windows"]
+        assert set(windows) == {"minute", "hour", "day", "total"}
+        assert windows["minute"]["frames"] == 3
+        assert windows["minute"]["total"] == 6
+        assert windows["minute"]["by_confidence"] == {"medium": 3, "high": 3}
+        pipeline.reset()
+        assert pipeline.get_metrics()["windows"]["minute"]["frames"] == 0
+
+    def test_results_sink_receives_finalized_frames(self):
+        submitted = []
+
+        class FakeSink:
+            dropped = 0
+
+            def submit(self, camera, result, batch, timestamp=None):
+                submitted.append((camera, result.processing_time, len(batch)))
+                return True
+
+        pipeline = InferencePipeline(
+            detector=FakeDetector(), enable_logging=False, results_sink=FakeSink(), source="cam0"
+        )
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        pipeline.run(frame)
+        pipeline.run_batch([frame, frame])
+
+        assert [(camera, n) for camera, _, n in submitted] == [("cam0", 2)] * 3
+        assert all(processing_time > 0 for _, processing_time, _ in submitted)
+        assert pipeline.get_metrics()["results_dropped"] == 0
+
+
+def test_importing_pipeline_does_not_load_heavy_dependencies():
+    import subprocess
+    import sys
+
+    code = (
+        "import sys, strawberry_vision.application.pipeline, strawberry_vision.main; "
+        "print(','.join(m for m in ('cv2', 'ultralytics', 'yaml', 'onnxruntime') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == ""
@@ -0,0 +1,98 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from strawberry_vision.application.adaptive import AdaptiveController
+from strawberry_vision.application.pipeline import InferencePipeline
+from strawberry_vision.application.streaming import StreamingPipeline
+from strawberry_vision.domain.entities import Detection
+
+
+class CountingDetector:
+    """frame[0, 0, 0] değeri kadar tespit döndürür."""
+
+    def __init__(self, delay: float = 0.0):
+        self.delay = delay
+
+    def detect(self, frame):
+        if self.delay:
+            time.sleep(self.delay)
+        n = int(frame[0, 0, 0])
+        return [Detection(bbox=(i * 10, 50, 5, 5), score=0.9, label="strawberry") for i in range(n)]
+
+
+def build_frames(n):
+    frames = []
+    for i in range(n):
+        frame = np.zeros((60, 60, 3), dtype=np.uint8)
+        frame[0, 0, 0] = i % 5
+        frames.append(frame)
+    return frames
+
+
+class TestStreamingPipeline:
+    def test_preserves_frame_order(self):
+        pipeline = InferencePipeline(detector=CountingDetector(delay=0.001), enable_logging=False)
+        streaming = StreamingPipeline(pipeline, queue_size=2)
+
+        results = list(streaming.run(build_frames(20)))
+
+        assert [r.frame_processed for r in results] == list(range(1, 21))
+        assert [r.total for r in results] == [i % 5 for i in range(20)]
+        assert pipeline.get_metrics()["total_frames"] == 20
+
+    def test_adaptive_controller_observes_streamed_results(self):
+        pipeline = InferencePipeline(detector=CountingDetector(delay=0.002), enable_logging=False)
+        controller = AdaptiveController(pipeline, target_latency=0.0001, window=3)
+        streaming = StreamingPipeline(pipeline, queue_size=2, controller=controller)
+
+        results = list(streaming.run(build_frames(20)))
+
+        assert len(results) == 20
+        assert pipeline.detect_stride > 1
+        assert pipeline.get_metrics()["adjustment_count"] > 0
+        assert any(r.skipped for r in results)
+
+    def test_controller_must_match_pipeline(self):
+        pipeline = InferencePipeline(detector=CountingDetector(), enable_logging=False)
+        other = InferencePipeline(detector=CountingDetector(), enable_logging=False)
+        with pytest.raises(ValueError):
+            StreamingPipeline(pipeline, controller=AdaptiveController(other))
+
+    def test_queues_are_bounded(self):
+        pipeline = InferencePipeline(detector=CountingDetector(delay=0.005), enable_logging=False)
+        streaming = StreamingPipeline(pipeline, queue_size=3)
+
+        list(streaming.run(build_frames(15)))
+        metrics = streaming.get_metrics()
+
+        assert set(metrics["queue_depths"]) == set(StreamingPipeline.STAGES)
+        assert all(depth <= 3 for depth in metrics["max_queue_depths"].values())
+        assert metrics["queue_depths"]["decode"] == 0
+
+    def test_detector_error_yields_empty_result(self):
+        class FailingDetector:
+            def detect(self, frame):
+                raise RuntimeError("boom")
+
+        pipeline = InferencePipeline(detector=FailingDetector(), enable_logging=False)
+        results = list(StreamingPipeline(pipeline).run(build_frames(3)))
+
+        assert [r.total for r in results] == [0, 0, 0]
+        assert [r.frame_processed for r in results] == [1, 2, 3]
+
+    def test_early_close_stops_workers(self):
+        pipeline = InferencePipeline(detector=CountingDetector(), enable_logging=False)
+        streaming = StreamingPipeline(pipeline, queue_size=1, poll_interval=0.01)
+
+        def endless():
+            while True:
+                yield build_frames(1)[0]
+
+        stream = streaming.run(endless())
+        next(stream)
+        stream.close()
+
+        assert not any(t.name.startswith("sv-") for t in threading.enumerate())
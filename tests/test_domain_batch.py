@@ -0,0 +1,76 @@
+import numpy as np
+import pytest
+
+from strawberry_vision.domain.batch import DetectionBatch, RIPENESS_CODES
+from strawberry_vision.domain.entities import Detection, Ripeness, Strawberry
+from strawberry_vision.domain.services import CountingService, TrackingService
+from strawberry_vision.presentation.visualizer import Visualizer
+
+
+def make_strawberries():
+    return [
+        Strawberry(id=1, detection=Detection(bbox=(0, 0, 10, 10), score=0.95, label="healthy"), ripeness=Ripeness.RIPE),
+        Strawberry(id=None, detection=Detection(bbox=(5, 5, 4, 4), score=0.9, label="diseased"), ripeness=Ripeness.RIPE),
+        Strawberry(id=3, detection=Detection(bbox=(1, 2, 3, 4), score=0.7, label="healthy"), ripeness=Ripeness.SEMI_RIPE),
+        Strawberry(id=None, detection=Detection(bbox=(9, 9, 1, 1), score=0.2, label="healthy"), ripeness=Ripeness.UNRIPE),
+    ]
+
+
+class TestDetectionBatch:
+    def test_from_xyxy_truncates_like_int(self):
+        batch = DetectionBatch.from_xyxy(
+            np.array([[10.7, 20.2, 50.9, 60.5]], dtype=np.float32), [0.5], [1], class_names=("a", "b")
+        )
+        assert batch.bboxes.tolist() == [[10, 20, 40, 40]]
+        assert batch.labels.tolist() == ["b"]
+        assert batch.track_ids.tolist() == [-1]
+
+    def test_vectorized_validation(self):
+        with pytest.raises(ValueError, match="Score"):
+            DetectionBatch([[0, 0, 1, 1], [0, 0, 1, 1]], [0.5, 1.5], [0, 0])
+        with pytest.raises(ValueError, match="Bbox"):
+            DetectionBatch([[0, -1, 1, 1]], [0.5], [0])
+
+    def test_views_round_trip(self):
+        strawberries = make_strawberries()
+        batch = DetectionBatch.from_strawberries(strawberries)
+        assert len(batch) == 4
+        assert batch.to_strawberries() == strawberries
+        assert batch.detection(-1) == strawberries[-1].detection
+        assert batch.strawberry(1).id is None
+
+    def test_unknown_class_id_label(self):
+        batch = DetectionBatch([[0, 0, 1, 1]], [0.5], [5], class_names=("a",))
+        assert batch.labels.tolist() == ["5"]
+        assert batch.label_counts() == {"5": 1}
+
+    def test_empty(self):
+        batch = DetectionBatch.empty(("a",))
+        assert len(batch) == 0
+        assert batch.to_detections() == []
+        assert DetectionBatch.from_detections([]).bboxes.shape == (0, 4)
+
+
+class TestServicesOnBatch:
+    def test_counting_matches_list(self):
+        counter = CountingService()
+        strawberries = make_strawberries()
+        batch = DetectionBatch.from_strawberries(strawberries)
+        assert counter.get_statistics(batch) == counter.get_statistics(strawberries)
+        assert batch.label_counts() == {"healthy": 3, "diseased": 1}
+
+    def test_tracking_assigns_missing_ids(self):
+        tracker = TrackingService()
+        tracker._next_id = 10
+        batch = DetectionBatch.from_strawberries(make_strawberries())
+        tracker.assign_ids(batch)
+        assert batch.track_ids.tolist() == [1, 10, 3, 11]
+        assert tracker.total_tracked == 2
+
+    def test_visualizer_rows_match_list(self):
+        strawberries = make_strawberries()
+        batch = DetectionBatch.from_strawberries(strawberries)
+        rows = [(tuple(bbox), *rest) for bbox, *rest in Visualizer._rows(batch)]
+        assert rows == list(Visualizer._rows(strawberries))
+        batch.ripeness[0] = RIPENESS_CODES[Ripeness.UNRIPE]
+        assert next(Visualizer._rows(batch))[2] == "unripe"
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from strawberry_vision.domain.rolling import RollingWindow
+
+
+def brute_force(events, now, span, bucket_span):
+    """Güncel kovadan geriye `span / bucket_span` kova içindeki olayların toplamı."""
+    head = int(now // bucket_span)
+    buckets = int(round(span / bucket_span))
+    return sum(v for t, v in events if head - buckets < int(t // bucket_span) <= head)
+
+
+class TestRollingWindow:
+    def test_matches_brute_force(self):
+        rng = np.random.default_rng(0)
+        window = RollingWindow(span=10.0, buckets=10)
+        events = []
+        now = 0.0
+        for _ in range(500):
+            now += rng.exponential(0.3)
+            value = int(rng.integers(0, 5))
+            window.add(np.array([value]), now)
+            events.append((now, value))
+            assert window.total()[0] == brute_force(events, now, 10.0, 1.0)
+
+    def test_expires_without_new_events(self):
+        window = RollingWindow(span=60.0, buckets=60, width=2)
+        window.add(np.array([3, 1]), 100.0)
+        window.add(np.array([2, 0]), 130.0)
+        assert window.total(150.0).tolist() == [5, 1]
+        assert window.total(165.0).tolist() == [2, 0]
+        assert window.total(1000.0).tolist() == [0, 0]
+
+    def test_clock_going_backwards_stays_in_current_bucket(self):
+        window = RollingWindow(span=5.0, buckets=5)
+        window.add(np.array([1]), 10.0)
+        window.add(np.array([1]), 8.0)
+        assert window.total(10.5)[0] == 2
+
+    def test_total_does_not_mutate(self):
+        window = RollingWindow(span=5.0, buckets=5)
+        window.add(np.array([3]), 100.0)
+        assert window.total(1000.0)[0] == 0
+        window.add(np.array([2]), 101.0)
+        assert window.total(101.0)[0] == 5
+
+    def test_reset(self):
+        window = RollingWindow(span=5.0, buckets=5)
+        window.add(np.array([4]), 1.0)
+        window.reset()
+        assert window.total(1.0)[0] == 0
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            RollingWindow(span=0.0)
@@ -1,5 +1,7 @@
+import numpy as np
 import pytest
 
+from strawberry_vision.domain.batch import DetectionBatch
 from strawberry_vision.domain.entities import Ripeness, Detection, Strawberry
 from strawberry_vision.domain.services import TrackingService, CountingService
 
@@ -92,3 +94,84 @@ class TestCountingService:
         assert stats["tracked"] == 1
         assert "by_ripeness" in stats
         assert "by_confidence" in stats
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_batch(ripeness, scores, track_ids):
+    n = len(ripeness)
+    return DetectionBatch(
+        np.zeros((n, 4), dtype=np.int64),
+        scores,
+        np.zeros(n, dtype=np.int64),
+        ("strawberry",),
+        ripeness=ripeness,
+        track_ids=track_ids,
+    )
+
+
+class TestStreamingStatistics:
+    def test_observe_matches_separate_counts(self):
+        rng = np.random.default_rng(0)
+        batch = make_batch(rng.integers(0, 3, 100), rng.uniform(0, 1, 100), rng.integers(-1, 3, 100))
+        counter = CountingService()
+        expected = {
+            "total": counter.count_total(batch),
+            "by_ripeness": counter.count_by_ripeness(batch),
+            "by_confidence": counter.count_by_confidence(batch),
+            "tracked": counter.count_tracked(batch),
+        }
+        assert counter.observe(batch) == expected
+        assert counter.get_statistics(batch) == expected
+
+    def test_confidence_bin_edges(self):
+        batch = make_batch([0, 0, 0, 0], [0.69, 0.7, 0.9, 1.0], [-1] * 4)
+        assert CountingService().observe(batch)["by_confidence"] == {"low": 1, "medium": 1, "high": 2}
+
+    def test_rolling_windows(self):
+        clock = FakeClock()
+        counter = CountingService(windows={"minute": 60, "hour": 3600}, clock=clock)
+        ripe = make_batch([0, 0], [0.95, 0.5], [1, -1])
+        unripe = make_batch([2], [0.8], [2])
+        counter.observe(ripe)
+        clock.now = 35
+        counter.observe(unripe)
+        clock.now = 90
+        counter.observe(unripe)
+
+        windows = counter.get_window_statistics()
+        assert windows["minute"] == {
+            "total": 2,
+            "by_ripeness": {"unripe": 2},
+            "by_confidence": {"medium": 2},
+            "tracked": 2,
+            "frames": 2,
+        }
+        assert windows["hour"]["by_ripeness"] == {"ripe": 2, "unripe": 2}
+        assert windows["hour"]["frames"] == 3
+        assert windows["total"]["total"] == 4
+
+        clock.now = 200
+        assert counter.get_window_statistics()["minute"]["frames"] == 0
+        assert counter.get_window_statistics()["hour"]["frames"] == 3
+
+    def test_observe_accepts_strawberry_list(self):
+        det = Detection(bbox=(0, 0, 10, 10), score=0.9, label="strawberry")
+        counter = CountingService(windows={})
+        stats = counter.observe([Strawberry(id=1, detection=det, ripeness=Ripeness.RIPE)], timestamp=0.0)
+        assert stats == {"total": 1, "by_ripeness": {"ripe": 1}, "by_confidence": {"high": 1}, "tracked": 1}
+        assert counter.get_window_statistics() == {
+            "total": {"total": 1, "by_ripeness": {"ripe": 1}, "by_confidence": {"high": 1}, "tracked": 1, "frames": 1}
+        }
+
+    def test_reset(self):
+        counter = CountingService()
+        counter.observe(make_batch([1], [0.9], [-1]))
+        counter.reset()
+        assert all(stats["frames"] == 0 for stats in counter.get_window_statistics().values())
@@ -0,0 +1,290 @@
+import numpy as np
+import pytest
+
+from strawberry_vision.application.pipeline import InferencePipeline
+from strawberry_vision.domain.batch import UNTRACKED, DetectionBatch
+from strawberry_vision.domain.entities import Detection, Ripeness, Strawberry
+from strawberry_vision.domain.services import TrackingService
+from strawberry_vision.domain.tracking import (
+    TRACK_RECORD_DTYPE,
+    KalmanBoxState,
+    TrackStore,
+    greedy_match,
+    hungarian_match,
+    iou_matrix,
+    xywh_to_xyxy,
+)
+
+
+def boxes(*xywh):
+    return np.array(xywh, dtype=np.int64).reshape(-1, 4)
+
+
+class TestIouMatrix:
+    def test_matches_pairwise_definition(self):
+        a = xywh_to_xyxy(boxes((0, 0, 10, 10), (5, 5, 10, 10)))
+        b = xywh_to_xyxy(boxes((0, 0, 10, 10), (20, 20, 5, 5), (0, 5, 10, 10)))
+        iou = iou_matrix(a, b)
+        assert iou.shape == (2, 3)
+        assert iou[0, 0] == pytest.approx(1.0)
+        assert iou[0, 1] == 0.0
+        assert iou[0, 2] == pytest.approx(50 / 150)
+        assert iou[1, 0] == pytest.approx(25 / 175)
+
+    def test_empty(self):
+        assert iou_matrix(np.zeros((0, 4)), xywh_to_xyxy(boxes((0, 0, 1, 1)))).shape == (0, 1)
+
+
+class TestMatchers:
+    def test_greedy_takes_best_pairs_first(self):
+        iou = np.array([[0.9, 0.8], [0.85, 0.1]])
+        rows, cols = greedy_match(iou, 0.3)
+        assert sorted(zip(rows.tolist(), cols.tolist())) == [(0, 0)]
+
+    def test_hungarian_maximises_total_iou(self):
+        pytest.importorskip("scipy")
+        iou = np.array([[0.9, 0.8], [0.85, 0.1]])
+        rows, cols = hungarian_match(iou, 0.3)
+        assert sorted(zip(rows.tolist(), cols.tolist())) == [(0, 1), (1, 0)]
+
+
+class TestTrackingService:
+    def test_ids_persist_across_frames(self):
+        tracker = TrackingService()
+        first = tracker.update(boxes((0, 0, 10, 10), (50, 50, 10, 10)))
+        second = tracker.update(boxes((52, 51, 10, 10), (1, 1, 10, 10), (100, 100, 10, 10)))
+        assert first.tolist() == [1, 2]
+        assert second.tolist() == [2, 1, 3]
+        assert tracker.total_tracked == 3
+
+    def test_class_aware_matching(self):
+        tracker = TrackingService()
+        tracker.update(boxes((0, 0, 10, 10)), np.array([0]))
+        assert tracker.update(boxes((0, 0, 10, 10)), np.array([1])).tolist() == [2]
+        assert TrackingService(class_aware=False).update(boxes((0, 0, 10, 10)), np.array([1])).tolist() == [1]
+
+    def test_class_ids_stable_when_labels_reorder(self):
+        def frame(*labelled):
+            return [Strawberry(None, Detection(bbox=bbox, score=0.9, label=label), Ripeness.RIPE) for label, bbox in labelled]
+
+        tracker = TrackingService()
+        a, b = (0, 0, 10, 10), (100, 0, 10, 10)
+        first = tracker.assign_ids(frame(("A", a), ("B", b)))
+        # Etiketler frame'de ters sırada görünür: frame'e özgü ID'ler yer değiştirir
+        second = tracker.assign_ids(frame(("B", b), ("A", a)))
+        third = tracker.assign_ids(frame(("B", a)))
+        assert [s.id for s in first] == [1, 2]
+        assert [s.id for s in second] == [2, 1]
+        assert [s.id for s in third] == [3]
+
+        batch = DetectionBatch.from_xyxy(
+            np.array([[100, 0, 110, 10]], np.float32), np.array([0.9]), np.array([0]), class_names=("B",)
+        )
+        assert tracker.assign_ids(batch).track_ids.tolist() == [2]
+        assert tracker.class_names == ("A", "B")
+
+    def test_track_death_after_max_age(self):
+        tracker = TrackingService(max_age=2)
+        tracker.update(boxes((0, 0, 10, 10)))
+        tracker.update(boxes())
+        tracker.update(boxes())
+        assert tracker.update(boxes((0, 0, 10, 10))).tolist() == [1]
+        for _ in range(3):
+            tracker.update(boxes())
+        assert tracker.active_tracks == 0
+        assert tracker.update(boxes((0, 0, 10, 10))).tolist() == [2]
+
+    def test_min_hits_confirms_before_id(self):
+        tracker = TrackingService(min_hits=2)
+        assert tracker.update(boxes((0, 0, 10, 10), (40, 40, 10, 10))).tolist() == [UNTRACKED, UNTRACKED]
+        # Tek frame'lik (onaylanmamış) track ilk kaçırmada silinir
+        assert tracker.update(boxes((1, 0, 10, 10))).tolist() == [1]
+        assert tracker.active_tracks == 1
+        assert tracker.total_tracked == 1
+
+    def test_existing_ids_are_kept(self):
+        tracker = TrackingService()
+        batch = DetectionBatch.from_xyxy(
+            np.array([[0, 0, 10, 10], [20, 20, 30, 30]], np.float32), np.array([0.9, 0.8]), np.array([0, 0]), class_names=("a",)
+        )
+        batch.track_ids[0] = 42
+        tracker.assign_ids(batch)
+        assert batch.track_ids.tolist() == [42, 1]
+
+    def test_invalid_matcher(self):
+        with pytest.raises(ValueError):
+            TrackingService(matcher="nearest")
+
+    def test_many_objects_keep_identity(self):
+        rng = np.random.default_rng(0)
+        grid = np.stack(np.meshgrid(np.arange(25), np.arange(20)), axis=-1).reshape(-1, 2) * 40
+        tracker = TrackingService()
+        first = tracker.update(np.concatenate([grid, np.full((500, 2), 20)], axis=1))
+        for _ in range(10):
+            grid = grid + rng.integers(-2, 3, grid.shape)
+            order = rng.permutation(500)
+            ids = tracker.update(np.concatenate([grid[order], np.full((500, 2), 20)], axis=1))
+            assert (ids == first[order]).all()
+        assert tracker.total_tracked == 500
+
+
+class TestKalman:
+    def test_vectorized_update_matches_single_track(self):
+        rng = np.random.default_rng(0)
+        start = xywh_to_xyxy(rng.integers(0, 200, (5, 4)) + 10)
+        together = KalmanBoxState(5)
+        together.init(np.arange(5), start)
+        singles = [KalmanBoxState(1) for _ in range(5)]
+        for state, box in zip(singles, start):
+            state.init(np.array([0]), box[None])
+        for step in range(3):
+            measured = start + step * 3 + rng.normal(0, 1, start.shape)
+            together.predict(np.arange(5))
+            together.update(np.array([0, 2, 4]), measured[[0, 2, 4]])
+            for i, state in enumerate(singles):
+                state.predict(np.array([0]))
+                if i in (0, 2, 4):
+                    state.update(np.array([0]), measured[i][None])
+        assert np.allclose(together.mean, np.concatenate([s.mean for s in singles]))
+        assert np.allclose(together.covariance, np.concatenate([s.covariance for s in singles]))
+
+    def test_constant_velocity_is_learned(self):
+        tracker = TrackingService(motion="kalman")
+        for x in range(0, 50, 5):
+            tracker.update(boxes((x, 20, 20, 20)))
+        predicted = tracker.predict(class_names=("a",))
+        assert predicted.track_ids.tolist() == [1]
+        assert abs(predicted.bboxes[0, 0] - 50) <= 1
+        assert predicted.class_names == ("a",)
+        assert abs(tracker.predict().bboxes[0, 0] - 55) <= 1
+
+    def test_prediction_is_clipped_and_hides_lost_tracks(self):
+        tracker = TrackingService(motion="kalman", max_age=3)
+        for x in (20, 10, 0):
+            tracker.update(boxes((x, 0, 20, 20), (100, 100, 10, 10)))
+        tracker.update(boxes((100, 100, 10, 10)))  # ilk nesne kaçırıldı
+        predicted = tracker.predict(frame_hw=(105, 105))
+        assert predicted.track_ids.tolist() == [2]
+        x, y, w, h = predicted.bboxes[0].tolist()
+        assert x + w <= 105 and y + h <= 105 and min(x, y, w, h) >= 0
+
+    def test_matching_uses_predicted_boxes(self):
+        # Hızlanan nesne: son kutuyla IoU eşiğin altına düşer, tahmini kutuyla eşleşir
+        xs = np.cumsum([0, 2, 4, 6, 8, 10, 12, 14])
+        kalman, plain = TrackingService(motion="kalman"), TrackingService()
+        for x in xs.tolist():
+            kalman_ids = kalman.update(boxes((x, 0, 20, 20)))
+            plain_ids = plain.update(boxes((x, 0, 20, 20)))
+        assert kalman_ids.tolist() == [1]
+        assert plain_ids.tolist() != [1]
+
+    def test_invalid_motion(self):
+        with pytest.raises(ValueError):
+            TrackingService(motion="linear")
+
+
+class TestTrackStore:
+    def test_freed_slots_are_reused(self):
+        store = TrackStore(capacity=4)
+        first = store.allocate(3)
+        assert first.tolist() == [0, 1, 2]
+        store.ids[first] = [7, UNTRACKED, 9]
+        records = store.release(first[[0, 1]])
+        assert records.dtype == TRACK_RECORD_DTYPE
+        assert records["track_id"].tolist() == [7]
+        assert len(store) == 1
+        assert sorted(store.allocate(3).tolist()) == [0, 1, 3]
+        assert store.allocate(1).size == 0
+
+    def test_ttl_eviction_spills_confirmed_tracks(self):
+        spilled = []
+        tracker = TrackingService(max_age=2, spill=spilled.append)
+        tracker.update(boxes((0, 0, 20, 20), (100, 0, 20, 20)))
+        for _ in range(3):
+            tracker.update(boxes((0, 0, 20, 20)))
+        assert tracker.active_tracks == 1
+        assert tracker.finished_tracks == 1
+        (records,) = spilled
+        assert records["track_id"].tolist() == [2]
+        assert records[["first_frame", "last_frame", "hits"]].tolist() == [(1, 1, 1)]
+        tracker.flush()
+        assert spilled[-1]["track_id"].tolist() == [1]
+        assert spilled[-1]["hits"].tolist() == [4]
+        assert tracker.active_tracks == 0
+
+    def test_full_store_evicts_stalest_then_drops(self):
+        tracker = TrackingService(capacity=3, max_age=10)
+        tracker.update(boxes((0, 0, 20, 20), (100, 0, 20, 20)))
+        tracker.update(boxes((100, 0, 20, 20)))
+        # Depoda 1 boş slot var; iki yeni nesne için en eski görülen (ID 1) silinir
+        ids = tracker.update(boxes((100, 0, 20, 20), (200, 0, 20, 20), (300, 0, 20, 20)))
+        assert ids.tolist() == [2, 3, 4]
+        assert tracker.finished_tracks == 1
+        ids = tracker.update(boxes((100, 0, 20, 20), (200, 0, 20, 20), (300, 0, 20, 20), (400, 0, 20, 20)))
+        assert ids.tolist() == [2, 3, 4, UNTRACKED]
+        assert tracker.dropped_tracks == 1
+
+    @pytest.mark.parametrize("motion", ["none", "kalman"])
+    def test_memory_is_flat_over_long_stream(self, motion):
+        rng = np.random.default_rng(0)
+        tracker = TrackingService(capacity=64, motion=motion)
+        columns = (tracker._store.boxes, tracker._store.ids)
+        memory = tracker.memory_bytes
+        positions = rng.uniform(0, 1000, (10, 2))
+        for frame in range(1000):
+            # Her frame'de bir nesne kaybolur, yerine yenisi gelir
+            positions[frame % 10] = rng.uniform(0, 1000, 2)
+            tracker.update(np.concatenate([positions.astype(np.int64), np.full((10, 2), 20)], axis=1))
+        assert tracker.total_tracked > 900
+        assert tracker.active_tracks <= 64
+        assert tracker.memory_bytes == memory
+        assert tracker._store.boxes is columns[0] and tracker._store.ids is columns[1]
+
+
+class MovingDetector:
+    def __init__(self):
+        self.x = 0
+
+    def detect(self, frame):
+        self.x += 2
+        return [Detection(bbox=(self.x, 10, 20, 20), score=0.9, label="Healthy")]
+
+
+def test_pipeline_total_tracked_counts_objects_not_frames():
+    pipeline = InferencePipeline(detector=MovingDetector(), enable_logging=False)
+    frame = np.zeros((64, 64, 3), dtype=np.uint8)
+    for _ in range(5):
+        pipeline.run(frame)
+    metrics = pipeline.get_metrics()
+    assert metrics["total_tracked"] == 1
+    assert metrics["active_tracks"] == 1
+    assert metrics["tracker_memory_bytes"] == pipeline.tracker.memory_bytes > 0
+
+
+class FrameDetector:
+    """Nesneyi frame'e çizilmiş konumdan bulur (kare başına 3 piksel sağa kayar)."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def detect(self, frame):
+        self.calls += 1
+        xs = np.nonzero(frame[0, :, 0])[0]
+        return [Detection(bbox=(int(xs[0]), 10, 20, 20), score=0.9, label="Healthy")]
+
+
+def test_pipeline_predicts_between_detections():
+    pipeline = InferencePipeline(detector=FrameDetector(), tracker=TrackingService(motion="kalman"), enable_logging=False)
+    pipeline.detect_stride = 3
+    results = []
+    for i in range(9):
+        frame = np.zeros((64, 128, 3), dtype=np.uint8)
+        frame[0, 3 * i] = 255
+        results.append(pipeline.run(frame))
+    assert pipeline.detector.calls == 3
+    assert [r.predicted for r in results] == [False, True, True] * 3
+    assert all(r.total == 1 for r in results)
+    metrics = pipeline.get_metrics()
+    assert metrics["predicted_frames"] == 6
+    assert metrics["total_tracked"] == 1
+    assert results[1].summary()["predicted"] is True
@@ -0,0 +1,153 @@
+import numpy as np
+import pytest
+
+from strawberry_vision.application.pipeline import InferencePipeline
+from strawberry_vision.domain.batch import RIPENESS_CODES, DetectionBatch
+from strawberry_vision.domain.entities import Detection, Ripeness
+from strawberry_vision.domain.unique_counting import UniqueCountingService
+from strawberry_vision.domain.zones import (
+    CountingLine,
+    CountingZone,
+    crossing_matrix,
+    points_in_polygon,
+)
+
+RIPE, UNRIPE = RIPENESS_CODES[Ripeness.RIPE], RIPENESS_CODES[Ripeness.UNRIPE]
+
+
+def frame_batch(track_ids, xs, y=100, ripeness=None, class_ids=None, class_names=("strawberry",)):
+    n = len(track_ids)
+    return DetectionBatch(
+        np.array([[x, y, 20, 20] for x in xs]).reshape(-1, 4),
+        np.full(n, 0.9),
+        np.zeros(n, dtype=np.int64) if class_ids is None else class_ids,
+        class_names,
+        ripeness=np.full(n, RIPE) if ripeness is None else ripeness,
+        track_ids=track_ids,
+    )
+
+
+def segments_intersect(p, q, a, b):
+    def orient(o, s, t):
+        return (s[0] - o[0]) * (t[1] - o[1]) - (s[1] - o[1]) * (t[0] - o[0])
+
+    return (orient(a, b, p) >= 0) != (orient(a, b, q) >= 0) and orient(p, q, a) * orient(p, q, b) <= 0
+
+
+class TestGeometry:
+    def test_crossing_matrix_matches_pairwise(self):
+        rng = np.random.default_rng(0)
+        previous, current = rng.uniform(0, 100, (50, 2)), rng.uniform(0, 100, (50, 2))
+        lines = [CountingLine(f"l{i}", tuple(rng.uniform(0, 100, 2)), tuple(rng.uniform(0, 100, 2))) for i in range(4)]
+        expected = [[segments_intersect(p, q, l.start, l.end) for l in lines] for p, q in zip(previous, current)]
+        assert crossing_matrix(previous, current, lines).tolist() == expected
+        assert np.array(expected).any()
+
+    def test_stopping_on_the_line_counts_once(self):
+        line = [CountingLine("gate", (50, 0), (50, 100))]
+        path = np.array([[40.0, 10], [50, 10], [60, 10]])
+        crossed = [crossing_matrix(path[i : i + 1], path[i + 1 : i + 2], line)[0, 0] for i in range(2)]
+        assert sum(crossed) == 1
+
+    def test_crossing_outside_segment_is_ignored(self):
+        line = [CountingLine("gate", (50, 0), (50, 100))]
+        assert not crossing_matrix(np.array([[40.0, 150]]), np.array([[60.0, 150]]), line).any()
+
+    def test_points_in_concave_polygon(self):
+        # U şekli: ortadaki boşluk dışarıda
+        polygon = np.array([[0, 0], [30, 0], [30, 30], [20, 30], [20, 10], [10, 10], [10, 30], [0, 30]], dtype=float)
+        points = np.array([[5, 20], [15, 20], [25, 20], [15, 5], [40, 5]], dtype=float)
+        assert points_in_polygon(points, polygon).tolist() == [True, False, True, True, False]
+
+    def test_invalid_regions(self):
+        with pytest.raises(ValueError):
+            CountingLine("dot", (1, 1), (1, 1))
+        with pytest.raises(ValueError):
+            CountingZone("line", [[0, 0], [1, 1]])
+
+
+class TestUniqueCountingService:
+    def test_track_counted_once_with_majority_label(self):
+        counter = UniqueCountingService(label="ripeness")
+        for code in (RIPE, UNRIPE, RIPE, RIPE, UNRIPE):
+            counter.update(frame_batch([7], [10], ripeness=np.array([code])))
+        assert counter.counts() == {"all": {"ripe": 1}}
+        assert counter.finish() == {"all": {"ripe": 1}}
+        assert counter.active_tracks == 0
+
+    def test_line_counts_only_crossing_tracks(self):
+        counter = UniqueCountingService([CountingLine("exit", (100, 0), (100, 300))])
+        # Track 1 çizgiyi geçip geri döner (bir kez sayılır), track 2 hiç geçmez
+        for x1, x2 in [(60, 10), (90, 20), (120, 30), (80, 40), (130, 50)]:
+            counter.update(frame_batch([1, 2], [x1, x2]))
+        assert counter.counts() == {"exit": {"strawberry": 1}}
+
+    def test_zone_and_line_are_counted_separately(self):
+        regions = [
+            CountingLine("exit", (100, 0), (100, 300)),
+            CountingZone("tray", [[0, 0], [60, 0], [60, 300], [0, 300]]),
+        ]
+        counter = UniqueCountingService(regions)
+        for x in (0, 40, 80, 120):
+            counter.update(frame_batch([1, 2], [x, 200]))
+        assert counter.counts() == {"exit": {"strawberry": 1}, "tray": {"strawberry": 1}}
+
+    def test_class_majority_over_changing_labels(self):
+        counter = UniqueCountingService(label="class")
+        names = ("healthy", "diseased")
+        for class_id in (0, 1, 1):
+            counter.update(frame_batch([3], [10], class_ids=np.array([class_id]), class_names=names))
+        counter.update(frame_batch([4], [50], class_ids=np.array([0]), class_names=names))
+        assert counter.counts() == {"all": {"diseased": 1, "healthy": 1}}
+
+    def test_ttl_finalizes_and_frees_rows(self):
+        counter = UniqueCountingService(ttl=2, capacity=2)
+        for track_id in range(1, 6):
+            for _ in range(2):
+                counter.update(frame_batch([track_id], [10]))
+        assert counter.counts() == {"all": {"strawberry": 5}}
+        assert counter.active_tracks <= 2
+        assert counter.dropped_tracks == 0
+
+    def test_full_capacity_finalizes_oldest(self):
+        counter = UniqueCountingService(ttl=100, capacity=2)
+        counter.update(frame_batch([1, 2], [10, 50]))
+        counter.update(frame_batch([2, 3], [50, 90]))
+        assert counter.finished_tracks == 1
+        counter.update(frame_batch([2, 3, 4, 5], [50, 90, 130, 170]))
+        assert counter.dropped_tracks == 2
+        assert counter.counts() == {"all": {"strawberry": 3}}
+
+    def test_reused_frames_do_not_vote(self):
+        counter = UniqueCountingService(label="ripeness")
+        counter.update(frame_batch([1], [10], ripeness=np.array([UNRIPE])))
+        for _ in range(3):
+            counter.update(frame_batch([1], [10], ripeness=np.array([RIPE])), vote=False)
+        assert counter.counts() == {"all": {"unripe": 1}}
+
+    def test_invalid_label(self):
+        with pytest.raises(ValueError):
+            UniqueCountingService(label="color")
+
+
+class SlidingDetector:
+    """Kare başına 8 piksel sağa kayan tek nesne."""
+
+    def __init__(self):
+        self.x = 0
+
+    def detect(self, frame):
+        self.x += 8
+        return [Detection(bbox=(self.x, 10, 20, 20), score=0.9, label="diseased")]
+
+
+def test_pipeline_reports_unique_counts():
+    counter = UniqueCountingService([CountingLine("gate", (100, 0), (100, 64))])
+    pipeline = InferencePipeline(detector=SlidingDetector(), unique_counter=counter, enable_logging=False)
+    frame = np.zeros((64, 256, 3), dtype=np.uint8)
+    results = [pipeline.run(frame) for _ in range(15)]
+    assert results[0].unique_counts == {"gate": {}}
+    assert results[-1].unique_counts == {"gate": {"diseased": 1}}
+    assert results[-1].summary()["unique_counts"] == {"gate": {"diseased": 1}}
+    assert pipeline.get_metrics()["unique_counts"] == {"gate": {"diseased": 1}}
+    assert pipeline.get_metrics()["total_tracked"] == 1
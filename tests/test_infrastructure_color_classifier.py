@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from strawberry_vision.application.pipeline import InferencePipeline
+from strawberry_vision.domain.batch import RIPENESS_CODES
+from strawberry_vision.domain.entities import Detection, Ripeness
+from strawberry_vision.infrastructure.color_classifier import (
+    HistogramClassifier,
+    RedMeanClassifier,
+    _bgr_to_hue_saturation,
+)
+
+RED, ORANGE, GREEN, WHITE = (20, 20, 220), (0, 150, 255), (40, 200, 40), (235, 235, 235)
+
+
+def patches(*colors, size=20):
+    frame = np.zeros((size, size * len(colors), 3), dtype=np.uint8)
+    for i, color in enumerate(colors):
+        frame[:, i * size : (i + 1) * size] = color
+    bboxes = np.array([[i * size, 0, size, size] for i in range(len(colors))])
+    return frame, bboxes
+
+
+def codes(*levels):
+    return [RIPENESS_CODES[level] for level in levels]
+
+
+class TestHistogramClassifier:
+    def test_default_prototypes(self):
+        frame, bboxes = patches(RED, ORANGE, GREEN, WHITE)
+        result = HistogramClassifier().classify_batch(frame, bboxes)
+        assert result.tolist() == codes(Ripeness.RIPE, Ripeness.SEMI_RIPE, Ripeness.UNRIPE, Ripeness.UNRIPE)
+
+    def test_lut_matches_exact_hsv_binning(self):
+        classifier = HistogramClassifier()
+        colors = np.random.default_rng(0).integers(0, 256, (2000, 3))
+        hue, saturation = _bgr_to_hue_saturation(colors)
+        exact = np.minimum((hue / 30).astype(int), 11) * 4 + np.minimum((saturation * 4).astype(int), 3)
+        q = colors >> 3
+        lut = classifier.lut[(q[:, 0] << 10) | (q[:, 1] << 5) | q[:, 2]]
+        # 5 bitlik renk indirgemesi yalnızca kutu sınırındaki renkleri kaydırır
+        assert (lut == exact).mean() > 0.9
+
+    def test_batched_histograms_match_single_box(self):
+        frame = np.random.default_rng(1).integers(0, 256, (120, 160, 3), dtype=np.uint8)
+        bboxes = np.array([[0, 0, 40, 30], [50, 60, 70, 50], [-10, -10, 30, 30], [150, 110, 40, 40], [200, 0, 5, 5]])
+        classifier = HistogramClassifier(samples=8)
+        batched, valid = classifier.histograms(frame, bboxes)
+        assert valid.tolist() == [True, True, True, True, False]
+        for i, box in enumerate(bboxes):
+            single, _ = classifier.histograms(frame, box[None])
+            assert np.allclose(batched[i], single[0])
+        assert np.allclose(batched[valid].sum(axis=1), 1.0)
+        assert classifier.classify_batch(frame, bboxes)[-1] == RIPENESS_CODES[Ripeness.UNRIPE]
+
+    def test_config_prototypes_and_fit(self):
+        frame, bboxes = patches(RED, GREEN)
+        classifier = HistogramClassifier.from_config({
+            "color_classifier": {"h_bins": 6, "s_bins": 2, "prototypes": {"semi_ripe": [{"hue": [300, 60]}], "unripe": [{"hue": [60, 300]}]}},
+        })
+        assert classifier.n_bins == 12
+        assert classifier.classify_batch(frame, bboxes).tolist() == codes(Ripeness.SEMI_RIPE, Ripeness.UNRIPE)
+
+        fitted = HistogramClassifier(prototypes={}).fit(frame, bboxes, [Ripeness.RIPE, Ripeness.UNRIPE])
+        assert fitted.classify_batch(frame, bboxes).tolist() == codes(Ripeness.RIPE, Ripeness.UNRIPE)
+
+    def test_invalid_prototypes(self):
+        with pytest.raises(ValueError):
+            HistogramClassifier(prototypes={"ripe": [{"histogram": [1.0, 2.0]}]})
+        with pytest.raises(ValueError):
+            HistogramClassifier(prototypes={"ripe": [{"hue": [10, 11]}]})
+
+    def test_grayscale_frame_is_unripe(self):
+        result = HistogramClassifier().classify_batch(np.full((10, 10), 255, np.uint8), np.array([[0, 0, 5, 5]]))
+        assert result.tolist() == codes(Ripeness.UNRIPE)
+
+
+class OrangeDetector:
+    def detect(self, frame):
+        return [Detection(bbox=(20, 0, 20, 20), score=0.9, label="Healthy")]
+
+
+def test_pipeline_uses_pluggable_classifier():
+    frame, _ = patches(RED, ORANGE)
+    default = InferencePipeline(detector=OrangeDetector(), enable_logging=False)
+    assert isinstance(default.classifier, RedMeanClassifier)
+    # Kırmızı kanal ortalaması 255 → eski sezgisel yöntem turuncuyu olgun sayar
+    assert default.run(frame).counts["ripe"] == 1
+
+    pipeline = InferencePipeline(detector=OrangeDetector(), enable_logging=False, classifier=HistogramClassifier())
+    result = pipeline.run(frame)
+    assert result.counts["semi_ripe"] == 1
+    assert "classify" in result.stage_times
@@ -0,0 +1,34 @@
+import pytest
+
+from strawberry_vision.domain.zones import CountingLine, CountingZone
+from strawberry_vision.infrastructure.counting_config import load_counting_config, regions_for
+
+
+def test_loads_lines_and_zones_per_camera():
+    config = load_counting_config(
+        {
+            "counting": {
+                0: {
+                    "lines": [{"name": "exit", "points": [[10, 0], [10, 50]]}],
+                    "zones": [{"name": "tray", "polygon": [[0, 0], [5, 0], [5, 5]]}],
+                },
+                "default": {"lines": [{"name": "center", "points": [[0, 0], [0, 9]]}]},
+            }
+        }
+    )
+    line, zone = regions_for(config, "0")
+    assert isinstance(line, CountingLine) and line.end == (10, 50)
+    assert isinstance(zone, CountingZone) and zone.polygon.shape == (3, 2)
+    assert [r.name for r in regions_for(config, "cam.mp4")] == ["center"]
+    assert regions_for({}, "0") == []
+
+
+def test_line_needs_two_points():
+    with pytest.raises(ValueError):
+        load_counting_config({"default": {"lines": [{"name": "bad", "points": [[0, 0]]}]}})
+
+
+def test_reads_repo_config():
+    pytest.importorskip("yaml")
+    config = load_counting_config("configs/counting_config.yaml")
+    assert [r.name for r in config["0"]] == ["exit", "sorting_tray"]
@@ -0,0 +1,158 @@
+import numpy as np
+
+from strawberry_vision.domain.batch import RIPENESS_CODES
+from strawberry_vision.infrastructure import detectors as detectors_module
+from strawberry_vision.infrastructure.detectors import (
+    YOLODetector,
+    classify_ripeness,
+    classify_ripeness_batch,
+    integral_image,
+)
+
+
+class FakeBoxes:
+    def __init__(self, xyxy, conf, cls):
+        self.xyxy = np.asarray(xyxy, dtype=np.float32).reshape(-1, 4)
+        self.conf = np.asarray(conf, dtype=np.float32)
+        self.cls = np.asarray(cls, dtype=np.float32)
+
+    def __len__(self):
+        return len(self.conf)
+
+
+class FakeResult:
+    def __init__(self, boxes):
+        self.boxes = boxes
+
+
+class FakeYOLO:
+    def __init__(self, results):
+        self.results = results
+        self.calls = 0
+
+    def predict(self, source, verbose=False):
+        self.calls += 1
+        if isinstance(source, list):
+            return self.results[: len(source)]
+        return self.results[:1]
+
+
+def make_detector(results, class_names=("healthy", "diseased")):
+    detector = YOLODetector()
+    detector.model = FakeYOLO(results)
+    detector.class_names = list(class_names)
+    return detector
+
+
+class TestVectorizedConversion:
+    def test_detect_arrays_converts_whole_tensor(self):
+        boxes = FakeBoxes([[10.7, 20.2, 50.9, 60.5], [0, 0, 5, 5]], [0.9, 0.4], [1, 0])
+        detector = make_detector([FakeResult(boxes)])
+        xyxy, scores, class_ids = detector.detect_arrays(np.zeros((80, 80, 3), dtype=np.uint8))
+        assert xyxy.shape == (2, 4) and xyxy.dtype == np.float32
+        assert class_ids.dtype == np.int64
+        assert class_ids.tolist() == [1, 0]
+        assert np.allclose(scores, [0.9, 0.4])
+
+    def test_detect_matches_per_box_semantics(self):
+        boxes = FakeBoxes([[10.7, 20.2, 50.9, 60.5]], [0.9], [1])
+        detector = make_detector([FakeResult(boxes)])
+        [det] = detector.detect(np.zeros((80, 80, 3), dtype=np.uint8))
+        x1, y1, x2, y2 = boxes.xyxy[0].tolist()
+        assert det.bbox == (int(x1), int(y1), int(x2 - x1), int(y2 - y1))
+        assert det.label == "diseased"
+        assert abs(det.score - 0.9) < 1e-6
+
+    def test_unknown_class_id_falls_back_to_number(self):
+        boxes = FakeBoxes([[0, 0, 4, 4], [1, 1, 5, 5]], [0.8, 0.7], [0, 7])
+        detector = make_detector([FakeResult(boxes)])
+        labels = [d.label for d in detector.detect(np.zeros((10, 10, 3), dtype=np.uint8))]
+        assert labels == ["healthy", "7"]
+
+    def test_empty_result(self):
+        detector = make_detector([FakeResult(FakeBoxes(np.empty((0, 4)), [], []))])
+        assert detector.detect(np.zeros((10, 10, 3), dtype=np.uint8)) == []
+
+    def test_detect_batch_uses_single_predict_call(self):
+        results = [
+            FakeResult(FakeBoxes([[0, 0, 4, 4]], [0.8], [0])),
+            FakeResult(FakeBoxes([[1, 1, 5, 5]], [0.7], [1])),
+        ]
+        detector = make_detector(results)
+        frame = np.zeros((10, 10, 3), dtype=np.uint8)
+        batches = detector.detect_batch([frame, None, frame])
+        assert detector.model.calls == 1
+        assert [len(b) for b in batches] == [1, 0, 1]
+        assert batches[2][0].label == "diseased"
+
+
+class CountingYOLO(FakeYOLO):
+    def __init__(self):
+        super().__init__([FakeResult(FakeBoxes(np.empty((0, 4)), [], []))])
+        self.sources = []
+
+    def predict(self, source, verbose=False):
+        self.sources.append(source)
+        return super().predict(source, verbose)
+
+
+class TestLazyLoading:
+    def test_model_is_not_loaded_until_needed(self, monkeypatch):
+        detector = YOLODetector(model_path="best.pt")
+        loads = []
+        monkeypatch.setattr(detector, "_load_model", lambda: loads.append(1) or CountingYOLO())
+        assert not detector.loaded and loads == []
+        detector.detect(np.zeros((32, 32, 3), dtype=np.uint8))
+        detector.detect(np.zeros((32, 32, 3), dtype=np.uint8))
+        assert detector.loaded and loads == [1]
+        # Isıtma (sahte frame) + iki gerçek frame
+        assert [s.shape for s in detector.model.sources] == [(640, 640, 3), (32, 32, 3), (32, 32, 3)]
+
+    def test_explicit_warmup_runs_once(self, monkeypatch):
+        detector = YOLODetector(model_path="best.pt", warmup_on_load=False)
+        monkeypatch.setattr(detector, "_load_model", CountingYOLO)
+        detector.warmup(imgsz=64).warmup()
+        assert [s.shape for s in detector.model.sources] == [(64, 64, 3)]
+
+    def test_without_model_path_nothing_is_loaded(self):
+        detector = YOLODetector()
+        assert detector.loaded and detector.model is None
+
+
+class TestBatchedRipeness:
+    def test_matches_per_box_classifier(self):
+        rng = np.random.default_rng(0)
+        frame = rng.integers(0, 256, (90, 120, 3), dtype=np.uint8)
+        frame[10:50, 10:60, 2] = 200
+        frame[50:80, 60:110, 2] = 125
+        # Negatif başlangıç/bitiş, frame dışı, sıfır ve negatif boyutlu kutular dahil
+        bboxes = np.concatenate([
+            rng.integers(-140, 140, (400, 2)),
+            rng.integers(-60, 120, (400, 2)),
+        ], axis=1)
+        bboxes[:4] = [[10, 10, 50, 40], [60, 50, 50, 30], [-5, -5, 0, 10], [200, 10, 5, 5]]
+        expected = [RIPENESS_CODES[classify_ripeness(frame, tuple(b))] for b in bboxes.tolist()]
+        assert classify_ripeness_batch(frame, bboxes).tolist() == expected
+
+    def test_direct_sum_path_for_few_boxes(self):
+        frame = np.zeros((200, 200, 3), dtype=np.uint8)
+        frame[:50, :50, 2] = 151
+        frame[100:, 100:, 2] = 101
+        bboxes = np.array([[0, 0, 50, 50], [100, 100, 50, 50], [150, 0, 20, 20], [-10, -10, 5, 5]])
+        expected = [RIPENESS_CODES[classify_ripeness(frame, tuple(b))] for b in bboxes.tolist()]
+        assert classify_ripeness_batch(frame, bboxes).tolist() == expected
+
+    def test_numpy_integral_image_matches_cv2(self, monkeypatch):
+        channel = np.random.default_rng(1).integers(0, 256, (37, 53), dtype=np.uint8)
+        expected = integral_image(channel)
+        monkeypatch.setattr(detectors_module, "cv2", None)
+        table = integral_image(channel)
+        assert table.dtype == np.int64
+        assert np.array_equal(table, expected)
+        assert table[-1, -1] == channel.sum()
+
+    def test_grayscale_and_empty_input(self):
+        gray = np.full((20, 20), 255, dtype=np.uint8)
+        unripe = RIPENESS_CODES[classify_ripeness(gray, (0, 0, 5, 5))]
+        assert classify_ripeness_batch(gray, np.array([[0, 0, 5, 5]])).tolist() == [unripe]
+        assert classify_ripeness_batch(np.zeros((5, 5, 3), np.uint8), np.zeros((0, 4))).shape == (0,)
@@ -0,0 +1,143 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from strawberry_vision.infrastructure.box_ops import weighted_box_fusion
+from strawberry_vision.infrastructure.ensemble import EnsembleDetector
+
+
+def arrays(boxes, scores, class_ids):
+    return (
+        np.asarray(boxes, dtype=np.float32).reshape(-1, 4),
+        np.asarray(scores, dtype=np.float32),
+        np.asarray(class_ids, dtype=np.int64),
+    )
+
+
+class TestWeightedBoxFusion:
+    def test_agreeing_models_are_averaged(self):
+        a = arrays([[0, 0, 10, 10]], [0.8], [0])
+        b = arrays([[1, 1, 11, 11]], [0.8], [0])
+        boxes, scores, class_ids = weighted_box_fusion([a, b], iou_threshold=0.5)
+        assert boxes.tolist() == [[0.5, 0.5, 10.5, 10.5]]
+        assert scores[0] == pytest.approx(0.8)
+        assert class_ids.tolist() == [0]
+
+    def test_model_weights_pull_coordinates_and_scale_score(self):
+        a = arrays([[0, 0, 10, 10]], [0.5], [0])
+        b = arrays([[1, 1, 11, 11]], [0.5], [0])
+        boxes, scores, _ = weighted_box_fusion([a, b], weights=[1, 3], iou_threshold=0.5)
+        assert boxes[0].tolist() == pytest.approx([0.75, 0.75, 10.75, 10.75])
+        # Tek modelin gördüğü kutu ağırlığı oranında cezalandırılır
+        _, lonely, _ = weighted_box_fusion([a, arrays([], [], [])], weights=[1, 3])
+        assert lonely[0] == pytest.approx(0.5 * 1 / 4)
+
+    def test_classes_and_distant_boxes_stay_separate(self):
+        a = arrays([[0, 0, 10, 10], [50, 50, 60, 60]], [0.9, 0.7], [0, 0])
+        b = arrays([[0, 0, 10, 10]], [0.9], [1])
+        boxes, scores, class_ids = weighted_box_fusion([a, b])
+        assert len(boxes) == 3
+        assert sorted(class_ids.tolist()) == [0, 0, 1]
+
+    def test_skip_threshold_and_empty(self):
+        a = arrays([[0, 0, 10, 10]], [0.01], [0])
+        assert len(weighted_box_fusion([a], skip_threshold=0.05)[0]) == 0
+        assert len(weighted_box_fusion([])[0]) == 0
+
+    def test_scales_to_hundreds_of_boxes(self):
+        rng = np.random.default_rng(0)
+        xy = rng.uniform(0, 4000, (400, 2)).astype(np.float32)
+        base = np.hstack([xy, xy + 20])
+        parts = [
+            arrays(base + rng.normal(0, 1, base.shape), rng.uniform(0.3, 1.0, 400), rng.integers(0, 3, 400))
+            for _ in range(3)
+        ]
+        start = time.perf_counter()
+        boxes, _, _ = weighted_box_fusion(parts)
+        assert time.perf_counter() - start < 1.0
+        assert 400 <= len(boxes) <= 1200
+
+
+class FakeDetector:
+    def __init__(self, output, delay=0.0):
+        self.output = output
+        self.delay = delay
+        self.model = object()
+        self.class_names = ["Grasserie", "Healthy"]
+        self.threads = set()
+
+    def detect_arrays_batch(self, frames):
+        self.threads.add(threading.current_thread().name)
+        time.sleep(self.delay)
+        return [self.output for _ in frames]
+
+    def warmup(self, imgsz=None):
+        return self
+
+
+class TestEnsembleDetector:
+    def test_detect_fuses_models(self):
+        small = FakeDetector(arrays([[0, 0, 10, 10]], [0.6], [1]))
+        large = FakeDetector(arrays([[1, 1, 11, 11]], [0.9], [1]))
+        ensemble = EnsembleDetector([small, large], weights=[1, 2])
+        [det] = ensemble.detect(np.zeros((20, 20, 3), dtype=np.uint8))
+        assert det.label == "Healthy"
+        assert det.score == pytest.approx((0.6 + 1.8) / 3, rel=1e-5)
+        ensemble.close()
+
+    def test_models_run_in_parallel(self):
+        detectors = [FakeDetector(arrays([], [], []), delay=0.05) for _ in range(3)]
+        ensemble = EnsembleDetector(detectors)
+        start = time.perf_counter()
+        ensemble.detect_batch([np.zeros((8, 8, 3), dtype=np.uint8)] * 2)
+        assert time.perf_counter() - start < 0.12
+        assert all(name.startswith("sv-ensemble") for d in detectors for name in d.threads)
+        ensemble.close()
+
+    def test_from_config_reads_weights(self):
+        created = []
+
+        def acquire(path, backend="ultralytics", **options):
+            created.append((path, backend))
+            return FakeDetector(arrays([], [], []))
+
+        config = {
+            "ensemble": {
+                "iou_threshold": 0.6,
+                "models": [{"path": "n.pt", "weight": 1.0}, {"path": "m.onnx", "backend": "onnx", "weight": 2.5}],
+            }
+        }
+        ensemble = EnsembleDetector.from_config(config, acquire=acquire)
+        assert created == [("n.pt", "ultralytics"), ("m.onnx", "onnx")]
+        assert ensemble.weights == [1.0, 2.5]
+        assert ensemble.iou_threshold == 0.6
+        ensemble.close()
+
+    def test_set_imgsz_applies_to_every_model_or_none(self):
+        class ResizableDetector(FakeDetector):
+            def __init__(self, sizes):
+                super().__init__(arrays([], [], []))
+                self.sizes = sizes
+                self.imgsz = 640
+
+            def set_imgsz(self, imgsz):
+                if imgsz not in self.sizes:
+                    return False
+                self.imgsz = imgsz
+                return True
+
+        flexible, fixed = ResizableDetector({320, 640}), ResizableDetector({640})
+        ensemble = EnsembleDetector([flexible, ResizableDetector({320, 640})], parallel=False)
+        assert ensemble.set_imgsz(320)
+        assert ensemble.imgsz == 320
+        assert [d.imgsz for d in ensemble.detectors] == [320, 320]
+
+        mixed = EnsembleDetector([ResizableDetector({320, 640}), fixed], parallel=False)
+        assert not mixed.set_imgsz(320)
+        assert [d.imgsz for d in mixed.detectors] == [640, 640]
+
+    def test_weight_count_must_match(self):
+        with pytest.raises(ValueError):
+            EnsembleDetector([FakeDetector(arrays([], [], []))], weights=[1, 2])
@@ -0,0 +1,71 @@
+from urllib.request import urlopen
+
+import numpy as np
+
+from strawberry_vision.application.pipeline import InferencePipeline
+from strawberry_vision.domain.entities import Detection
+from strawberry_vision.infrastructure.metrics_exporter import PrometheusExporter
+from strawberry_vision.infrastructure.model_registry import ModelRegistry
+
+
+class FakeDetector:
+    def detect(self, frame):
+        return [
+            Detection(bbox=(0, 0, 10, 10), score=0.9, label="Grasserie"),
+            Detection(bbox=(20, 20, 10, 10), score=0.8, label="Healthy"),
+            Detection(bbox=(40, 40, 10, 10), score=0.8, label="Healthy"),
+        ]
+
+
+def run_pipeline(frames=3):
+    pipeline = InferencePipeline(detector=FakeDetector(), enable_logging=False)
+    for _ in range(frames):
+        pipeline.run(np.zeros((64, 64, 3), dtype=np.uint8))
+    pipeline.record_dropped(2)
+    return pipeline
+
+
+class TestPrometheusExporter:
+    def test_render(self):
+        text = PrometheusExporter(run_pipeline()).render()
+
+        assert "# TYPE strawberry_vision_frames_processed_total counter" in text
+        assert "strawberry_vision_frames_processed_total 3" in text
+        assert "strawberry_vision_frames_dropped_total 2" in text
+        assert 'strawberry_vision_detections_total{class="Healthy"} 6' in text
+        assert 'strawberry_vision_stage_latency_seconds_bucket{stage="detect",le="+Inf"} 3' in text
+        assert 'strawberry_vision_stage_latency_seconds_count{stage="visualize"} 3' in text
+        assert 'strawberry_vision_window_frames{window="minute"} 3' in text
+        assert 'strawberry_vision_window_detections{window="hour",ripeness="unripe"} 9' in text
+
+    def test_histogram_buckets_are_cumulative(self):
+        text = PrometheusExporter(run_pipeline()).render()
+        counts = [
+            int(line.rsplit(" ", 1)[1])
+            for line in text.splitlines()
+            if line.startswith('strawberry_vision_stage_latency_seconds_bucket{stage="detect"')
+        ]
+        assert counts == sorted(counts)
+        assert counts[-1] == 3
+
+    def test_stream_labels(self):
+        text = PrometheusExporter({"cam1": run_pipeline(1), "cam2": run_pipeline(2)}).render()
+
+        assert 'strawberry_vision_frames_processed_total{stream="cam1"} 1' in text
+        assert 'strawberry_vision_frames_processed_total{stream="cam2"} 2' in text
+        assert text.count("# TYPE strawberry_vision_fps gauge") == 1
+
+    def test_http_endpoint(self):
+        with PrometheusExporter(run_pipeline(), port=0) as exporter:
+            body = urlopen(f"http://127.0.0.1:{exporter.port}/metrics", timeout=5).read().decode()
+
+        assert "strawberry_vision_frames_processed_total 3" in body
+
+
+def test_model_memory_from_registry():
+    registry = ModelRegistry()
+    handle = registry.acquire()
+    text = PrometheusExporter(run_pipeline(1), registry=registry).render()
+    assert 'strawberry_vision_model_refs{model="dummy",backend="ultralytics"} 1' in text
+    assert 'strawberry_vision_model_memory_bytes{model="dummy",backend="ultralytics"} 0' in text
+    handle.release()
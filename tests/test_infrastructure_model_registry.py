@@ -0,0 +1,176 @@
+import threading
+import time
+
+import numpy as np
+
+from strawberry_vision.application.pipeline import InferencePipeline
+from strawberry_vision.infrastructure.model_registry import ModelRegistry, estimate_model_bytes, get_registry
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class SlowDetector:
+    """Eşzamanlı çağrıları kaydeden sahte detector."""
+
+    def __init__(self, model_path=None, backend="ultralytics", **options):
+        self.model_path = model_path
+        self.backend = backend
+        self.model = None
+        self.loaded = True
+        self.active = 0
+        self.max_active = 0
+
+    def detect(self, frame):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        time.sleep(0.005)
+        self.active -= 1
+        return []
+
+
+def make_registry(**kwargs):
+    created = []
+
+    def factory(**options):
+        created.append(options)
+        return SlowDetector(**options)
+
+    return ModelRegistry(factory=factory, **kwargs), created
+
+
+class TestModelRegistry:
+    def test_same_model_is_shared(self, tmp_path):
+        path = tmp_path / "best.pt"
+        path.write_bytes(b"weights")
+        registry, created = make_registry()
+        a = registry.acquire(str(path))
+        b = registry.acquire(str(tmp_path / "." / "best.pt"))
+        assert a.detector is b.detector
+        assert len(created) == 1
+        assert registry.memory_report()[0]["refs"] == 2
+
+    def test_changed_file_gets_new_model(self, tmp_path):
+        path = tmp_path / "best.pt"
+        path.write_bytes(b"v1")
+        registry, created = make_registry()
+        first = registry.acquire(str(path))
+        path.write_bytes(b"v2-longer")
+        second = registry.acquire(str(path))
+        assert first.detector is not second.detector
+        assert first.key[2] != second.key[2]
+        assert registry.acquire(str(path), backend="onnx").key != second.key
+
+    def test_idle_models_are_evicted_after_release(self):
+        clock = FakeClock()
+        registry, created = make_registry(idle_timeout=10.0, clock=clock)
+        handle = registry.acquire()
+        clock.now = 100.0
+        assert registry.evict_idle() == []  # hâlâ referanslı
+        handle.release()
+        handle.release()  # ikinci çağrı etkisiz
+        assert registry.memory_report()[0]["refs"] == 0
+        clock.now = 105.0
+        assert registry.evict_idle() == []
+        clock.now = 111.0
+        assert len(registry.evict_idle()) == 1
+        assert len(registry) == 0
+        registry.acquire()
+        assert len(created) == 2
+
+    def test_released_handle_cannot_be_used(self):
+        registry, _ = make_registry()
+        with registry.acquire() as handle:
+            pass
+        try:
+            handle.detect(None)
+        except RuntimeError:
+            pass
+        else:
+            raise AssertionError("released handle should raise")
+
+    def test_inference_is_serialized_across_handles(self):
+        registry, _ = make_registry()
+        handles = [registry.acquire() for _ in range(4)]
+        threads = [threading.Thread(target=lambda h=h: [h.detect(None) for _ in range(5)]) for h in handles]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert handles[0].detector.max_active == 1
+
+    def test_imgsz_is_per_handle(self):
+        class ResizableDetector(SlowDetector):
+            imgsz = None
+
+            def set_imgsz(self, imgsz):
+                if imgsz == 999:
+                    return False
+                self.imgsz = imgsz
+                return True
+
+            def detect(self, frame):
+                return self.imgsz
+
+        registry = ModelRegistry(factory=lambda **options: ResizableDetector(**options))
+        a, b = registry.acquire(), registry.acquire()
+        assert a.set_imgsz(320)
+        assert not b.set_imgsz(999)
+        assert (a.imgsz, b.imgsz) == (320, None)
+        # Her çağrı kendi tutamacının boyutuyla çalışır
+        assert [a.detect(None), b.detect(None), a.detect(None)] == [320, None, 320]
+        assert b.set_imgsz(640)
+        assert [b.detect(None), a.detect(None)] == [640, 320]
+
+
+class TestMemoryEstimate:
+    def test_onnx_style_model(self, tmp_path):
+        path = tmp_path / "m.onnx"
+        path.write_bytes(b"x" * 100)
+
+        class OnnxLike:
+            model_path = str(path)
+            _input = np.zeros((1, 3, 8, 8), dtype=np.float32)
+            _canvas = np.zeros((8, 8, 3), dtype=np.uint8)
+
+        assert estimate_model_bytes(OnnxLike()) == 100 + 768 + 192
+
+    def test_torch_style_model(self):
+        class Tensor:
+            def __init__(self, n):
+                self.n = n
+
+            def numel(self):
+                return self.n
+
+            def element_size(self):
+                return 4
+
+        class Module:
+            def parameters(self):
+                return [Tensor(10), Tensor(5)]
+
+            def buffers(self):
+                return [Tensor(1)]
+
+        class Wrapper:
+            model = Module()
+
+        assert estimate_model_bytes(Wrapper()) == 64
+        assert estimate_model_bytes(None) == 0
+
+
+def test_default_pipelines_share_one_detector():
+    first, second = InferencePipeline(enable_logging=False), InferencePipeline(enable_logging=False)
+    assert first.detector.detector is second.detector.detector
+    key = first.detector.key
+    refs = lambda: next(r["refs"] for r in get_registry().memory_report() if r["model_path"] == key[0] and r["backend"] == key[1])
+    before = refs()
+    first.close()
+    assert refs() == before - 1
+    second.close()
@@ -0,0 +1,36 @@
+import numpy as np
+
+from strawberry_vision.infrastructure.motion import MotionGate
+
+
+def make_frame(value=0):
+    return np.full((120, 160, 3), value, dtype=np.uint8)
+
+
+class TestMotionGate:
+    def test_first_frame_is_processed(self):
+        gate = MotionGate()
+        assert gate.should_process(make_frame()) is True
+
+    def test_unchanged_frame_is_skipped(self):
+        gate = MotionGate()
+        gate.should_process(make_frame())
+        assert gate.should_process(make_frame()) is False
+
+    def test_changed_region_is_processed(self):
+        gate = MotionGate(downscale_width=160)
+        gate.should_process(make_frame())
+        frame = make_frame()
+        frame[10:30, 10:30] = 255
+        assert gate.should_process(frame) is True
+
+    def test_forced_refresh(self):
+        gate = MotionGate(refresh_interval=3)
+        flags = [gate.should_process(make_frame()) for _ in range(7)]
+        assert flags == [True, False, False, True, False, False, True]
+
+    def test_compares_with_last_processed_frame(self):
+        # Yavaş kayma: ardışık frame'ler benzer olsa da işlenen referanstan uzaklaşınca tetiklenir
+        gate = MotionGate(pixel_threshold=15, refresh_interval=0)
+        flags = [gate.should_process(make_frame(v)) for v in (0, 10, 20)]
+        assert flags == [True, False, True]
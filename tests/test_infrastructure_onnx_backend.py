@@ -0,0 +1,208 @@
+import os
+
+import numpy as np
+import pytest
+
+from strawberry_vision.infrastructure.box_ops import box_iou, nms
+from strawberry_vision.infrastructure.detectors import YOLODetector
+
+pytest.importorskip("cv2")
+
+
+class FakeInput:
+    name = "images"
+    shape = [1, 3, 64, 64]
+
+
+class FakeOutput:
+    name = "output0"
+
+
+class FakeSession:
+    """session.run ile sabit çıktı döndüren sahte ONNX session (IOBinding yok)."""
+
+    def __init__(self, output):
+        self.output = output
+        self.inputs = []
+
+    def get_inputs(self):
+        return [FakeInput()]
+
+    def get_outputs(self):
+        return [FakeOutput()]
+
+    def run(self, names, feeds):
+        self.inputs.append(feeds["images"].copy())
+        return [self.output]
+
+
+def raw_output(rows):
+    """(cx, cy, w, h, s0, s1) satırlarından (1, 6, N) ham YOLO çıktısı üretir."""
+    return np.asarray(rows, dtype=np.float32).T[None]
+
+
+def build_onnx_model(path):
+    """Sınıf-0 skoru giriş ortalaması olan tek anchor'lı küçük bir ONNX modeli."""
+    onnx = pytest.importorskip("onnx")
+    from onnx import TensorProto, helper
+
+    base = helper.make_tensor("base", TensorProto.FLOAT, [1, 6, 1], [32, 32, 20, 20, 0, 0.1])
+    mask = helper.make_tensor("mask", TensorProto.FLOAT, [1, 6, 1], [0, 0, 0, 0, 1, 0])
+    shape = helper.make_tensor("shape", TensorProto.INT64, [3], [1, 1, 1])
+    nodes = [
+        helper.make_node("ReduceMean", ["images"], ["mean4"], axes=[0, 1, 2, 3], keepdims=1),
+        helper.make_node("Reshape", ["mean4", "shape"], ["mean"]),
+        helper.make_node("Mul", ["mask", "mean"], ["scaled"]),
+        helper.make_node("Add", ["base", "scaled"], ["output0"]),
+    ]
+    graph = helper.make_graph(
+        nodes,
+        "tiny_yolo",
+        [helper.make_tensor_value_info("images", TensorProto.FLOAT, [1, 3, 64, 64])],
+        [helper.make_tensor_value_info("output0", TensorProto.FLOAT, [1, 6, 1])],
+        initializer=[base, mask, shape],
+    )
+    model = helper.make_model(graph, opset_imports=[helper.make_opsetid("", 13)])
+    model.ir_version = 8
+    onnx.save(model, str(path))
+    return str(path)
+
+
+class TestBoxOps:
+    def test_box_iou(self):
+        a = np.array([[0, 0, 10, 10]], dtype=np.float32)
+        b = np.array([[0, 0, 10, 10], [5, 0, 15, 10], [20, 20, 30, 30]], dtype=np.float32)
+        assert box_iou(a, b)[0] == pytest.approx([1.0, 1 / 3, 0.0])
+
+    def test_nms_is_class_aware(self):
+        boxes = np.array([[0, 0, 10, 10], [1, 1, 10, 10], [0, 0, 10, 10]], dtype=np.float32)
+        scores = np.array([0.9, 0.8, 0.7], dtype=np.float32)
+        class_ids = np.array([0, 0, 1])
+
+        assert nms(boxes, scores, 0.5).tolist() == [0]
+        assert nms(boxes, scores, 0.5, class_ids=class_ids).tolist() == [0, 2]
+
+
+class TestOnnxBackend:
+    def make_backend(self, output, **kwargs):
+        from strawberry_vision.infrastructure.onnx_backend import OnnxBackend
+
+        return OnnxBackend("fake.onnx", session=FakeSession(output), **kwargs)
+
+    def test_letterbox_preserves_aspect_ratio(self):
+        backend = self.make_backend(raw_output([[0, 0, 0, 0, 0, 0]]))
+        frame = np.full((32, 64, 3), 255, dtype=np.uint8)
+
+        ratio, pad = backend.letterbox(frame)
+
+        assert ratio == 1.0
+        assert pad == (0, 16)
+        assert backend._input[0, :, 16:48].min() == pytest.approx(1.0)
+        assert backend._input[0, :, :16].max() == pytest.approx(114 / 255)
+
+    def test_decode_raw_output_maps_to_frame(self):
+        output = raw_output([
+            [32, 32, 20, 20, 0.9, 0.1],   # 0. sınıf
+            [33, 33, 20, 20, 0.8, 0.05],  # ilkiyle örtüşüyor → NMS ile elenir
+            [10, 10, 8, 8, 0.1, 0.6],     # 1. sınıf
+            [50, 50, 8, 8, 0.1, 0.1],     # eşik altı
+        ])
+        backend = self.make_backend(output, conf_threshold=0.25)
+
+        boxes, scores, class_ids = backend.predict(np.zeros((128, 128, 3), dtype=np.uint8))
+
+        assert class_ids.tolist() == [0, 1]
+        assert scores == pytest.approx([0.9, 0.6])
+        # 128 → 64 ölçekleme: koordinatlar 2 ile çarpılır
+        assert boxes[0] == pytest.approx([44, 44, 84, 84])
+
+    def test_decode_end_to_end_output(self):
+        output = np.array([[[4, 4, 20, 20, 0.95, 1], [0, 0, 5, 5, 0.1, 0]]], dtype=np.float32)
+        backend = self.make_backend(output)
+
+        boxes, scores, class_ids = backend.predict(np.zeros((64, 64, 3), dtype=np.uint8))
+
+        assert class_ids.tolist() == [1]
+        assert boxes[0] == pytest.approx([4, 4, 20, 20])
+
+    def test_real_session_reuses_bound_input(self, tmp_path):
+        pytest.importorskip("onnxruntime")
+        from strawberry_vision.infrastructure.onnx_backend import OnnxBackend
+
+        backend = OnnxBackend(build_onnx_model(tmp_path / "tiny.onnx"), conf_threshold=0.5)
+
+        white = backend.predict(np.full((64, 64, 3), 255, dtype=np.uint8))
+        black = backend.predict(np.zeros((64, 64, 3), dtype=np.uint8))
+
+        assert white[2].tolist() == [0]
+        assert white[1] == pytest.approx([1.0])
+        assert len(black[0]) == 0
+
+
+class TestYOLODetectorOnnx:
+    def test_detector_uses_class_names(self, tmp_path):
+        pytest.importorskip("onnxruntime")
+        detector = YOLODetector(model_path=build_onnx_model(tmp_path / "tiny.onnx"), backend="onnx")
+
+        detections = detector.detect(np.full((64, 64, 3), 255, dtype=np.uint8))
+
+        assert len(detections) == 1
+        assert detections[0].label == detector.class_names[0]
+        assert detections[0].bbox == (22, 22, 20, 20)
+
+    def test_missing_model_falls_back_to_dummy(self):
+        detector = YOLODetector(model_path="does-not-exist.onnx", backend="onnx")
+        assert detector.detect(np.zeros((8, 8, 3), dtype=np.uint8)) == []
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            YOLODetector(backend="tensorrt")
+
+
+@pytest.mark.skipif(not os.environ.get("SV_PARITY_MODEL"), reason="SV_PARITY_MODEL (.pt) not set")
+def test_parity_with_ultralytics(tmp_path):
+    """ONNX backend ile ultralytics yolu aynı görüntüde aynı tespitleri üretmeli.
+
+    SV_PARITY_MODEL eğitilmiş .pt dosyasını, SV_PARITY_IMAGE (opsiyonel) test görüntüsünü gösterir.
+    """
+    cv2 = pytest.importorskip("cv2")
+    ultralytics = pytest.importorskip("ultralytics")
+    pytest.importorskip("onnxruntime")
+
+    pt_path = os.environ["SV_PARITY_MODEL"]
+    onnx_path = ultralytics.YOLO(pt_path).export(format="onnx")
+    image_path = os.environ.get("SV_PARITY_IMAGE")
+    frame = cv2.imread(image_path) if image_path else np.random.default_rng(0).integers(0, 255, (480, 640, 3), dtype=np.uint8)
+
+    reference = YOLODetector(model_path=pt_path).detect(frame.copy())
+    candidate = YOLODetector(model_path=onnx_path, backend="onnx").detect(frame.copy())
+
+    assert len(candidate) == len(reference)
+    to_xyxy = lambda d: [d.bbox[0], d.bbox[1], d.bbox[0] + d.bbox[2], d.bbox[1] + d.bbox[3]]  # noqa: E731
+    if reference:
+        ious = box_iou(
+            np.array([to_xyxy(d) for d in reference], dtype=np.float32),
+            np.array([to_xyxy(d) for d in candidate], dtype=np.float32),
+        )
+        match = ious.argmax(axis=1)
+        assert (ious.max(axis=1) > 0.9).all()
+        assert [d.label for d in reference] == [candidate[j].label for j in match]
+        assert [d.score for d in reference] == pytest.approx([candidate[j].score for j in match], abs=0.02)
+
+
+class TestInt8Backend:
+    def test_int8_model_path(self):
+        from strawberry_vision.infrastructure.detectors import int8_model_path
+
+        assert int8_model_path("runs/best.pt") == "runs/best.int8.onnx"
+        assert int8_model_path("runs/best.onnx") == "runs/best.int8.onnx"
+        assert int8_model_path("runs/best.int8.onnx") == "runs/best.int8.onnx"
+
+    def test_detector_loads_int8_sibling(self, tmp_path):
+        pytest.importorskip("onnxruntime")
+        build_onnx_model(tmp_path / "best.int8.onnx")
+
+        detector = YOLODetector(model_path=str(tmp_path / "best.pt"), backend="onnx-int8")
+
+        assert detector.model is not None
+        assert detector.model.model_path.endswith("best.int8.onnx")
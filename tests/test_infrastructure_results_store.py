@@ -0,0 +1,122 @@
+import sqlite3
+import time
+
+import numpy as np
+
+from strawberry_vision.application.pipeline import PipelineResult
+from strawberry_vision.domain.batch import DetectionBatch
+from strawberry_vision.domain.zones import CountingLine, CountingZone
+from strawberry_vision.infrastructure.results_store import SqliteResultsSink
+
+
+def make_batch(classes, x=0):
+    n = len(classes)
+    return DetectionBatch(
+        bboxes=np.array([[x + 30 * i, 10, 20, 20] for i in range(n)], dtype=np.int64).reshape(-1, 4),
+        scores=np.full(n, 0.9),
+        class_ids=np.array(classes, dtype=np.int64),
+        class_names=("Healthy", "Grasserie"),
+        ripeness=np.zeros(n, dtype=np.int8),
+        track_ids=np.arange(1, n + 1, dtype=np.int64),
+    )
+
+
+def result(frame=1):
+    return PipelineResult(counts={}, frame_processed=frame, processing_time=0.01)
+
+
+def test_writes_frames_and_detections_in_wal_mode(tmp_path):
+    path = tmp_path / "runs" / "results.db"
+    with SqliteResultsSink(path, batch_size=2) as sink:
+        assert sink.submit("cam0", result(1), make_batch([0, 1]), timestamp=100.0)
+        assert sink.submit("cam0", result(2), DetectionBatch.empty(), timestamp=101.0)
+        sink.flush()
+        assert sink.written == 2
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+    assert conn.execute("SELECT frame, total, tracked FROM frames ORDER BY id").fetchall() == [(1, 2, 2), (2, 0, 0)]
+    rows = conn.execute("SELECT camera, class, ripeness, track_id, x FROM detections ORDER BY x").fetchall()
+    assert rows == [("cam0", "Healthy", "ripe", 1, 0), ("cam0", "Grasserie", "ripe", 2, 30)]
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert {"idx_detections_camera_ts", "idx_detections_class_ts", "idx_frames_camera_ts"} <= indexes
+    conn.close()
+
+
+def test_flush_interval_writes_partial_batch(tmp_path):
+    with SqliteResultsSink(tmp_path / "results.db", batch_size=100, flush_interval=0.05) as sink:
+        sink.submit("cam0", result(), make_batch([0]))
+        deadline = time.monotonic() + 2.0
+        while sink.written == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert sink.written == 1
+
+
+def test_full_queue_drops_instead_of_blocking(tmp_path):
+    sink = SqliteResultsSink(tmp_path / "results.db", queue_size=1, flush_interval=5.0)
+    batch = make_batch([0])
+    start = time.perf_counter()
+    accepted = [sink.submit("cam0", result(i), batch) for i in range(200)]
+    assert time.perf_counter() - start < 0.5
+    sink.close()
+    assert sink.dropped == accepted.count(False)
+    assert sink.written == accepted.count(True)
+
+
+def test_bad_frame_is_counted_and_writer_survives(tmp_path):
+    path = tmp_path / "results.db"
+    with SqliteResultsSink(path, batch_size=3) as sink:
+        sink.submit("cam0", result(1), make_batch([0]))
+        sink.submit("cam0", result(2), make_batch([5]))  # class_names'te olmayan sınıf
+        sink.submit("cam0", result(3), make_batch([1]))
+        sink.flush()
+        sink.submit("cam0", result(4), make_batch([0]))
+        sink.flush()
+        assert sink.failed == 1
+        assert sink.written == 3
+
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT id, frame FROM frames ORDER BY id").fetchall() == [(1, 1), (2, 3), (3, 4)]
+    conn.close()
+
+
+def test_reopen_continues_frame_ids(tmp_path):
+    path = tmp_path / "results.db"
+    for frame in (1, 2):
+        with SqliteResultsSink(path) as sink:
+            sink.submit("cam0", result(frame), make_batch([0]), timestamp=float(frame))
+    with SqliteResultsSink(path) as sink:
+        frames = sink.frames()
+        assert [row["id"] for row in frames] == [2, 1]
+        assert sink.query("SELECT frame_id FROM detections ORDER BY frame_id") == [{"frame_id": 1}, {"frame_id": 2}]
+
+
+def test_prevalence_per_tray_and_hour(tmp_path):
+    trays = {
+        "cam0": [
+            CountingZone("tray_a", [(0, 0), (50, 0), (50, 50), (0, 50)]),
+            CountingLine("gate", (0, 0), (10, 10)),
+        ]
+    }
+    with SqliteResultsSink(tmp_path / "results.db", trays=trays) as sink:
+        # x=0 → merkezler 10 ve 40 (tray_a), x=100 → tepsi dışı
+        sink.submit("cam0", result(1), make_batch([1, 0]), timestamp=3600.0 + 10)
+        sink.submit("cam0", result(2), make_batch([1, 1]), timestamp=7200.0 + 10)
+        sink.submit("cam0", result(3), make_batch([1], x=100), timestamp=7200.0 + 20)
+        sink.submit("cam1", result(1), make_batch([0]), timestamp=3600.0 + 10)
+        sink.flush()
+
+        rows = sink.prevalence("Grasserie", camera="cam0")
+        assert [(r["tray"], r["bucket_start"], r["count"], r["total"]) for r in rows] == [
+            (None, 7200, 1, 1),
+            ("tray_a", 3600, 1, 2),
+            ("tray_a", 7200, 2, 2),
+        ]
+        assert rows[1]["prevalence"] == 0.5
+
+        recent = sink.prevalence("Grasserie", since=7200.0, until=7215.0)
+        assert [(r["camera"], r["tray"], r["count"]) for r in recent] == [("cam0", "tray_a", 2)]
+        unique = sink.prevalence("Grasserie", bucket=86400, camera="cam0", unique=True)
+        assert [(r["tray"], r["count"], r["total"]) for r in unique] == [(None, 1, 1), ("tray_a", 2, 2)]
+        assert sink.class_counts() == {"Grasserie": 4, "Healthy": 2}
+        assert sink.class_counts(camera="cam1") == {"Healthy": 1}
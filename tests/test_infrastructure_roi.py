@@ -0,0 +1,122 @@
+import numpy as np
+import pytest
+
+from strawberry_vision.application.multistream import MultiStreamOrchestrator
+from strawberry_vision.infrastructure import roi as roi_module
+from strawberry_vision.infrastructure.detectors import YOLODetector
+from strawberry_vision.infrastructure.roi import (
+    RoiDetector,
+    load_roi_config,
+    polygon_mask,
+    polygon_rects,
+    rois_for,
+)
+
+
+class BlobDetector(YOLODetector):
+    """Kırpıntıdaki her parlak sütun grubunu ayrı kutu olarak döndürür."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def detect_arrays_batch(self, frames):
+        self.calls.append([crop.shape[:2] for crop in frames])
+        outputs = []
+        for crop in frames:
+            ys, xs = np.nonzero(crop[:, :, 0])
+            if len(xs) == 0:
+                outputs.append((np.empty((0, 4), np.float32), np.empty(0, np.float32), np.empty(0, np.int64)))
+                continue
+            box = np.array([[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1]], dtype=np.float32)
+            outputs.append((box, np.array([0.9], np.float32), np.zeros(1, np.int64)))
+        return outputs
+
+
+TRIANGLE = [[0, 0], [100, 0], [0, 100]]
+
+
+class TestGeometry:
+    def test_mask_and_rects(self):
+        mask = polygon_mask([np.array(TRIANGLE)], (120, 150))
+        overlapping = [np.array([[0, 0], [20, 0], [20, 20], [0, 20]]), np.array([[10, 10], [30, 10], [30, 30], [10, 30]])]
+        assert polygon_mask(overlapping, (40, 40))[15, 15]
+        assert mask[10, 10] and not mask[90, 90] and not mask[10, 140]
+        assert polygon_rects([np.array(TRIANGLE)], (120, 150)).tolist() == [[0, 0, 101, 101]]
+
+    def test_numpy_fallback_matches_cv2(self, monkeypatch):
+        polygons = [np.array([[10, 5], [70, 20], [60, 55], [5, 40]])]
+        expected = polygon_mask(polygons, (64, 80))
+        monkeypatch.setattr(roi_module, "cv2", None)
+        fallback = polygon_mask(polygons, (64, 80))
+        # Kenar piksellerinde küçük farklar olabilir
+        assert (expected != fallback).mean() < 0.05
+
+    def test_rects_are_clipped_and_outside_rois_dropped(self):
+        polygons = [np.array([[-20, -10], [50, -10], [50, 30]]), np.array([[500, 500], [600, 500], [600, 600]])]
+        assert polygon_rects(polygons, (100, 100)).tolist() == [[0, 0, 51, 31]]
+
+    def test_invalid_polygon(self):
+        with pytest.raises(ValueError):
+            RoiDetector(BlobDetector(), [[[0, 0], [1, 1]]])
+        with pytest.raises(ValueError):
+            RoiDetector(BlobDetector(), [])
+
+
+class TestRoiDetector:
+    def test_crops_are_batched_and_mapped_to_frame(self):
+        frame = np.zeros((200, 300, 3), dtype=np.uint8)
+        frame[30:50, 20:40] = 255
+        frame[130:160, 220:250] = 255
+        detector = BlobDetector()
+        roi = RoiDetector(detector, [[[10, 10], [100, 10], [100, 90], [10, 90]], [[200, 100], [290, 100], [290, 190], [200, 190]]])
+        boxes, _, _ = roi.detect_arrays(frame)
+        assert sorted(boxes.tolist()) == [[20, 30, 40, 50], [220, 130, 250, 160]]
+        assert detector.calls == [[(81, 91), (91, 91)]]
+
+    def test_detections_outside_polygon_are_dropped(self):
+        frame = np.zeros((120, 120, 3), dtype=np.uint8)
+        frame[80:95, 80:95] = 255  # çevreleyen dikdörtgende, üçgenin dışında
+        roi = RoiDetector(BlobDetector(), [TRIANGLE])
+        assert roi.detect(frame) == []
+        frame[10:20, 10:20] = 255
+        frame[80:95, 80:95] = 0
+        [det] = roi.detect(frame)
+        assert det.bbox == (10, 10, 10, 10)
+
+    def test_overlapping_rois_are_merged(self):
+        frame = np.zeros((100, 100, 3), dtype=np.uint8)
+        frame[40:50, 40:50] = 255
+        square = [[20, 20], [70, 20], [70, 70], [20, 70]]
+        roi = RoiDetector(BlobDetector(), [square, [[30, 30], [80, 30], [80, 80], [30, 80]]])
+        boxes, _, _ = roi.detect_arrays(frame)
+        assert boxes.tolist() == [[40, 40, 50, 50]]
+
+    def test_imgsz_is_forwarded_to_inner_detector(self):
+        detector = BlobDetector()
+        roi = RoiDetector(detector, [TRIANGLE])
+        assert roi.set_imgsz(320)
+        assert roi.imgsz == detector.imgsz == 320
+
+    def test_layout_is_cached_per_frame_size(self):
+        roi = RoiDetector(BlobDetector(), [TRIANGLE])
+        first = roi.layout((120, 120))
+        assert roi.layout((120, 120)) is first
+        assert roi.layout((240, 240)) is not first
+
+
+def test_config_and_multistream_integration():
+    rois = load_roi_config({"rois": {"0": [TRIANGLE], "default": [[[0, 0], [50, 0], [50, 50], [0, 50]]]}})
+    assert rois_for(rois, 0)[0].tolist() == TRIANGLE
+    assert rois_for(rois, "cam9")[0].shape == (4, 2)
+    assert rois_for({}, "cam9") is None
+
+    frame = np.zeros((120, 120, 3), dtype=np.uint8)
+    frame[10:20, 10:20] = 255
+    frame[108:118, 108:118] = 255  # ROI dikdörtgeni dışında
+    orchestrator = MultiStreamOrchestrator({"0": [frame.copy()], "1": [frame.copy()]}, detector=BlobDetector(), rois={"0": rois["0"]})
+    metrics = orchestrator.run()
+    assert orchestrator.pipeline("0").detector.polygons[0].tolist() == TRIANGLE
+    assert sum(metrics["0"]["detections_by_class"].values()) == 1
+    # ROI tanımı olmayan akış paylaşılan detector'ü doğrudan kullanır
+    assert orchestrator.pipeline("1").detector is orchestrator.detector
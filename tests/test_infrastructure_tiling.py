@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from strawberry_vision.infrastructure.box_ops import box_ios, nms
+from strawberry_vision.infrastructure.detectors import YOLODetector
+from strawberry_vision.infrastructure.tiling import TiledDetector, tile_grid
+
+
+class BlobDetector(YOLODetector):
+    """Karodaki parlak bölgenin kutusunu döndürür; skor görünen alan oranıdır."""
+
+    def __init__(self, object_area):
+        super().__init__()
+        self.object_area = object_area
+        self.calls = []
+
+    def detect_arrays_batch(self, frames):
+        self.calls.append(len(frames))
+        outputs = []
+        for crop in frames:
+            ys, xs = np.nonzero(crop[:, :, 0])
+            if len(xs) == 0:
+                outputs.append((np.empty((0, 4), np.float32), np.empty(0, np.float32), np.empty(0, np.int64)))
+                continue
+            box = np.array([[xs.min(), ys.min(), xs.max() + 1, ys.max() + 1]], dtype=np.float32)
+            score = len(xs) / self.object_area
+            outputs.append((box, np.array([score], np.float32), np.zeros(1, np.int64)))
+        return outputs
+
+
+class TestTileGrid:
+    def test_covers_frame_with_equal_tiles(self):
+        tiles = tile_grid((1000, 1500), tile_size=640, overlap=0.2)
+        assert (tiles[:, 2] - tiles[:, 0] == 640).all()
+        assert (tiles[:, 3] - tiles[:, 1] == 640).all()
+        assert tiles[:, 2].max() == 1500 and tiles[:, 3].max() == 1000
+        assert len(tiles) == 2 * 3
+
+    def test_small_frame_is_single_tile(self):
+        assert tile_grid((100, 200), tile_size=640, overlap=0.2).tolist() == [[0, 0, 200, 100]]
+
+
+class TestTiledDetector:
+    def test_object_on_tile_border_is_merged(self):
+        frame = np.zeros((200, 300, 3), dtype=np.uint8)
+        frame[40:60, 90:130] = 255  # 100-130 aralığı iki karoya da düşer
+        detector = BlobDetector(object_area=20 * 40)
+        tiled = TiledDetector(detector, tile_size=160, overlap=0.4, batch_size=2)
+        boxes, scores, _ = tiled.detect_arrays(frame)
+        assert boxes.tolist() == [[90, 40, 130, 60]]
+        assert scores[0] == pytest.approx(1.0)
+        assert sum(detector.calls) == len(tile_grid((200, 300), 160, 0.4))
+        assert max(detector.calls) <= 2
+
+    def test_detect_returns_frame_coordinates(self):
+        frame = np.zeros((300, 300, 3), dtype=np.uint8)
+        frame[250:270, 250:280] = 255
+        tiled = TiledDetector(BlobDetector(object_area=20 * 30), tile_size=128, overlap=0.25)
+        [det] = tiled.detect(frame)
+        assert det.bbox == (250, 250, 30, 20)
+
+    def test_invalid_overlap(self):
+        with pytest.raises(ValueError):
+            TiledDetector(YOLODetector(), overlap=1.0)
+
+
+def test_ios_suppresses_contained_box():
+    boxes = np.array([[0, 0, 40, 20], [20, 0, 40, 20]], dtype=np.float32)
+    scores = np.array([0.9, 0.5], dtype=np.float32)
+    assert box_ios(boxes[:1], boxes[1:])[0, 0] == pytest.approx(1.0)
+    assert nms(boxes, scores, 0.6).tolist() == [0, 1]
+    assert nms(boxes, scores, 0.6, metric="ios").tolist() == [0]
@@ -0,0 +1,45 @@
+import numpy as np
+
+from strawberry_vision.domain.services import TrackingService
+from strawberry_vision.domain.tracking import TRACK_RECORD_DTYPE
+from strawberry_vision.infrastructure.track_archive import TrackArchive
+
+
+def records(*ids):
+    out = np.zeros(len(ids), dtype=TRACK_RECORD_DTYPE)
+    out["track_id"] = ids
+    return out
+
+
+def test_buffers_until_full(tmp_path):
+    archive = TrackArchive(tmp_path / "tracks.bin", buffer_size=3)
+    archive(records(1, 2))
+    assert archive.written == 0
+    assert TrackArchive.read(archive.path).size == 0
+    archive(records(3))
+    assert archive.written == 3
+    archive(records(4))
+    archive.close()
+    assert TrackArchive.read(archive.path)["track_id"].tolist() == [1, 2, 3, 4]
+
+
+def test_appends_to_existing_file(tmp_path):
+    path = tmp_path / "runs" / "tracks.bin"
+    with TrackArchive(path) as archive:
+        archive(records(1))
+    with TrackArchive(path) as archive:
+        archive(records(2))
+    assert TrackArchive.read(path)["track_id"].tolist() == [1, 2]
+
+
+def test_tracker_spills_finished_tracks(tmp_path):
+    path = tmp_path / "tracks.bin"
+    with TrackArchive(path, buffer_size=2) as archive:
+        tracker = TrackingService(max_age=0, spill=archive)
+        for x in range(0, 500, 100):
+            tracker.update(np.array([[x, 0, 20, 20]]))
+        tracker.flush()
+    saved = TrackArchive.read(path)
+    assert saved["track_id"].tolist() == [1, 2, 3, 4, 5]
+    assert saved["x1"].tolist() == [0, 100, 200, 300, 400]
+    assert (saved["first_frame"] == saved["last_frame"]).all()